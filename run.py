@@ -23,6 +23,7 @@ Run program
 """
 
 import argparse
+import multiprocessing
 import os
 import sys
 
@@ -92,7 +93,12 @@ def override_module(original: str, override: str):
     sys.modules[original] = __import__(override, fromlist=[override])
 
 
+if __name__ == "__mp_main__":
+    # Spawned worker process (multi-process mode), apply same PySide version
+    override_pyside_version(int(os.getenv("PYSIDE_OVERRIDE", "2")))
+
 if __name__ == "__main__":
+    multiprocessing.freeze_support()
     os.chdir(os.path.dirname(os.path.abspath(sys.argv[0])))
 
     # Load command line arguments
@@ -0,0 +1,410 @@
+"""
+Headless performance benchmark
+
+Measure per-call latency percentiles and memory allocation of:
+    calc: hot calculation functions, against generated trace data.
+    module: data module update loop iterations, fed by synthetic or replayed frames.
+    widget: widget timer & paint events, rendered offscreen.
+
+Results are compared with JSON baseline file, exit with code 1 if any
+case is slower than baseline by more than tolerance.
+Baseline is machine specific, create it with --save-baseline.
+
+Usage (from repository root):
+    python tests/benchmark.py
+    python tests/benchmark.py --replay captures/LMU_2026-01-01_12-00-00.tpcap
+    python tests/benchmark.py --only module --duration 30 --save-baseline
+"""
+
+import argparse
+import json
+import os
+import platform
+import sys
+import tempfile
+import tracemalloc
+from math import cos, pi, sin
+from time import perf_counter, sleep
+
+sys.path.append(".")
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+BASELINE_FILE = "tests/benchmark_baseline.json"
+SECTIONS = ("calc", "module", "widget")
+BENCHMARK_MODULES = (
+    "module_mapping",
+    "module_delta",
+    "module_fuel",
+    "module_wheels",
+    "module_vehicles",
+    "module_relative",
+    "module_sectors",
+    "module_force",
+)
+COMPARE_KEYS = ("p50_ms", "p90_ms")
+TRACE_ROWS = 5000
+TRACE_LENGTH = 5000.0
+
+
+def percentile(samples: list, fraction: float) -> float:
+    """Percentile from sorted samples, same method as profiler"""
+    total = len(samples)
+    if not total:
+        return 0.0
+    return samples[min(int(total * fraction), total - 1)]
+
+
+def summarize(samples) -> dict:
+    """Summarize elapsed time samples (seconds) in milliseconds"""
+    samples = sorted(samples)
+    return {
+        "samples": len(samples),
+        "p50_ms": round(percentile(samples, 0.5) * 1000, 4),
+        "p90_ms": round(percentile(samples, 0.9) * 1000, 4),
+        "p99_ms": round(percentile(samples, 0.99) * 1000, 4),
+        "max_ms": round(samples[-1] * 1000, 4) if samples else 0.0,
+    }
+
+
+def time_calls(func, iterations: int) -> list:
+    """Time each call of func (seconds)"""
+    samples = []
+    for _ in range(iterations):
+        start = perf_counter()
+        func()
+        samples.append(perf_counter() - start)
+    return samples
+
+
+def trace_allocation(func, iterations: int) -> dict:
+    """Peak & net memory allocation (KiB) of repeated calls"""
+    tracemalloc.start()
+    current_start, _ = tracemalloc.get_traced_memory()
+    for _ in range(iterations):
+        func()
+    current_end, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {
+        "peak_kib": round((peak - current_start) / 1024, 2),
+        "net_kib": round((current_end - current_start) / 1024, 2),
+    }
+
+
+def file_allocation(snapshot_start, snapshot_end, filename: str) -> dict:
+    """Net memory allocation (KiB) from lines of source file between snapshots"""
+    file_filter = (tracemalloc.Filter(True, f"*{os.sep}{filename}"),)
+    stats = snapshot_end.filter_traces(file_filter).compare_to(
+        snapshot_start.filter_traces(file_filter), "filename")
+    return {
+        "net_kib": round(sum(stat.size_diff for stat in stats) / 1024, 2),
+        "net_blocks": sum(stat.count_diff for stat in stats),
+    }
+
+
+def create_trace(rows: int, length: float) -> tuple:
+    """Create delta trace rows (distance, time)"""
+    step = length / rows
+    return tuple((index * step, index * step / 50 + sin(index / 50) * 0.1) for index in range(rows))
+
+
+def create_flat_trace(rows: int, length: float):
+    """Create flat delta trace array (row by row: distance, time), same as loaded trace file"""
+    from tinypedal import calculation as calc
+
+    return calc.trace_array(create_trace(rows, length))
+
+
+def benchmark_calc(args) -> dict:
+    """Benchmark hot calculation functions"""
+    from tinypedal import calculation as calc
+
+    trace = create_flat_trace(TRACE_ROWS, TRACE_LENGTH)
+    coords = tuple(
+        (cos(index / 1000 * pi) * 1000, sin(index / 1000 * pi) * 800) for index in range(2000))
+    distances = tuple(TRACE_LENGTH * index / 128 for index in range(128))
+    positions = tuple(TRACE_LENGTH * index / 997 for index in range(997))
+    cursor = calc.TraceCursor()
+    state = {"index": 0}
+
+    def next_position():
+        index = state["index"] = (state["index"] + 1) % len(positions)
+        return positions[index]
+
+    def delta_binary():
+        calc.delta_telemetry(trace, next_position(), 10.0)
+
+    def delta_cursor():
+        calc.delta_telemetry(trace, next_position(), 10.0, cursor=cursor)
+
+    def relative_gaps():
+        plr_dist = next_position()
+        for opt_dist in distances:
+            rel_dist = calc.circular_position_relative(TRACE_LENGTH, plr_dist, opt_dist)
+            calc.relative_time_gap(rel_dist, 50.0, 49.0)
+
+    def lap_progress():
+        for opt_dist in distances:
+            calc.lap_progress_distance(opt_dist, TRACE_LENGTH)
+
+    def scale_map():
+        calc.scale_map(coords, 300, 10)
+
+    cases = {
+        "delta_telemetry_binary": delta_binary,
+        "delta_telemetry_cursor": delta_cursor,
+        "relative_time_gap_grid": relative_gaps,
+        "lap_progress_grid": lap_progress,
+        "scale_map": scale_map,
+    }
+    results = {}
+    for name, func in cases.items():
+        result = summarize(time_calls(func, args.iterations))
+        result.update(trace_allocation(func, args.iterations))
+        results[name] = result
+        print_result("calc", name, result)
+    return results
+
+
+def setup_config(cfg, args, temp_path: str):
+    """Load default setting in memory, redirect user path to temporary folder"""
+    from tinypedal.userfile.json_setting import copy_setting
+
+    for key in (
+        "config", "shortcuts", "filelock", "setting",
+        "brakes", "brands", "classes", "compounds", "heatmap", "tracks",
+    ):
+        setattr(cfg.user, key, copy_setting(getattr(cfg.default, key)))
+    user_path = cfg.user.config["user_path"]
+    for key in user_path:
+        user_path[key] = os.path.join(temp_path, key.replace("_path", ""), "")
+    cfg.path.update(user_path=user_path, default_path=user_path)
+
+    cfg.application["enable_performance_profiler"] = True
+    if args.replay:
+        cfg.api_name = "Replay"
+        setting_api = cfg.user.setting["api_replay"]
+        setting_api["replay_file_name"] = os.path.abspath(args.replay)
+        setting_api["enable_replay_loop"] = True
+    else:
+        cfg.api_name = "Synthetic"
+        setting_api = cfg.user.setting["api_synthetic"]
+        setting_api["number_of_vehicles"] = args.vehicles
+    setting_api["enable_active_state_override"] = True
+    setting_api["active_state"] = True
+
+
+def benchmark_module(args, mctrl) -> dict:
+    """Benchmark data module update loop iterations"""
+    from tinypedal.profiler import profiler
+
+    profiler.reset()
+    sleep(args.duration)
+    results = {}
+    for name in mctrl.active_modules:
+        stats = profiler.get(name, "module")
+        if stats is None:
+            continue
+        results[name] = summarize(stats.samples())
+
+    # Allocation pass, separated from timing pass as tracing slows down execution
+    tracemalloc.start()
+    snapshot_start = tracemalloc.take_snapshot()
+    sleep(args.duration)
+    snapshot_end = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    for name, result in results.items():
+        result.update(file_allocation(snapshot_start, snapshot_end, f"{name}.py"))
+        print_result("module", name, result)
+    return results
+
+
+def benchmark_widget(args, widget_names) -> dict:
+    """Benchmark widget timer & paint events offscreen"""
+    from PySide2.QtWidgets import QApplication
+
+    from tinypedal import widget
+    from tinypedal.setting import cfg
+
+    results = {}
+    for name in widget_names:
+        try:
+            overlay = getattr(widget, name).Realtime(cfg, name)
+        except Exception as error:  # pylint: disable=broad-except
+            print(f"widget/{name}: skipped, {type(error).__name__}: {error}")
+            continue
+
+        def timer_event():
+            overlay.timerEvent(None)
+
+        def paint_event():
+            overlay.grab()
+
+        timer_samples = []
+        paint_samples = []
+        for _ in range(args.iterations):
+            timer_samples.extend(time_calls(timer_event, 1))
+            paint_samples.extend(time_calls(paint_event, 1))
+            sleep(args.interval)  # allow new frames between calls
+        timer_result = summarize(timer_samples)
+        paint_result = summarize(paint_samples)
+
+        tracemalloc.start()
+        snapshot_start = tracemalloc.take_snapshot()
+        for _ in range(args.iterations):
+            timer_event()
+            sleep(args.interval)
+        snapshot_end = tracemalloc.take_snapshot()
+        tracemalloc.stop()
+        timer_result.update(file_allocation(snapshot_start, snapshot_end, f"{name}.py"))
+
+        results[f"{name}_timer"] = timer_result
+        results[f"{name}_paint"] = paint_result
+        print_result("widget", f"{name}_timer", timer_result)
+        print_result("widget", f"{name}_paint", paint_result)
+
+        overlay.close()
+        overlay.deleteLater()
+        QApplication.processEvents()
+    return results
+
+
+def print_result(section: str, name: str, result: dict):
+    """Print single result"""
+    allocation = ""
+    if "peak_kib" in result:
+        allocation = f" peak {result['peak_kib']:.2f}KiB"
+    if "net_kib" in result:
+        allocation += f" net {result['net_kib']:.2f}KiB"
+    print(
+        f"{section}/{name}: "
+        f"p50 {result['p50_ms']:.4f}ms p90 {result['p90_ms']:.4f}ms "
+        f"p99 {result['p99_ms']:.4f}ms max {result['max_ms']:.4f}ms{allocation}"
+    )
+
+
+def compare_baseline(results: dict, baseline: dict, tolerance: float, min_delta: float) -> list:
+    """Compare results with baseline, return list of regression messages"""
+    regressions = []
+    for section, cases in results.items():
+        for name, result in cases.items():
+            base_result = baseline.get(section, {}).get(name)
+            if base_result is None:
+                continue
+            for key in COMPARE_KEYS:
+                base_value = base_result.get(key, 0.0)
+                limit = max(base_value * (1 + tolerance), base_value + min_delta)
+                if result[key] > limit:
+                    regressions.append(
+                        f"{section}/{name} {key}: {result[key]:.4f} > {limit:.4f} "
+                        f"(baseline {base_value:.4f})"
+                    )
+    return regressions
+
+
+def parse_args():
+    """Parse command line arguments"""
+    parser = argparse.ArgumentParser(description="TinyPedal headless performance benchmark")
+    parser.add_argument("--only", choices=SECTIONS, action="append",
+                        help="run selected section only, can be repeated")
+    parser.add_argument("--vehicles", type=int, default=128,
+                        help="number of synthetic vehicles (default: %(default)s)")
+    parser.add_argument("--replay", default="",
+                        help="replay recorded telemetry capture file instead of synthetic grid")
+    parser.add_argument("--duration", type=float, default=10.0,
+                        help="module sampling duration in seconds (default: %(default)s)")
+    parser.add_argument("--iterations", type=int, default=200,
+                        help="calls per calc & widget case (default: %(default)s)")
+    parser.add_argument("--interval", type=float, default=0.01,
+                        help="seconds between widget calls (default: %(default)s)")
+    parser.add_argument("--widgets", default="",
+                        help="comma separated widget names (default: all)")
+    parser.add_argument("--baseline", default=BASELINE_FILE,
+                        help="baseline JSON file (default: %(default)s)")
+    parser.add_argument("--save-baseline", action="store_true",
+                        help="save results as new baseline")
+    parser.add_argument("--tolerance", type=float, default=0.25,
+                        help="allowed slowdown ratio (default: %(default)s)")
+    parser.add_argument("--min-delta", type=float, default=0.01,
+                        help="allowed slowdown in milliseconds regardless of ratio (default: %(default)s)")
+    parser.add_argument("--output", default="",
+                        help="save results to JSON file")
+    return parser.parse_args()
+
+
+def run(args) -> dict:
+    """Run selected benchmark sections"""
+    sections = args.only or SECTIONS
+    results = {}
+    if "calc" in sections:
+        results["calc"] = benchmark_calc(args)
+    if "module" not in sections and "widget" not in sections:
+        return results
+
+    from PySide2.QtWidgets import QApplication
+
+    app = QApplication(sys.argv[:1])  # pylint: disable=unused-variable
+
+    from tinypedal.api_control import api
+    from tinypedal.module_control import mctrl
+    from tinypedal.setting import cfg
+    from tinypedal.template.setting_widget import WIDGET_FILENAME
+
+    with tempfile.TemporaryDirectory(prefix="tinypedal_benchmark_") as temp_path:
+        setup_config(cfg, args, temp_path)
+        api.connect()
+        api.start()
+        for name in BENCHMARK_MODULES:
+            cfg.user.setting[name]["enable"] = True
+            mctrl.start(name)
+        sleep(1)  # warm up
+        try:
+            if "module" in sections:
+                results["module"] = benchmark_module(args, mctrl)
+            if "widget" in sections:
+                if args.widgets:
+                    widget_names = tuple(name.strip() for name in args.widgets.split(","))
+                else:
+                    widget_names = WIDGET_FILENAME
+                results["widget"] = benchmark_widget(args, widget_names)
+        finally:
+            mctrl.close()
+            api.stop()
+    return results
+
+
+def main():
+    """Run benchmark & compare with baseline"""
+    args = parse_args()
+    environment = {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "processor": platform.processor(),
+        "source": args.replay or f"synthetic ({args.vehicles} vehicles)",
+    }
+    results = run(args)
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as jsonfile:
+            json.dump({"environment": environment, **results}, jsonfile, indent=4)
+
+    if args.save_baseline or not os.path.exists(args.baseline):
+        with open(args.baseline, "w", encoding="utf-8") as jsonfile:
+            json.dump({"environment": environment, **results}, jsonfile, indent=4)
+        print(f"baseline saved: {args.baseline}")
+        return 0
+
+    with open(args.baseline, "r", encoding="utf-8") as jsonfile:
+        baseline = json.load(jsonfile)
+    regressions = compare_baseline(results, baseline, args.tolerance, args.min_delta)
+    if regressions:
+        print(f"{len(regressions)} regression(s) against baseline: {args.baseline}")
+        for message in regressions:
+            print(f"  {message}")
+        return 1
+    print(f"no regression against baseline: {args.baseline}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
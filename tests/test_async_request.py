@@ -0,0 +1,115 @@
+"""
+Async request tests
+
+Usage (from repository root):
+    python -m pytest tests/test_async_request.py
+"""
+
+import asyncio
+import sys
+
+sys.path.append(".")
+
+from tinypedal.async_request import HttpConnectionPool, read_response, set_header_get
+
+RESPONSE_KEEP_ALIVE = b"HTTP/1.1 200 OK\r\nContent-Length: 2\r\n\r\nok"
+RESPONSE_CLOSE = b"HTTP/1.1 200 OK\r\nContent-Length: 2\r\nConnection: close\r\n\r\nok"
+
+
+class LocalServer:
+    """Local HTTP server that replies same response to each request"""
+
+    def __init__(self, response: bytes):
+        self.response = response
+        self.connections = 0
+        self.port = 0
+        self._server = None
+
+    async def start(self):
+        """Start server on random local port"""
+        self._server = await asyncio.start_server(self.handle, "127.0.0.1", 0)
+        self.port = self._server.sockets[0].getsockname()[1]
+
+    async def stop(self):
+        """Stop server"""
+        self._server.close()
+        await self._server.wait_closed()
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        """Reply each request until client closed or response closes connection"""
+        self.connections += 1
+        try:
+            while True:
+                await reader.readuntil(b"\r\n\r\n")
+                writer.write(self.response)
+                await writer.drain()
+                if b"Connection: close" in self.response:
+                    break
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+
+async def request_twice(response: bytes):
+    """Send 2 requests from same pool, return server & pool state"""
+    server = LocalServer(response)
+    await server.start()
+    pool = HttpConnectionPool("127.0.0.1", server.port)
+    request = set_header_get("/", "127.0.0.1")
+    try:
+        results = (
+            await pool.get(request, 1),
+            await pool.get(request, 1),
+        )
+        idle = pool.idle
+    finally:
+        await pool.close()
+        await server.stop()
+    return results, server.connections, idle, pool.idle
+
+
+def test_pool_reuse_keep_alive_connection():
+    """Keep-alive connection is reused for next request"""
+    results, connections, idle, idle_closed = asyncio.run(request_twice(RESPONSE_KEEP_ALIVE))
+    assert results == (b"ok", b"ok")
+    assert connections == 1
+    assert idle == 1
+    assert idle_closed == 0
+
+
+def test_pool_skip_closed_connection():
+    """Connection closed by server is not kept for reuse"""
+    results, connections, idle, _ = asyncio.run(request_twice(RESPONSE_CLOSE))
+    assert results == (b"ok", b"ok")
+    assert connections == 2
+    assert idle == 0
+
+
+async def read_bytes(data: bytes):
+    """Read response from bytes"""
+    reader = asyncio.StreamReader()
+    reader.feed_data(data)
+    reader.feed_eof()
+    return await read_response(reader)
+
+
+def test_read_response_chunked():
+    """Chunked body is joined, connection can be kept alive"""
+    data = (
+        b"HTTP/1.1 200 OK\r\nTransfer-Encoding: chunked\r\n\r\n"
+        b"3\r\nabc\r\n2;ext=1\r\nde\r\n0\r\n\r\n"
+    )
+    assert asyncio.run(read_bytes(data)) == (b"abcde", True)
+
+
+def test_read_response_error_status():
+    """Body is discarded if status is not 200, connection can still be kept alive"""
+    data = b"HTTP/1.1 404 Not Found\r\nContent-Length: 4\r\n\r\nnone"
+    assert asyncio.run(read_bytes(data)) == (b"", True)
+
+
+def test_read_response_no_length():
+    """Body without length is read until closed, connection is not kept alive"""
+    data = b"HTTP/1.1 200 OK\r\n\r\nuntil closed"
+    assert asyncio.run(read_bytes(data)) == (b"until closed", False)
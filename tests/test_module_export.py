@@ -0,0 +1,111 @@
+"""
+Export module tests
+
+Usage (from repository root):
+    python -m pytest tests/test_module_export.py
+"""
+
+import mmap
+import os
+import sys
+
+import pytest
+
+sys.path.append(".")
+
+from tinypedal.const_app import PLATFORM
+from tinypedal.const_common import MAX_VEHICLES
+from tinypedal.module.module_export import (
+    EXPORT_DATA,
+    EXPORT_FIELDS,
+    EXPORT_HEADER,
+    EXPORT_MAGIC,
+    EXPORT_VERSION,
+    SharedMemoryWriter,
+)
+
+SHARED_SIZE = EXPORT_HEADER.size + EXPORT_DATA.size
+
+pytestmark = pytest.mark.skipif(
+    not PLATFORM.WINDOWS and not os.path.isdir("/dev/shm"),
+    reason="named shared memory not available",
+)
+
+
+def open_reader(name: str) -> mmap.mmap:
+    """Open existing named shared memory for reading"""
+    if PLATFORM.WINDOWS:
+        return mmap.mmap(-1, SHARED_SIZE, tagname=name)
+    with open(f"/dev/shm/{name}", "rb") as file:
+        return mmap.mmap(file.fileno(), SHARED_SIZE, access=mmap.ACCESS_READ)
+
+
+def export_values() -> list:
+    """Create export values in EXPORT_FIELDS order, then standings"""
+    values = []
+    for index, (_, fmt) in enumerate(EXPORT_FIELDS):
+        if fmt == "?":
+            values.append(True)
+        elif fmt == "h":
+            values.append(index)
+        elif fmt[0].isdigit():
+            values.extend(float(index + wheel) for wheel in range(int(fmt[:-1])))
+        else:
+            values.append(index * 0.5)
+    standings = (3, 1, 2)
+    values.append(len(standings))
+    values.extend(standings)
+    values.extend((-1,) * (MAX_VEHICLES - len(standings)))
+    return values
+
+
+@pytest.fixture
+def writer_name():
+    """Unique shared memory name for each test"""
+    return f"TinyPedal_Test_{os.getpid()}"
+
+
+def test_writer_header(writer_name):
+    """Header is set on create, active state can be toggled"""
+    writer = SharedMemoryWriter(writer_name, SHARED_SIZE)
+    try:
+        reader = open_reader(writer_name)
+        assert EXPORT_HEADER.unpack_from(reader, 0) == (
+            EXPORT_MAGIC, EXPORT_VERSION, 0, EXPORT_DATA.size, 0, 0)
+        writer.set_active(True)
+        assert EXPORT_HEADER.unpack_from(reader, 0)[2] == 1
+        writer.set_active(False)
+        assert EXPORT_HEADER.unpack_from(reader, 0)[2] == 0
+        reader.close()
+    finally:
+        writer.close()
+
+
+def test_writer_data(writer_name):
+    """Data & frame version are written, sequence is even after each write"""
+    writer = SharedMemoryWriter(writer_name, SHARED_SIZE)
+    values = export_values()
+    try:
+        reader = open_reader(writer_name)
+        writer.write(values, 42)
+        header = EXPORT_HEADER.unpack_from(reader, 0)
+        assert header[4] == 2  # sequence
+        assert header[5] == 42  # frame version
+        assert list(EXPORT_DATA.unpack_from(reader, EXPORT_HEADER.size)) == values
+
+        writer.write(values, 43)
+        header = EXPORT_HEADER.unpack_from(reader, 0)
+        assert header[4] == 4
+        assert header[5] == 43
+        reader.close()
+    finally:
+        writer.close()
+
+
+@pytest.mark.skipif(PLATFORM.WINDOWS, reason="shared memory file only on linux")
+def test_writer_close_remove_file(writer_name):
+    """Shared memory file is removed on close"""
+    writer = SharedMemoryWriter(writer_name, SHARED_SIZE)
+    assert os.path.exists(f"/dev/shm/{writer_name}")
+    writer.close()
+    assert not os.path.exists(f"/dev/shm/{writer_name}")
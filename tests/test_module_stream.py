@@ -0,0 +1,177 @@
+"""
+Stream module tests
+
+Usage (from repository root):
+    python -m pytest tests/test_module_stream.py
+"""
+
+import asyncio
+import json
+import sys
+
+import pytest
+
+sys.path.append(".")
+
+from tinypedal.module.module_stream import (
+    MAX_READ_PAYLOAD,
+    NDJSON_HEADER,
+    STREAM_FIELDS,
+    StreamClient,
+    read_websocket_frame,
+    websocket_frame,
+    websocket_handshake,
+)
+
+
+class BufferWriter:
+    """In-memory stream writer"""
+
+    def __init__(self):
+        self.data = bytearray()
+
+    def write(self, data: bytes):
+        self.data += data
+
+
+def request_header(target: str = "/", *headers: str) -> bytes:
+    """Create HTTP GET request header"""
+    lines = (f"GET {target} HTTP/1.1", "Host: localhost", *headers)
+    return ("\r\n".join(lines) + "\r\n\r\n").encode()
+
+
+def masked_frame(payload: bytes, opcode: int, mask: bytes = b"\x01\x02\x03\x04") -> bytes:
+    """Create masked (client) WebSocket frame"""
+    length = len(payload)
+    if length < 126:
+        header = bytes((0x80 | opcode, 0x80 | length))
+    else:
+        header = bytes((0x80 | opcode, 0x80 | 126)) + length.to_bytes(2, "big")
+    return header + mask + bytes(byte ^ mask[index & 3] for index, byte in enumerate(payload))
+
+
+def read_frame(data: bytes):
+    """Read WebSocket frame from bytes"""
+    async def read():
+        reader = asyncio.StreamReader()
+        reader.feed_data(data)
+        reader.feed_eof()
+        return await read_websocket_frame(reader)
+    return asyncio.run(read())
+
+
+def test_websocket_handshake():
+    """Accept key from RFC 6455 example"""
+    assert b"Sec-WebSocket-Accept: s3pPLMBiTxaQ9kYGzzhZRbK+xOo=\r\n" in websocket_handshake(
+        "dGhlIHNhbXBsZSBub25jZQ==")
+
+
+@pytest.mark.parametrize("length, header_size", ((5, 2), (126, 4), (65536, 10)))
+def test_websocket_frame_length(length, header_size):
+    """Unmasked frame header uses 7 bits, 16 bits, or 64 bits payload length"""
+    payload = b"x" * length
+    frame = websocket_frame(payload)
+    assert frame[0] == 0x81
+    assert len(frame) == header_size + length
+    assert frame.endswith(payload)
+    assert read_frame(frame) == (0x1, payload)
+
+
+def test_read_masked_frame():
+    """Masked client frame is unmasked"""
+    assert read_frame(masked_frame(b"ping", 0x9)) == (0x9, b"ping")
+    assert read_frame(masked_frame(b"a" * 200, 0x1)) == (0x1, b"a" * 200)
+
+
+def test_read_frame_payload_limit():
+    """Frame with payload length above limit is rejected before reading payload"""
+    frame = bytes((0x81, 127)) + (MAX_READ_PAYLOAD + 1).to_bytes(8, "big")
+    with pytest.raises(ValueError):
+        read_frame(frame)
+
+
+def test_client_from_websocket_request():
+    """WebSocket request with selected sections & interval"""
+    header = request_header(
+        "/?sections=delta,fuel,invalid&interval=200",
+        "Upgrade: websocket",
+        "Sec-WebSocket-Key: dGhlIHNhbXBsZSBub25jZQ==",
+    )
+    client = StreamClient.from_request(header, BufferWriter())
+    assert client.websocket
+    assert client.handshake.startswith(b"HTTP/1.1 101 Switching Protocols\r\n")
+    assert client.interval == 0.2
+    assert client.paths[0] == "active"
+    assert all(path.split(".", 1)[0] in ("delta", "fuel") for path in client.paths[1:])
+
+
+def test_client_from_ndjson_request():
+    """Plain request is served as NDJSON with all sections"""
+    client = StreamClient.from_request(request_header("/?interval=abc"), BufferWriter())
+    assert not client.websocket
+    assert client.handshake == NDJSON_HEADER
+    assert client.interval == 0.0
+    assert client.paths == ("active",) + STREAM_FIELDS
+
+
+@pytest.mark.parametrize("header", (
+    b"POST / HTTP/1.1\r\n\r\n",
+    request_header("/", "Upgrade: websocket"),  # missing key
+))
+def test_client_invalid_request(header):
+    """Invalid request raises ValueError"""
+    with pytest.raises(ValueError):
+        StreamClient.from_request(header, BufferWriter())
+
+
+def test_client_send_changed_only():
+    """First message sends all fields, then only changed fields, nothing if unchanged"""
+    writer = BufferWriter()
+    client = StreamClient.from_request(request_header("/?sections=delta"), writer)
+    snapshot = {path: json.dumps(0.0) for path in STREAM_FIELDS}
+    snapshot["active"] = json.dumps(True)
+
+    client.send(snapshot, 1)
+    message = json.loads(writer.data.decode().splitlines()[0])
+    assert message["frame"] == 1
+    assert set(message["data"]) == set(client.paths)
+
+    writer.data.clear()
+    client.send(snapshot, 2)
+    assert writer.data == b""
+
+    snapshot["delta.deltaBest"] = json.dumps(-0.5)
+    snapshot["fuel.amountCurrent"] = json.dumps(10.0)  # not selected
+    client.send(snapshot, 3)
+    assert json.loads(writer.data) == {"frame": 3, "data": {"delta.deltaBest": -0.5}}
+
+
+def test_client_send_websocket():
+    """WebSocket client sends message as text frame"""
+    writer = BufferWriter()
+    header = request_header(
+        "/?sections=vehicles", "Upgrade: websocket", "Sec-WebSocket-Key: key")
+    client = StreamClient.from_request(header, writer)
+    snapshot = {path: json.dumps(1) for path in STREAM_FIELDS}
+    snapshot["active"] = json.dumps(False)
+    client.send(snapshot, 5)
+    opcode, payload = read_frame(bytes(writer.data))
+    assert opcode == 0x1
+    assert json.loads(payload)["frame"] == 5
+
+
+def test_client_reply_ping_and_close():
+    """WebSocket client replies pong to ping, and close to close"""
+    writer = BufferWriter()
+    header = request_header("/", "Upgrade: websocket", "Sec-WebSocket-Key: key")
+    client = StreamClient.from_request(header, writer)
+
+    async def read():
+        reader = asyncio.StreamReader()
+        reader.feed_data(masked_frame(b"hi", 0x9) + masked_frame(b"\x03\xe8bye", 0x8))
+        reader.feed_eof()
+        await client.read_until_closed(reader)
+
+    asyncio.run(read())
+    pong = websocket_frame(b"hi", 0xA)
+    assert bytes(writer.data) == pong + websocket_frame(b"\x03\xe8", 0x8)
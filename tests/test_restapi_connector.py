@@ -0,0 +1,169 @@
+"""
+Rest API connector tests
+
+Usage (from repository root):
+    python -m pytest tests/test_restapi_connector.py
+"""
+
+import sys
+from types import SimpleNamespace
+
+sys.path.append(".")
+
+from tinypedal.adapter.restapi_connector import (
+    ExtractPlan,
+    RequestScheduler,
+    ResOutput,
+    ScheduledTask,
+)
+
+
+class CountedParser:
+    """Parser that counts calls, and returns data unchanged"""
+
+    def __init__(self):
+        self.calls = 0
+
+    def __call__(self, data, default):
+        self.calls += 1
+        return data
+
+
+def create_plan():
+    """Create extraction plan with shared key path"""
+    parser = CountedParser()
+    outputs = (
+        ResOutput("aero", -1.0, parser, ("wearables", "body", "aero")),
+        ResOutput("brake", 0.0, parser, ("wearables", "brakes")),
+        ResOutput("refill", 0.0, parser, ("pitMenu", "pitMenu")),
+        ResOutput("whole", None, parser),
+    )
+    return ExtractPlan(outputs), parser
+
+
+RESOURCE = {
+    "wearables": {"body": {"aero": 0.5}, "brakes": 0.9},
+    "pitMenu": {"pitMenu": 40.0},
+}
+
+
+def test_extract_key_paths():
+    """Each output gets data from own key path, resource itself if no key"""
+    plan, _ = create_plan()
+    assert plan.extract(RESOURCE) == [0.5, 0.9, 40.0, RESOURCE]
+
+
+def test_extract_missing_data():
+    """Missing key, or non-dict data in key path, extracts None"""
+    plan, _ = create_plan()
+    resource = {"wearables": {"body": 1}, "pitMenu": {}}
+    assert plan.extract(resource) == [None, None, None, resource]
+    assert plan.extract([]) == [None, None, None, []]
+
+
+def test_update_only_parse_changed():
+    """Only changed data is parsed and output"""
+    plan, parser = create_plan()
+    output = SimpleNamespace()
+    assert plan.update(output, RESOURCE)
+    assert (output.aero, output.brake, output.refill) == (0.5, 0.9, 40.0)
+    assert parser.calls == 4
+
+    assert plan.update(output, RESOURCE)
+    assert parser.calls == 4
+
+    changed = {
+        "wearables": {"body": {"aero": 0.4}, "brakes": 0.9},
+        "pitMenu": {"pitMenu": 40.0},
+    }
+    assert plan.update(output, changed)
+    assert output.aero == 0.4
+    assert parser.calls == 6  # aero & whole resource
+
+
+def test_update_reset_missing_to_default():
+    """Data no longer available is set to default"""
+    plan, _ = create_plan()
+    output = SimpleNamespace()
+    plan.update(output, RESOURCE)
+    assert plan.update(output, {"pitMenu": {"pitMenu": 10.0}})
+    assert (output.aero, output.brake, output.refill) == (-1.0, 0.0, 10.0)
+
+
+def test_update_no_data_available():
+    """Return False if no data available, outputs set to default"""
+    plan = ExtractPlan((ResOutput("aero", -1.0, CountedParser(), ("body", "aero")),))
+    output = SimpleNamespace()
+    assert not plan.update(output, {"body": {}})
+    assert output.aero == -1.0
+
+
+def create_task(path: str, priority: int = 0, min_interval: float = 0.2):
+    """Create scheduled task"""
+    return ScheduledTask(path, b"", ExtractPlan(()), priority, min_interval)
+
+
+def test_scheduler_request_budget():
+    """Request delay is limited by request budget, minimum 1 request per second"""
+    assert RequestScheduler(10).request_delay == 0.1
+    assert RequestScheduler(0).request_delay == 1.0
+
+
+def test_scheduler_due_task_order():
+    """Due task with higher priority runs first, then higher change rate"""
+    scheduler = RequestScheduler(10)
+    low = create_task("low", 0)
+    high = create_task("high", 1)
+    steady = create_task("steady", 1)
+    for task in (low, high, steady):
+        scheduler.add(task)
+    steady.change_rate = 0.5
+    assert scheduler.next_task(0.0) is high
+
+    high.next_time = 1.0  # not due
+    assert scheduler.next_task(0.0) is steady
+    steady.next_time = 1.0
+    assert scheduler.next_task(0.0) is low
+    low.next_time = 1.0
+    assert scheduler.next_task(0.0) is None
+    assert scheduler.next_delay(0.0) == 1.0
+
+
+def test_scheduler_interval_backoff():
+    """Interval grows while data unchanged (up to max), resets to minimum on change"""
+    scheduler = RequestScheduler(10, max_interval=0.5)
+    task = create_task("task", min_interval=0.2)
+    scheduler.add(task)
+
+    scheduler.update(task, 1, 10.0)  # changed
+    assert task.interval == 0.2
+    assert task.next_time == 10.2
+    scheduler.update(task, 1, 10.2)  # unchanged
+    assert abs(task.interval - 0.3) < 1e-9
+    scheduler.update(task, 1, 10.5)
+    scheduler.update(task, 1, 11.0)
+    assert task.interval == 0.5
+    assert task.change_rate < 1.0
+
+    scheduler.update(task, 2, 11.5)  # changed
+    assert task.interval == 0.2
+
+
+def test_scheduler_burst():
+    """Burst resets all tasks to minimum interval and runs immediately"""
+    scheduler = RequestScheduler(10)
+    task = create_task("task")
+    scheduler.add(task)
+    task.interval = 5.0
+    task.next_time = 100.0
+    scheduler.burst()
+    assert task.interval == task.min_interval
+    assert scheduler.next_task(0.0) is task
+    assert scheduler.next_delay(0.0) == 0.0
+
+
+def test_scheduler_no_task():
+    """Wait max interval if no task added"""
+    scheduler = RequestScheduler(10, max_interval=5.0)
+    assert scheduler.next_task(0.0) is None
+    assert scheduler.next_delay(0.0) == 5.0
@@ -25,6 +25,7 @@ from __future__ import annotations
 from abc import ABC, abstractmethod
 
 from ..process.weather import WeatherNode
+from .snapshot import VehicleSnapshot
 
 
 class State(ABC):
@@ -790,6 +791,10 @@ class Vehicle(ABC):
     def setup(self) -> tuple[str, ...]:
         """Car setup data"""
 
+    @abstractmethod
+    def snapshot(self) -> VehicleSnapshot:
+        """All vehicles data snapshot, updated once per telemetry frame"""
+
 
 class Wheel(ABC):
     """Wheel & suspension (front left, front right, rear left, rear right)"""
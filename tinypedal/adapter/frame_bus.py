@@ -0,0 +1,153 @@
+#  TinyPedal is an open-source overlay application for racing simulation.
+#  Copyright (C) 2022-2026 TinyPedal developers, see contributors.md file
+#
+#  This file is part of TinyPedal.
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Telemetry frame bus & frame scheduler
+"""
+
+from __future__ import annotations
+
+import threading
+from time import monotonic
+
+
+class FrameBus:
+    """Telemetry frame bus
+
+    Publish new frame notification from API data synchronizing thread
+    to subscribed data module threads, so that modules only wake up
+    while new telemetry frame is available.
+
+    Attributes:
+        version: last published frame version (incremented per new frame).
+    """
+
+    __slots__ = (
+        "_lock",
+        "_subscribers",
+        "version",
+    )
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._subscribers: tuple[threading.Event, ...] = ()
+        self.version = 0
+
+    def subscribe(self) -> threading.Event:
+        """Subscribe new frame notification
+
+        Returns:
+            Event that is set on each new frame.
+        """
+        new_frame = threading.Event()
+        with self._lock:
+            self._subscribers += (new_frame,)
+        return new_frame
+
+    def unsubscribe(self, new_frame: threading.Event) -> None:
+        """Unsubscribe new frame notification"""
+        with self._lock:
+            self._subscribers = tuple(
+                _event for _event in self._subscribers if _event is not new_frame
+            )
+
+    def publish(self) -> None:
+        """Publish new frame to all subscribers"""
+        self.version += 1
+        for new_frame in self._subscribers:  # tuple, safe to iterate without lock
+            new_frame.set()
+
+    @property
+    def subscribers(self) -> int:
+        """Number of subscribers"""
+        return len(self._subscribers)
+
+
+class FrameScheduler:
+    """Adaptive frame update scheduler
+
+    Learn sim publish interval from detected new frames (data version change),
+    schedule next update right at expected next frame, and retry shortly if
+    frame not yet published. Back off exponentially while no new frame,
+    such as paused or in menus, up to idle delay.
+
+    Args:
+        initial_interval: initial frame interval (seconds) before learned.
+        min_interval: min learned frame interval (seconds), limits max update rate.
+        max_interval: max frame interval (seconds) to learn from,
+            longer interval is treated as gap and ignored.
+        idle_delay: max update delay (seconds) while no new frame.
+    """
+
+    __slots__ = (
+        "_initial_interval",
+        "_min_interval",
+        "_max_interval",
+        "_last_frame_time",
+        "_missed",
+        "interval",
+        "idle_delay",
+    )
+
+    def __init__(
+        self,
+        initial_interval: float = 0.01,
+        min_interval: float = 0.01,
+        max_interval: float = 0.2,
+        idle_delay: float = 0.5,
+    ) -> None:
+        self._initial_interval = initial_interval
+        self._min_interval = min_interval
+        self._max_interval = max_interval
+        self._last_frame_time = 0.0
+        self._missed = 0
+        self.interval = initial_interval
+        self.idle_delay = idle_delay
+
+    def reset(self) -> None:
+        """Reset learned frame interval"""
+        self._last_frame_time = 0.0
+        self._missed = 0
+        self.interval = self._initial_interval
+
+    def next_delay(self, new_frame: bool) -> float:
+        """Next update delay (seconds)
+
+        Args:
+            new_frame: whether new frame detected in current update.
+        """
+        now = monotonic()
+        if new_frame:
+            elapsed = now - self._last_frame_time
+            if elapsed < self._max_interval:  # learn interval, smoothed
+                self.interval = max(
+                    self.interval + (elapsed - self.interval) * 0.1,
+                    self._min_interval,
+                )
+            self._last_frame_time = now
+            self._missed = 0
+            # Wake slightly early, so frame detection time (and learned interval)
+            # is not delayed by sleep overshoot
+            return self.interval * 0.9
+        # Retry shortly after expected frame time, then back off
+        delay = self.interval * 0.1 * (1 << min(self._missed, 10))
+        self._missed += 1
+        return min(delay, self.idle_delay)
+
+
+frame_bus = FrameBus()
@@ -0,0 +1,82 @@
+#  TinyPedal is an open-source overlay application for racing simulation.
+#  Copyright (C) 2022-2026 TinyPedal developers, see contributors.md file
+#
+#  This file is part of TinyPedal.
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Per-frame reader value cache
+"""
+
+from __future__ import annotations
+
+from functools import wraps
+from typing import Callable
+
+from .frame_bus import frame_bus
+
+
+class FrameCache:
+    """Per-frame reader value cache
+
+    Cache derived values returned from decorated reader methods,
+    keyed by reader instance, vehicle index and other arguments,
+    so each value is computed once per telemetry frame (frame bus version),
+    and shared between data modules and widgets.
+
+    Attributes:
+        enabled: whether cache is enabled, disabled by default.
+    """
+
+    __slots__ = (
+        "_caches",
+        "enabled",
+    )
+
+    def __init__(self):
+        self._caches: list[dict] = []
+        self.enabled = False
+
+    def clear(self) -> None:
+        """Clear all cached values"""
+        for cache in self._caches:
+            cache.clear()
+
+    def cached(self, method: Callable) -> Callable:
+        """Decorate reader method to cache return value per frame
+
+        Decorated method must take vehicle index as first argument,
+        and return immutable value (such as tuple).
+        """
+        cache: dict = {}
+        self._caches.append(cache)
+
+        @wraps(method)
+        def wrapper(reader, index: int | None = None, *args, **kwargs):
+            if not self.enabled:
+                return method(reader, index, *args, **kwargs)
+            key = (id(reader), index, args, tuple(kwargs.items()))
+            version = frame_bus.version
+            entry = cache.get(key)
+            if entry is not None and entry[0] == version:
+                return entry[1]
+            value = method(reader, index, *args, **kwargs)
+            cache[key] = (version, value)
+            return value
+
+        return wrapper
+
+
+frame_cache = FrameCache()
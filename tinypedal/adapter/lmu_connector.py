@@ -26,7 +26,7 @@ import ctypes
 import logging
 import threading
 from time import monotonic, sleep
-from typing import TYPE_CHECKING, Sequence
+from typing import TYPE_CHECKING, Callable, Sequence
 
 if __name__ == "__main__":  # local import check
     import sys
@@ -45,43 +45,104 @@ from pyLMUSharedMemory.lmu_mmap import (
     MMapControl,
 )
 
+from .frame_bus import FrameScheduler
+from .mmap_snapshot import MMapSnapshot, copy_struct
+
 logger = logging.getLogger(__name__)
 
 # Enum map
 LMU_COMPOUND_TYPE = lmu_enum.enum_map(lmu_enum.LMUCompoundType)
 
 
-def copy_struct(struct_data):
-    """Allow to copy ctypes struct data with __slots__"""
-    return type(struct_data).from_buffer_copy(
-        ctypes.string_at(
-            ctypes.byref(struct_data),
-            ctypes.sizeof(struct_data),
-        )
-    )
-
-
-def local_scoring_index(scor_veh: Sequence[lmu_data.LMUVehicleScoring]) -> int:
+def local_scoring_index(scor_veh: Sequence[lmu_data.LMUVehicleScoring], veh_total: int) -> int:
     """Find local player scoring index
 
     Args:
         scor_veh: scoring array.
+        veh_total: total vehicles.
     """
-    for scor_idx, veh_info in enumerate(scor_veh):
+    for scor_idx, veh_info in zip(range(veh_total), scor_veh):
         if veh_info.mIsPlayer:
             return scor_idx
     return INVALID_INDEX
 
 
+def struct_field(struct_type: type, name: str) -> tuple[int, type]:
+    """Get ctypes struct field offset & type"""
+    field_type = next(_field[1] for _field in struct_type._fields_ if _field[0] == name)
+    return getattr(struct_type, name).offset, field_type
+
+
+def vehicle_array_region(field_name: str, array_name: str) -> tuple[int, int, int]:
+    """Get vehicle array region (offset, record size, number of records) in shared memory data"""
+    field_offset, field_type = struct_field(lmu_data.LMUObjectOut, field_name)
+    array_offset, array_type = struct_field(field_type, array_name)
+    return field_offset + array_offset, ctypes.sizeof(array_type._type_), array_type._length_
+
+
+# Vehicle data region, scoring data is located before telemetry data
+DATA_SIZE = ctypes.sizeof(lmu_data.LMUObjectOut)
+SCOR_VEH_OFFSET, SCOR_VEH_SIZE, SCOR_VEH_RECORDS = vehicle_array_region("scoring", "vehScoringInfo")
+TELE_VEH_OFFSET, TELE_VEH_SIZE, TELE_VEH_RECORDS = vehicle_array_region("telemetry", "telemInfo")
+SCOR_VEH_END = SCOR_VEH_OFFSET + SCOR_VEH_SIZE * SCOR_VEH_RECORDS
+TELE_VEH_END = TELE_VEH_OFFSET + TELE_VEH_SIZE * TELE_VEH_RECORDS
+VEH_RECORDS = min(SCOR_VEH_RECORDS, TELE_VEH_RECORDS)
+
+
+def live_vehicles(veh_total: int) -> int:
+    """Number of live vehicle records, limited in 0 to max vehicle records"""
+    return min(max(veh_total, 0), VEH_RECORDS)
+
+
+def shared_memory_regions(data: lmu_data.LMUObjectOut) -> tuple[tuple[int, int], ...]:
+    """Shared memory data copy regions (offset, size), skip unused vehicle records"""
+    veh_total = live_vehicles(data.scoring.scoringInfo.mNumVehicles)
+    scor_used_end = SCOR_VEH_OFFSET + SCOR_VEH_SIZE * veh_total
+    tele_used_end = TELE_VEH_OFFSET + TELE_VEH_SIZE * veh_total
+    return (
+        (0, scor_used_end),  # generic, paths, scoring info & live scoring vehicles
+        (SCOR_VEH_END, tele_used_end - SCOR_VEH_END),  # live telemetry vehicles
+        (TELE_VEH_END, DATA_SIZE - TELE_VEH_END),  # remaining data
+    )
+
+
+def shared_memory_version(data: lmu_data.LMUObjectOut) -> tuple[float, ...]:
+    """Shared memory data version, scoring & live vehicles telemetry elapsed time
+
+    LMU shared memory has no update version counter, elapsed time of
+    each copied scoring & telemetry vehicle record is compared instead,
+    which only detects (best-effort) records updated while copying.
+    """
+    veh_total = live_vehicles(data.scoring.scoringInfo.mNumVehicles)
+    tele_veh = data.telemetry.telemInfo
+    return (
+        data.scoring.scoringInfo.mCurrentET,
+        *(tele_veh[index].mElapsedTime for index in range(veh_total)),
+    )
+
+
+def _no_publisher() -> None:
+    """Default new frame publisher, no subscriber"""
+
+
 class MMapDataSet:
-    """Create mmap data set"""
+    """Create mmap data set
+
+    Args:
+        mmap_control: mmap control class (or compatible factory) that takes
+            mmap name and data type, such as replay data control.
+    """
 
     __slots__ = (
         "shmm",
     )
 
-    def __init__(self) -> None:
-        self.shmm = MMapControl(LMUConstants.LMU_SHARED_MEMORY_FILE, lmu_data.LMUObjectOut)
+    def __init__(self, mmap_control: Callable = MMapControl) -> None:
+        self.shmm = MMapSnapshot(
+            mmap_control(LMUConstants.LMU_SHARED_MEMORY_FILE, lmu_data.LMUObjectOut),
+            shared_memory_version,
+            shared_memory_regions,
+        )
 
     def __del__(self):
         logger.info("sharedmemory: GC: MMapDataSet")
@@ -90,7 +151,7 @@ class MMapDataSet:
         """Create mmap instance
 
         Args:
-            access_mode: 0 = copy access, 1 = direct access.
+            access_mode: 0 = copy access, 1 = direct access, 2 = double-buffered snapshot access.
         """
         self.shmm.create(access_mode)
 
@@ -113,6 +174,8 @@ class SyncData:
         player_scor_index: Local player scoring index.
         player_scor: Local player scoring data.
         player_tele: Local player telemetry data.
+        tele_index_table: Scoring index to telemetry index table (list).
+        publish_frame: New frame publisher (callable).
     """
 
     __slots__ = (
@@ -120,26 +183,30 @@ class SyncData:
         "_update_thread",
         "_event",
         "_tele_indexes",
+        "tele_index_table",
         "paused",
         "override_player_index",
         "player_scor_index",
         "player_scor",
         "player_tele",
+        "publish_frame",
         "dataset",
     )
 
-    def __init__(self) -> None:
+    def __init__(self, mmap_control: Callable = MMapControl) -> None:
         self._updating = False
         self._update_thread = None
         self._event = threading.Event()
         self._tele_indexes = {_index: _index for _index in range(128)}
+        self.tele_index_table = list(range(MAX_VEHICLES))
 
         self.paused = False
         self.override_player_index = False
         self.player_scor_index = INVALID_INDEX
         self.player_scor = None
         self.player_tele = None
-        self.dataset = MMapDataSet()
+        self.publish_frame: Callable[[], None] = _no_publisher
+        self.dataset = MMapDataSet(mmap_control)
 
     def __del__(self):
         logger.info("sharedmemory: GC: SyncData")
@@ -161,7 +228,10 @@ class SyncData:
         """
         if not self.override_player_index:
             # Update scoring index
-            scor_idx = local_scoring_index(self.dataset.shmm.data.scoring.vehScoringInfo)
+            scor_idx = local_scoring_index(
+                self.dataset.shmm.data.scoring.vehScoringInfo,
+                self.dataset.shmm.data.scoring.scoringInfo.mNumVehicles,
+            )
             if scor_idx == INVALID_INDEX:
                 return False  # index not found, not synced
             self.player_scor_index = scor_idx
@@ -184,12 +254,22 @@ class SyncData:
         for tele_idx, veh_info in zip(range(veh_total), tele_data.telemInfo):
             tele_indexes[veh_info.mID] = tele_idx
 
-    def sync_tele_index(self, scor_idx: int) -> int:
-        """Sync telemetry index
+    def __update_tele_index_table(self) -> None:
+        """Update scoring index to telemetry index table, once per data update
 
         Use scoring index to find scoring mID,
         then match with telemetry mID in reference dictionary
         to find telemetry index.
+        """
+        tele_indexes = self._tele_indexes
+        table = self.tele_index_table
+        scor_data = self.dataset.shmm.data.scoring
+        veh_total = min(scor_data.scoringInfo.mNumVehicles, MAX_VEHICLES)
+        for scor_idx, veh_info in zip(range(veh_total), scor_data.vehScoringInfo):
+            table[scor_idx] = tele_indexes.get(veh_info.mID, INVALID_INDEX)
+
+    def sync_tele_index(self, scor_idx: int) -> int:
+        """Sync telemetry index from scoring index to telemetry index table
 
         Args:
             scor_idx: Player scoring index.
@@ -197,14 +277,13 @@ class SyncData:
         Returns:
             Player telemetry index.
         """
-        return self._tele_indexes.get(
-            self.dataset.shmm.data.scoring.vehScoringInfo[scor_idx].mID, INVALID_INDEX)
+        return self.tele_index_table[scor_idx]
 
     def start(self, access_mode: int) -> None:
         """Update & sync mmap data copy in separate thread
 
         Args:
-            access_mode: 0 = copy access, 1 = direct access.
+            access_mode: 0 = copy access, 1 = direct access, 2 = double-buffered snapshot access.
         """
         if self._updating:
             logger.warning("sharedmemory: UPDATING: already started")
@@ -217,6 +296,7 @@ class SyncData:
                 self.dataset.shmm.data.telemetry,
                 self._tele_indexes,
             )
+            self.__update_tele_index_table()
             if not self.__sync_player_data():
                 self.__sync_player_scor()
                 self.__sync_player_tele()
@@ -248,8 +328,11 @@ class SyncData:
         last_version_update = 0  # store last update version number
         last_update_time = 0.0
         data_freezed = True  # whether data is freezed
+        last_frame_scor = 0  # store last published scoring frame
+        last_frame_tele = 0  # store last published telemetry frame
         reset_counter = 0
-        update_delay = 0.5  # longer delay while inactive
+        scheduler = FrameScheduler()
+        update_delay = scheduler.idle_delay  # longer delay while inactive
 
         while not _event_wait(update_delay):
             self.dataset.update_mmap()
@@ -258,6 +341,7 @@ class SyncData:
                 self.dataset.shmm.data.telemetry,
                 self._tele_indexes,
             )
+            self.__update_tele_index_table()
             # Update player data & index
             if not data_freezed:
                 # Get player data
@@ -283,7 +367,7 @@ class SyncData:
             if data_freezed:
                 # Check while IN freeze state
                 if freezed_version != last_version_update:
-                    update_delay = 0.01
+                    scheduler.reset()
                     self.paused = data_freezed = False
                     logger.info(
                         "sharedmemory: UPDATING: resumed, data version %s",
@@ -292,7 +376,6 @@ class SyncData:
             # Check while NOT IN freeze state
             # Set freeze state if data stopped updating after 2s
             elif monotonic() - last_update_time > 2:
-                update_delay = 0.5
                 self.paused = data_freezed = True
                 freezed_version = last_version_update
                 logger.info(
@@ -300,11 +383,28 @@ class SyncData:
                     freezed_version,
                 )
 
+            # Publish new frame if either scoring or telemetry data updated
+            if data_freezed:
+                update_delay = scheduler.idle_delay
+            else:
+                frame_tele = self.player_tele.mElapsedTime
+                new_frame = last_frame_scor != last_version_update or last_frame_tele != frame_tele
+                if new_frame:
+                    last_frame_scor = last_version_update
+                    last_frame_tele = frame_tele
+                    self.publish_frame()
+                # Wake up at expected next frame
+                update_delay = scheduler.next_delay(new_frame)
+
         logger.info("sharedmemory: UPDATING: thread stopped")
 
 
 class LMUInfo:
-    """LMU shared memory data output"""
+    """LMU shared memory data output
+
+    Args:
+        mmap_control: mmap control class (or compatible factory), see MMapDataSet.
+    """
 
     __slots__ = (
         "_sync",
@@ -314,8 +414,8 @@ class LMUInfo:
         "_shmm",
     )
 
-    def __init__(self) -> None:
-        self._sync = SyncData()
+    def __init__(self, mmap_control: Callable = MMapControl) -> None:
+        self._sync = SyncData(mmap_control)
         self._access_mode = 0
         self._state_override = False
         self._active_state = False
@@ -337,7 +437,7 @@ class LMUInfo:
         """Set LMU mmap access mode
 
         Args:
-            mode: 0 = copy access, 1 = direct access
+            mode: 0 = copy access, 1 = direct access, 2 = double-buffered snapshot access
         """
         self._access_mode = mode
 
@@ -357,6 +457,20 @@ class LMUInfo:
         """Manual override player index"""
         self._sync.player_scor_index = min(max(index, INVALID_INDEX), MAX_VEHICLES - 1)
 
+    def setFramePublisher(self, publisher: Callable[[], None] = _no_publisher) -> None:
+        """Set new frame publisher, called once per new frame from updating thread"""
+        self._sync.publish_frame = publisher
+
+    def captureSources(self) -> tuple[tuple[str, Callable, Callable | None], ...]:
+        """Data sources for telemetry capture
+
+        Returns:
+            Tuple of (mmap name, data getter, data regions function or None for full data).
+        """
+        return (
+            (LMUConstants.LMU_SHARED_MEMORY_FILE, lambda: self._shmm.data, shared_memory_regions),
+        )
+
     @property
     def lmuScorInfo(self) -> lmu_data.LMUScoringInfo:
         """LMU scoring info data"""
@@ -384,7 +498,7 @@ class LMUInfo:
         """
         if index is None:
             return self._sync.player_tele
-        return self._shmm.data.telemetry.telemInfo[self._sync.sync_tele_index(index)]
+        return self._shmm.data.telemetry.telemInfo[self._sync.tele_index_table[index]]
 
     @property
     def lmuGeneric(self) -> lmu_data.LMUGeneric:
@@ -429,6 +543,13 @@ def test_api():
     info.start()
     sleep(0.2)
 
+    print(SEPARATOR)
+    print("Test API - Restart (snapshot access)")
+    info.stop()
+    info.setMode(2)  # set double-buffered snapshot access
+    info.start()
+    sleep(0.2)
+
     print(SEPARATOR)
     print("Test API - Restart")
     info.stop()
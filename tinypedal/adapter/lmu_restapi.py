@@ -111,7 +111,7 @@ def lmu_restapi_tasks() -> tuple[RestAPITask, ...]:
         RestAPITask("/rest/sessions/weather", res_weatherforecast, "enable_weather_info", False, 0.1),
         RestAPITask("/rest/sessions", res_sessionsinfo, "enable_session_info", False, 0.1),
         RestAPITask("/rest/garage/getPlayerGarageData", res_garagesetup, "enable_garage_setup_info", False, 0.1),
-        RestAPITask("/rest/garage/UIScreen/RepairAndRefuel", res_currentstint, "enable_vehicle_info", True, 0.2),
-        RestAPITask("/rest/strategy/pitstop-estimate", res_pitstoptime, "enable_vehicle_info", True, 1.0),
-        RestAPITask("/rest/strategy/usage", res_stintusage, "enable_energy_remaining", True, 1.0),
+        RestAPITask("/rest/garage/UIScreen/RepairAndRefuel", res_currentstint, "enable_vehicle_info", True, 0.2, 2),
+        RestAPITask("/rest/strategy/pitstop-estimate", res_pitstoptime, "enable_vehicle_info", True, 1.0, 1),
+        RestAPITask("/rest/strategy/usage", res_stintusage, "enable_energy_remaining", True, 1.0, 1),
     )
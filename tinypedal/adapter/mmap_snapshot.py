@@ -0,0 +1,134 @@
+#  TinyPedal is an open-source overlay application for racing simulation.
+#  Copyright (C) 2022-2026 TinyPedal developers, see contributors.md file
+#
+#  This file is part of TinyPedal.
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Double-buffered mmap snapshot
+"""
+
+from __future__ import annotations
+
+import ctypes
+from typing import Any, Callable
+
+
+def copy_struct(struct_data):
+    """Allow to copy ctypes struct data with __slots__"""
+    return type(struct_data).from_buffer_copy(
+        ctypes.string_at(
+            ctypes.byref(struct_data),
+            ctypes.sizeof(struct_data),
+        )
+    )
+
+
+class MMapSnapshot:
+    """Double-buffered mmap snapshot
+
+    Wrap mmap control with same interface. In snapshot access mode,
+    read mmap with direct access, copy data into one of two preallocated
+    buffers only while data version changed, then swap published buffer.
+    Readers always get a complete frame without per-update allocation.
+    Only data regions in use (header & live vehicles) are copied.
+
+    Attributes:
+        data: published data (complete frame).
+    """
+
+    __slots__ = (
+        "_mmap",
+        "_version_key",
+        "_copy_regions",
+        "_version",
+        "_buffers",
+        "_back_index",
+        "data",
+    )
+
+    def __init__(
+        self, mmap_control: Any, version_key: Callable, copy_regions: Callable
+    ) -> None:
+        """
+        Args:
+            mmap_control: mmap control instance.
+            version_key: function that takes data and returns data version,
+                or None if data is being updated.
+            copy_regions: function that takes data and returns data regions
+                (offset, size) to copy.
+        """
+        self._mmap = mmap_control
+        self._version_key = version_key
+        self._copy_regions = copy_regions
+        self._version = None
+        self._buffers = None
+        self._back_index = 0
+        self.data = None
+
+    def create(self, access_mode: int, rf2_pid: str | None = None) -> None:
+        """Create mmap instance
+
+        Args:
+            access_mode: 0 = copy access, 1 = direct access, 2 = double-buffered snapshot access.
+            rf2_pid: rF2 Process ID for accessing server data, None if not supported by mmap control.
+        """
+        pid_args = () if rf2_pid is None else (rf2_pid,)
+        if access_mode != 2:
+            self._buffers = None
+            self._mmap.create(access_mode, *pid_args)
+            self.data = self._mmap.data
+            return
+        self._mmap.create(1, *pid_args)
+        live_data = self._mmap.data
+        data_type = type(live_data)
+        self._buffers = (data_type(), data_type())
+        self._back_index = 0
+        self._version = None
+        self.__copy(live_data, True)  # initial copy, skip version check
+
+    def close(self) -> None:
+        """Close mmap instance"""
+        if self._buffers is None:
+            # Make final copy before close, otherwise mmap won't close if using direct access
+            self.data = copy_struct(self.data)
+        self._mmap.close()
+
+    def update(self) -> None:
+        """Update mmap data"""
+        if self._buffers is None:
+            self._mmap.update()
+            self.data = self._mmap.data
+            return
+        live_data = self._mmap.data
+        version = self._version_key(live_data)
+        if version is not None and version != self._version:
+            self.__copy(live_data)
+
+    def __copy(self, live_data: ctypes.Structure, skip_check: bool = False) -> None:
+        """Copy data into back buffer, then swap published buffer
+
+        Discard torn copy if data updated while copying, retry on next update.
+        """
+        back_data = self._buffers[self._back_index]
+        back_address = ctypes.addressof(back_data)
+        live_address = ctypes.addressof(live_data)
+        for offset, size in self._copy_regions(live_data):
+            ctypes.memmove(back_address + offset, live_address + offset, size)
+        version = self._version_key(back_data)
+        if skip_check or version is not None and version == self._version_key(live_data):
+            self._version = version
+            self.data = back_data  # atomic swap
+            self._back_index ^= 1
@@ -0,0 +1,487 @@
+#  TinyPedal is an open-source overlay application for racing simulation.
+#  Copyright (C) 2022-2026 TinyPedal developers, see contributors.md file
+#
+#  This file is part of TinyPedal.
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Telemetry capture & replay
+
+Capture file layout (little-endian):
+    header: magic, format version, metadata length.
+    metadata: UTF-8 encoded JSON (API name, capture time, data sources).
+    frames: zlib compressed stream of frame records.
+
+Frame record:
+    frame header: timestamp (seconds since capture started), frame index,
+        number of changed sources.
+    per changed source: source index, data size, followed by data bytes
+        XOR previous data bytes of same source (mostly zero, compress well).
+"""
+
+from __future__ import annotations
+
+import ctypes
+import json
+import logging
+import queue
+import struct
+import threading
+import zlib
+from time import monotonic, strftime
+from typing import Callable
+
+logger = logging.getLogger(__name__)
+
+CAPTURE_MAGIC = b"TPRC"
+CAPTURE_VERSION = 1
+CAPTURE_HEADER = struct.Struct("<4sHI")
+FRAME_HEADER = struct.Struct("<dIH")
+SOURCE_HEADER = struct.Struct("<HI")
+COMPRESS_LEVEL = 1  # fast compression, to keep up with frame rate
+READ_CHUNK_SIZE = 65536
+
+
+def xor_bytes(data: bytes, last_data: bytes) -> bytes:
+    """XOR two bytes of same size"""
+    size = len(data)
+    return (
+        int.from_bytes(data, "little") ^ int.from_bytes(last_data, "little")
+    ).to_bytes(size, "little")
+
+
+def data_size(data: ctypes.Structure, copy_regions: Callable | None) -> int:
+    """Data size in use, from start of data to end of last copy region"""
+    if copy_regions is None:
+        return ctypes.sizeof(data)
+    return max(offset + size for offset, size in copy_regions(data))
+
+
+def read_metadata(file) -> tuple[dict, int]:
+    """Read capture file metadata
+
+    Returns:
+        Metadata dictionary, frame data offset.
+
+    Raises:
+        ValueError: if file fails format check.
+    """
+    header = file.read(CAPTURE_HEADER.size)
+    if len(header) < CAPTURE_HEADER.size:
+        raise ValueError("truncated header")
+    magic, version, metadata_size = CAPTURE_HEADER.unpack(header)
+    if magic != CAPTURE_MAGIC or version != CAPTURE_VERSION:
+        raise ValueError("unsupported format")
+    metadata = json.loads(file.read(metadata_size).decode("utf-8"))
+    return metadata, CAPTURE_HEADER.size + metadata_size
+
+
+class FrameRecorder:
+    """Telemetry frame recorder
+
+    Capture raw API data on each published frame from API updating thread,
+    and write compressed delta frames to file in separate writing thread.
+
+    Args:
+        filename_full: full capture file path with extension.
+        api_name: API full name.
+        sources: tuple of (mmap name, data getter, data regions function or None for full data).
+    """
+
+    __slots__ = (
+        "_filename",
+        "_api_name",
+        "_sources",
+        "_queue",
+        "_write_thread",
+        "_start_time",
+        "recording",
+    )
+
+    def __init__(self, filename_full: str, api_name: str, sources: tuple) -> None:
+        self._filename = filename_full
+        self._api_name = api_name
+        self._sources = sources
+        self._queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._write_thread = None
+        self._start_time = 0.0
+        self.recording = False
+
+    def start(self) -> None:
+        """Create capture file and start writing thread
+
+        Raises:
+            OSError: if failed to create capture file.
+        """
+        if self.recording:
+            return
+        metadata = json.dumps({
+            "api_name": self._api_name,
+            "capture_time": strftime("%Y-%m-%d %H:%M:%S"),
+            "sources": [
+                {
+                    "name": name,
+                    "struct": type(getter()).__name__,
+                    "size": ctypes.sizeof(getter()),
+                }
+                for name, getter, _ in self._sources
+            ],
+        }).encode("utf-8")
+        file = open(self._filename, "wb")
+        file.write(CAPTURE_HEADER.pack(CAPTURE_MAGIC, CAPTURE_VERSION, len(metadata)))
+        file.write(metadata)
+        sizes = tuple(ctypes.sizeof(getter()) for _, getter, _ in self._sources)
+        self._start_time = monotonic()
+        self.recording = True
+        self._write_thread = threading.Thread(
+            target=self.__write, args=(file, sizes), daemon=True)
+        self._write_thread.start()
+        logger.info("CAPTURE: started: %s", self._filename)
+
+    def stop(self) -> None:
+        """Stop capture, wait for queued frames written and close file"""
+        if not self.recording:
+            return
+        self.recording = False
+        self._queue.put(None)
+        self._write_thread.join()
+        self._write_thread = None
+        logger.info("CAPTURE: stopped: %s", self._filename)
+
+    def capture(self) -> None:
+        """Capture data of current frame, called from API updating thread"""
+        if not self.recording:
+            return
+        frame = []
+        for _, getter, copy_regions in self._sources:
+            data = getter()
+            frame.append(
+                ctypes.string_at(ctypes.addressof(data), data_size(data, copy_regions))
+            )
+        self._queue.put((monotonic() - self._start_time, frame))
+
+    def publisher(self, publish: Callable[[], None]) -> Callable[[], None]:
+        """Create frame publisher that captures frame before publishing"""
+        capture = self.capture
+
+        def capture_publish() -> None:
+            capture()
+            publish()
+
+        return capture_publish
+
+    def __write(self, file, sizes: tuple[int, ...]) -> None:
+        """Write compressed delta frames to file"""
+        compressor = zlib.compressobj(COMPRESS_LEVEL)
+        last_frame = tuple(bytearray(size) for size in sizes)
+        frame_index = 0
+        total_size = 0
+        _get = self._queue.get
+        try:
+            while True:
+                captured = _get()
+                if captured is None:
+                    break
+                timestamp, frame = captured
+                records = []
+                for source_index, (data, last_data) in enumerate(zip(frame, last_frame)):
+                    size = len(data)
+                    if data == last_data[:size]:
+                        continue  # skip unchanged source
+                    records.append(SOURCE_HEADER.pack(source_index, size))
+                    records.append(xor_bytes(data, last_data[:size]))
+                    last_data[:size] = data
+                if not records:
+                    continue
+                records.insert(0, FRAME_HEADER.pack(timestamp, frame_index, len(records) // 2))
+                total_size += file.write(compressor.compress(b"".join(records)))
+                frame_index += 1
+            total_size += file.write(compressor.flush())
+        except (OSError, ValueError):
+            logger.error("CAPTURE: failed writing: %s", self._filename)
+        finally:
+            file.close()
+        logger.info("CAPTURE: %s frames, %s bytes compressed", frame_index, total_size)
+
+
+class ReplayControl:
+    """Replay data control
+
+    Same interface as mmap control, data is provided by replay player.
+
+    Attributes:
+        mmap_name: captured mmap name.
+        struct_type: data type.
+        data: replay data (new data copy per changed frame).
+    """
+
+    __slots__ = (
+        "_player",
+        "mmap_name",
+        "struct_type",
+        "data",
+    )
+
+    def __init__(self, player: ReplayPlayer, mmap_name: str, struct_type: type) -> None:
+        self._player = player
+        self.mmap_name = mmap_name
+        self.struct_type = struct_type
+        self.data = struct_type()
+
+    def create(self, access_mode: int = 0, rf2_pid: str = "") -> None:
+        """Create replay instance, primary control starts replay from beginning"""
+        if self._player.is_primary(self):
+            self._player.rewind()
+
+    def close(self) -> None:
+        """Close replay instance"""
+        if self._player.is_primary(self):
+            self._player.close()
+
+    def update(self) -> None:
+        """Update replay data, primary control advances replay frames"""
+        if self._player.is_primary(self):
+            self._player.advance()
+
+
+class ReplayPlayer:
+    """Telemetry replay player
+
+    Decode capture file frames as stream, and replay data through replay controls.
+    First created replay control is primary control, which starts, advances,
+    and closes replay; other controls only receive data.
+
+    Args:
+        speed: replay speed multiplier. 0 to advance one frame per update (as fast as possible).
+        loop: whether restart replay from beginning after reached end of file.
+    """
+
+    __slots__ = (
+        "_filename",
+        "_file",
+        "_frame_offset",
+        "_decompressor",
+        "_pending",
+        "_buffers",
+        "_controls",
+        "_source_controls",
+        "_next_frame",
+        "_start_time",
+        "speed",
+        "loop",
+        "finished",
+        "metadata",
+    )
+
+    def __init__(self, speed: float = 1.0, loop: bool = False) -> None:
+        self._filename = ""
+        self._file = None
+        self._frame_offset = 0
+        self._decompressor = None
+        self._pending = bytearray()
+        self._buffers: list[bytearray] = []
+        self._controls: list[ReplayControl] = []
+        self._source_controls: list[ReplayControl | None] = []
+        self._next_frame = None
+        self._start_time = 0.0
+        self.speed = speed
+        self.loop = loop
+        self.finished = True
+        self.metadata: dict = {}
+
+    def open(self, filename_full: str) -> None:
+        """Open capture file & read metadata
+
+        Raises:
+            OSError: if failed to open capture file.
+            ValueError: if file fails format check.
+        """
+        self.close()
+        self._filename = ""
+        self.metadata = {}
+        self._buffers.clear()
+        self._source_controls.clear()
+        with open(filename_full, "rb") as file:
+            metadata, frame_offset = read_metadata(file)
+        self._filename = filename_full
+        self.metadata = metadata
+        self._frame_offset = frame_offset
+        self._buffers.extend(bytearray(source["size"]) for source in metadata["sources"])
+        self._source_controls.extend(None for _ in self._buffers)
+        for replay_control in self._controls:
+            self.__link(replay_control)
+
+    @property
+    def api_name(self) -> str:
+        """Captured API name"""
+        return self.metadata.get("api_name", "")
+
+    def control(self, mmap_name: str, struct_type: type) -> ReplayControl:
+        """Create replay control, compatible with mmap control class arguments"""
+        replay_control = ReplayControl(self, mmap_name, struct_type)
+        self._controls.append(replay_control)
+        self.__link(replay_control)
+        return replay_control
+
+    def is_primary(self, replay_control: ReplayControl) -> bool:
+        """Whether is primary replay control"""
+        return replay_control is self._controls[0]
+
+    def __link(self, replay_control: ReplayControl) -> None:
+        """Link replay control to captured data source with same mmap name"""
+        for source_index, source in enumerate(self.metadata.get("sources", ())):
+            if source["name"] == replay_control.mmap_name:
+                break
+        else:
+            if self.metadata:
+                logger.warning("REPLAY: source not found: %s", replay_control.mmap_name)
+            return
+        struct_size = ctypes.sizeof(replay_control.struct_type)
+        if source["size"] != struct_size:
+            logger.warning(
+                "REPLAY: source size mismatch: %s, %s (capture) != %s (local)",
+                replay_control.mmap_name, source["size"], struct_size,
+            )
+            buffer = self._buffers[source_index]
+            if len(buffer) < struct_size:
+                buffer.extend(bytes(struct_size - len(buffer)))
+        self._source_controls[source_index] = replay_control
+
+    def rewind(self) -> None:
+        """Reopen capture file and replay from first frame"""
+        self.close()
+        if not self._filename:
+            return
+        try:
+            self._file = open(self._filename, "rb")
+        except OSError:
+            logger.error("REPLAY: failed opening: %s", self._filename)
+            return
+        self._file.seek(self._frame_offset)
+        self._decompressor = zlib.decompressobj()
+        self._pending.clear()
+        for buffer in self._buffers:
+            buffer[:] = bytes(len(buffer))
+        self._next_frame = None
+        self._start_time = monotonic()
+        self.finished = False
+        logger.info("REPLAY: started: %s", self._filename)
+        self.__apply(self.__read_frame())  # load first frame
+
+    def close(self) -> None:
+        """Close capture file"""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        self._decompressor = None
+        self.finished = True
+
+    def advance(self) -> None:
+        """Advance replay frames to current replay time"""
+        if self.finished:
+            return
+        if self.speed <= 0:
+            frame = self.__read_frame()
+            if frame is not None:
+                self.__apply(frame)
+                return
+        else:
+            replay_time = (monotonic() - self._start_time) * self.speed
+            changed = set()
+            while True:
+                if self._next_frame is None:
+                    self._next_frame = self.__read_frame()
+                    if self._next_frame is None:
+                        break
+                if self._next_frame[0] > replay_time:
+                    break
+                self.__apply_changes(self._next_frame, changed)
+                self._next_frame = None
+            self.__update_controls(changed)
+            if self._next_frame is not None:
+                return
+        # End of file
+        if self.loop:
+            self.rewind()
+        else:
+            self.close()
+            logger.info("REPLAY: finished: %s", self._filename)
+
+    def __apply(self, frame: tuple | None) -> None:
+        """Apply single frame and update controls"""
+        if frame is not None:
+            changed = set()
+            self.__apply_changes(frame, changed)
+            self.__update_controls(changed)
+
+    def __apply_changes(self, frame: tuple, changed: set) -> None:
+        """Apply frame changes to data buffers"""
+        buffers = self._buffers
+        for source_index, delta in frame[1]:
+            buffer = buffers[source_index]
+            size = len(delta)
+            buffer[:size] = xor_bytes(delta, buffer[:size])
+            changed.add(source_index)
+
+    def __update_controls(self, changed: set) -> None:
+        """Update replay control data from changed data buffers"""
+        for source_index in changed:
+            replay_control = self._source_controls[source_index]
+            if replay_control is not None:
+                replay_control.data = replay_control.struct_type.from_buffer_copy(
+                    self._buffers[source_index])
+
+    def __read(self, size: int) -> bytes | None:
+        """Read decompressed bytes, None if reached end of file"""
+        pending = self._pending
+        while len(pending) < size:
+            chunk = self._file.read(READ_CHUNK_SIZE)
+            if not chunk:
+                pending.extend(self._decompressor.flush())
+                if len(pending) < size:
+                    return None
+                break
+            pending.extend(self._decompressor.decompress(chunk))
+        output = bytes(pending[:size])
+        del pending[:size]
+        return output
+
+    def __read_frame(self) -> tuple | None:
+        """Read next frame
+
+        Returns:
+            (timestamp, tuple of (source index, delta bytes)), or None if reached end of file.
+        """
+        if self._file is None:
+            return None
+        try:
+            header = self.__read(FRAME_HEADER.size)
+            if header is None:
+                return None
+            timestamp, _, changed_sources = FRAME_HEADER.unpack(header)
+            changes = []
+            for _ in range(changed_sources):
+                source_header = self.__read(SOURCE_HEADER.size)
+                if source_header is None:
+                    return None
+                source_index, size = SOURCE_HEADER.unpack(source_header)
+                delta = self.__read(size)
+                if delta is None or source_index >= len(self._buffers):
+                    return None
+                changes.append((source_index, delta))
+        except (OSError, zlib.error):
+            logger.error("REPLAY: failed reading: %s", self._filename)
+            return None
+        return timestamp, changes
@@ -27,14 +27,16 @@ import json
 import logging
 import threading
 from itertools import chain
-from typing import Any, Callable, NamedTuple
+from time import monotonic
+from typing import Any, Callable, Hashable, NamedTuple
 
 from .. import realtime_state
-from ..async_request import http_get, set_header_get
+from ..async_request import HttpConnectionPool, set_header_get
 from ..const_common import TYPE_JSON
 
 logger = logging.getLogger(__name__)
 json_decoder = json.JSONDecoder()
+_UNSET = object()  # placeholder for data not yet updated
 
 
 class HttpSetup(NamedTuple):
@@ -46,6 +48,7 @@ class HttpSetup(NamedTuple):
         timeout: timeout seconds.
         retry: number of retries.
         retry_delay: delay retry in seconds.
+        pool: keep-alive connection pool shared by all tasks.
     """
 
     host: str
@@ -53,6 +56,7 @@ class HttpSetup(NamedTuple):
     timeout: float
     retry: int
     retry_delay: float
+    pool: HttpConnectionPool
 
 
 class RestAPITask(NamedTuple):
@@ -64,6 +68,7 @@ class RestAPITask(NamedTuple):
         condition: enable condition check.
         repeated: is repeated or one time task.
         interval: minimum update interval.
+        priority: repeated task scheduling priority, higher value runs first.
     """
 
     path: str
@@ -71,6 +76,7 @@ class RestAPITask(NamedTuple):
     condition: str
     repeated: bool
     interval: float
+    priority: int = 0
 
 
 class ResOutput(NamedTuple):
@@ -99,6 +105,10 @@ class ResOutput(NamedTuple):
                 setattr(output, self.name, self.default)
                 return False
             data = data.get(key)
+        return self.output(output, data)
+
+    def output(self, output: object, data: Any) -> bool:
+        """Output extracted data"""
         # Not exist, set to default
         if data is None:
             setattr(output, self.name, self.default)
@@ -108,6 +118,194 @@ class ResOutput(NamedTuple):
         return True
 
 
+class ExtractPlan:
+    """Resource data extraction plan
+
+    Compile output key sequences into a key tree, so that shared keys
+    are looked up once, and only configured data are extracted from resource.
+    Extracted data is compared with last update, and only changed data
+    is parsed and output.
+
+    Attributes:
+        outputs: resource data output set.
+    """
+
+    __slots__ = (
+        "outputs",
+        "_tree",
+        "_last_data",
+    )
+
+    def __init__(self, outputs: tuple[ResOutput, ...]):
+        self.outputs = outputs
+        self._tree = build_key_tree(outputs)
+        self._last_data: list[Any] = [_UNSET] * len(outputs)
+
+    def extract(self, resource: Any) -> list[Any]:
+        """Extract data for each output from resource, None if not exist"""
+        extracted = [None] * len(self.outputs)
+        walk_key_tree(resource, self._tree, extracted)
+        return extracted
+
+    def update(self, output: object, resource: Any) -> bool:
+        """Update changed data, return whether any data available"""
+        data_available = False
+        last_data = self._last_data
+        for index, (res, data) in enumerate(zip(self.outputs, self.extract(resource))):
+            if data is not None:
+                data_available = True
+            if last_data[index] == data:  # skip unchanged
+                continue
+            last_data[index] = data
+            res.output(output, data)
+        return data_available
+
+
+def build_key_tree(outputs: tuple[ResOutput, ...]) -> tuple:
+    """Build key tree from output key sequences
+
+    Each tree node contains a tuple of output indexes, which key sequence
+    ends at this node, and a tuple of key & sub node pairs.
+    """
+    root: tuple[list, dict] = ([], {})
+    for index, res in enumerate(outputs):
+        node = root
+        for key in res.keys:
+            node = node[1].setdefault(key, ([], {}))
+        node[0].append(index)
+    return freeze_key_tree(root)
+
+
+def freeze_key_tree(node: tuple[list, dict]) -> tuple:
+    """Convert key tree node to tuple"""
+    return tuple(node[0]), tuple((key, freeze_key_tree(sub_node)) for key, sub_node in node[1].items())
+
+
+def walk_key_tree(data: Any, node: tuple, extracted: list) -> None:
+    """Walk key tree and extract data"""
+    indexes, branches = node
+    for index in indexes:
+        extracted[index] = data
+    if branches and isinstance(data, dict):
+        for key, sub_node in branches:
+            sub_data = data.get(key)
+            if sub_data is not None:
+                walk_key_tree(sub_data, sub_node, extracted)
+
+
+class ScheduledTask:
+    """Scheduled repeated task state
+
+    Attributes:
+        path: resource url path.
+        request: request header.
+        plan: resource data extraction plan.
+        priority: scheduling priority, higher value runs first.
+        min_interval: minimum update interval (seconds).
+        interval: current update interval (seconds).
+        next_time: next update time (monotonic seconds).
+        last_hash: last resource hash.
+        change_rate: observed data change rate (0 to 1), per request.
+    """
+
+    __slots__ = (
+        "path",
+        "request",
+        "plan",
+        "priority",
+        "min_interval",
+        "interval",
+        "next_time",
+        "last_hash",
+        "change_rate",
+    )
+
+    def __init__(
+        self, path: str, request: bytes, plan: ExtractPlan, priority: int, min_interval: float):
+        self.path = path
+        self.request = request
+        self.plan = plan
+        self.priority = priority
+        self.min_interval = min_interval
+        self.interval = min_interval
+        self.next_time = 0.0
+        self.last_hash = -1
+        self.change_rate = 1.0
+
+
+class RequestScheduler:
+    """Rest API request scheduler
+
+    Run all repeated tasks from a single loop with a global request budget,
+    so load on game web server is bounded regardless of number of tasks.
+
+    Task update interval resets to minimum on data change, and grows by half
+    (up to max interval) while data unchanged. Due tasks are ordered by priority,
+    then by observed change rate. Burst resets all tasks to minimum interval,
+    such as on session change or pit entry.
+
+    Args:
+        budget: max number of requests per second for all tasks.
+        max_interval: max update interval (seconds) while data unchanged.
+    """
+
+    __slots__ = (
+        "_tasks",
+        "_max_interval",
+        "request_delay",
+    )
+
+    def __init__(self, budget: float, max_interval: float = 5.0):
+        self._tasks: list[ScheduledTask] = []
+        self._max_interval = max_interval
+        self.request_delay = 1 / max(budget, 1)
+
+    def add(self, task: ScheduledTask) -> None:
+        """Add task, scheduled to run immediately"""
+        self._tasks.append(task)
+
+    def burst(self) -> None:
+        """Reset all tasks to minimum interval, and schedule to run immediately"""
+        for task in self._tasks:
+            task.interval = task.min_interval
+            task.next_time = 0.0
+
+    def next_task(self, now: float) -> ScheduledTask | None:
+        """Get next due task, None if no task due"""
+        next_task = None
+        for task in self._tasks:
+            if task.next_time > now:
+                continue
+            if next_task is None or (
+                task.priority, task.change_rate, -task.next_time
+            ) > (
+                next_task.priority, next_task.change_rate, -next_task.next_time
+            ):
+                next_task = task
+        return next_task
+
+    def next_delay(self, now: float) -> float:
+        """Delay (seconds) until next task due"""
+        if not self._tasks:
+            return self._max_interval
+        return max(min(task.next_time for task in self._tasks) - now, 0.0)
+
+    def update(self, task: ScheduledTask, new_hash: int, now: float) -> None:
+        """Update task interval from data change"""
+        changed = task.last_hash != new_hash
+        task.change_rate += (changed - task.change_rate) * 0.2
+        if changed:
+            task.last_hash = new_hash
+            task.interval = task.min_interval
+        elif task.interval < self._max_interval:  # increase update interval while no new data
+            task.interval = min(task.interval * 1.5, self._max_interval)
+        task.next_time = now + task.interval
+
+
+def _no_event() -> None:
+    """Default session event source, no event"""
+
+
 class RestAPIConnector:
     """Rest API connector"""
 
@@ -120,6 +318,8 @@ class RestAPIConnector:
         "_update_thread",
         "_active_interval",
         "_event",
+        "_event_source",
+        "_scheduler",
     )
 
     def __init__(self, taskset: tuple, dataset: object):
@@ -132,6 +332,8 @@ class RestAPIConnector:
         self._update_thread = None
         self._active_interval = 0.2
         self._event = threading.Event()
+        self._event_source: Callable[[], Hashable] = _no_event
+        self._scheduler = RequestScheduler(10)
 
     def __del__(self):
         logger.info("RestAPI: GC: RestAPIConnector")
@@ -141,6 +343,15 @@ class RestAPIConnector:
         self._cfg = config
         self._active_interval = max(self._cfg["restapi_update_interval"], 100) / 1000
 
+    def setEventSource(self, event_source: Callable[[], Hashable] = _no_event):
+        """Set session event source
+
+        Args:
+            event_source: function that returns session event state,
+                all repeated tasks burst to minimum interval on state change.
+        """
+        self._event_source = event_source
+
     def start(self):
         """Start update thread"""
         if not self._updating and self._cfg["enable_restapi_access"]:
@@ -195,10 +406,13 @@ class RestAPIConnector:
             timeout=min(max(self._cfg["connection_timeout"], 0.5), 10),
             retry=min(max(int(self._cfg["connection_retry"]), 0), 10),
             retry_delay=min(max(self._cfg["connection_retry_delay"], 0), 60),
+            pool=HttpConnectionPool(self._cfg["url_host"], self._cfg["url_port"]),
         )
+        self._scheduler = RequestScheduler(self._cfg["restapi_max_requests_per_second"])
         # Run all tasks while on track, this blocks until tasks cancelled
         logger.info("RestAPI: all tasks started")
-        asyncio.run(self.task_init(self.sort_taskset(sim_http, active_task_sim, self._taskset)))
+        asyncio.run(self.task_init(
+            sim_http, self.sort_taskset(sim_http, active_task_sim, self._taskset)))
         logger.info("RestAPI: all tasks stopped")
         # Reset when finished
         reset_to_default(self._dataset, active_task_sim)
@@ -210,10 +424,13 @@ class RestAPIConnector:
                 active_task[task.path] = task.outputs
                 update_interval = max(task.interval, self._active_interval)
                 yield asyncio.create_task(
-                    self.fetch(http, task.path, task.outputs, task.repeated, update_interval)
+                    self.fetch(
+                        http, task.path, ExtractPlan(task.outputs), task.repeated,
+                        update_interval, task.priority)
                 )
+        yield asyncio.create_task(self.update_scheduled(http))
 
-    async def task_init(self, *task_generator):
+    async def task_init(self, http: HttpSetup, *task_generator):
         """Run repeatedly updating task"""
         task_group = tuple(chain(*task_generator))
         # Task control
@@ -224,6 +441,8 @@ class RestAPIConnector:
                 await task
             except (asyncio.CancelledError, BaseException):
                 pass
+        # Close kept alive connections before event loop closed
+        await http.pool.close()
 
     async def task_control(self, task_group: tuple[asyncio.Task, ...]):
         """Control task running state"""
@@ -237,20 +456,21 @@ class RestAPIConnector:
             task.cancel()
 
     async def fetch(
-        self, http: HttpSetup, uri_path: str, output_set: tuple[ResOutput, ...],
-        repeat: bool = False, min_interval: float = 0.01):
-        """Fetch data and verify"""
-        data_available = await self.update_once(http, uri_path, output_set)
+        self, http: HttpSetup, uri_path: str, plan: ExtractPlan,
+        repeat: bool = False, min_interval: float = 0.01, priority: int = 0):
+        """Fetch data and verify, add repeated task to scheduler"""
+        data_available = await self.update_once(http, uri_path, plan)
         if not data_available:
             logger.info("RestAPI: MISSING: %s", uri_path)
         elif not repeat:
             logger.info("RestAPI: ACTIVE: %s (one time)", uri_path)
         else:
             logger.info("RestAPI: ACTIVE: %s (%sms)", uri_path, int(min_interval * 1000))
-            await self.update_repeat(http, uri_path, output_set, min_interval)
+            self._scheduler.add(ScheduledTask(
+                uri_path, set_header_get(uri_path, http.host), plan, priority, min_interval))
 
     async def update_once(
-        self, http: HttpSetup, uri_path: str, output_set: tuple[ResOutput, ...]) -> bool:
+        self, http: HttpSetup, uri_path: str, plan: ExtractPlan) -> bool:
         """Update once and verify"""
         request_header = set_header_get(uri_path, http.host)
         data_available = False
@@ -268,28 +488,29 @@ class RestAPIConnector:
                 await asyncio.sleep(http.retry_delay)
                 continue
             # Output
-            for res in output_set:
-                if res.update(self._dataset, resource_output):
-                    data_available = True
+            data_available = plan.update(self._dataset, resource_output)
             break
         return data_available
 
-    async def update_repeat(
-        self, http: HttpSetup, uri_path: str, output_set: tuple[ResOutput, ...], min_interval: float):
-        """Update repeat"""
-        request_header = set_header_get(uri_path, http.host)
-        interval = min_interval
-        last_hash = new_hash = -1
+    async def update_scheduled(self, http: HttpSetup):
+        """Update repeated tasks from scheduler, one request at a time"""
+        scheduler = self._scheduler
+        event_source = self._event_source
+        last_event = event_source()
         while not self._task_cancel:  # use task control to cancel & exit loop
-            new_hash = await output_resource(self._dataset, request_header, http, output_set, last_hash)
-            if last_hash != new_hash:
-                last_hash = new_hash
-                interval = min_interval
-            elif interval < 5:  # increase update interval while no new data
-                interval += interval / 2
-                if interval > 5:
-                    interval = 5
-            await asyncio.sleep(interval)
+            # Burst on session event
+            new_event = event_source()
+            if last_event != new_event:
+                last_event = new_event
+                scheduler.burst()
+            now = monotonic()
+            task = scheduler.next_task(now)
+            if task is None:  # check session event at least every 100ms
+                await asyncio.sleep(min(scheduler.next_delay(now), 0.1))
+                continue
+            new_hash = await output_resource(self._dataset, task.request, http, task.plan, task.last_hash)
+            scheduler.update(task, new_hash, monotonic())
+            await asyncio.sleep(scheduler.request_delay)
 
 
 def reset_to_default(dataset: object, active_task: dict[str, tuple[ResOutput, ...]]):
@@ -305,24 +526,23 @@ def reset_to_default(dataset: object, active_task: dict[str, tuple[ResOutput, ..
 async def get_resource(request: bytes, http: HttpSetup) -> Any | str:
     """Get resource from REST API"""
     try:
-        async with http_get(request, http.host, http.port, http.timeout) as raw_bytes:
-            return json_decoder.decode(raw_bytes.decode())
+        raw_bytes = await http.pool.get(request, http.timeout)
+        return json_decoder.decode(raw_bytes.decode())
     except (AttributeError, TypeError, IndexError, KeyError, ValueError,
             OSError, TimeoutError, BaseException):
         return "INVALID"
 
 
 async def output_resource(
-    dataset: object, request: bytes, http: HttpSetup, output_set: tuple[ResOutput, ...], last_hash: int) -> int:
+    dataset: object, request: bytes, http: HttpSetup, plan: ExtractPlan, last_hash: int) -> int:
     """Get resource from REST API and output data, skip unnecessary checking"""
     try:
-        async with http_get(request, http.host, http.port, http.timeout) as raw_bytes:
-            new_hash = hash(raw_bytes)
-            if last_hash != new_hash:
-                resource_output = json_decoder.decode(raw_bytes.decode())
-                for res in output_set:
-                    res.update(dataset, resource_output)
-            return new_hash
+        raw_bytes = await http.pool.get(request, http.timeout)
+        new_hash = hash(raw_bytes)
+        if last_hash != new_hash:
+            resource_output = json_decoder.decode(raw_bytes.decode())
+            plan.update(dataset, resource_output)
+        return new_hash
     except (AttributeError, TypeError, IndexError, KeyError, ValueError,
             OSError, TimeoutError, BaseException):
         return last_hash
@@ -26,7 +26,7 @@ import ctypes
 import logging
 import threading
 from time import monotonic, sleep
-from typing import TYPE_CHECKING, Sequence
+from typing import TYPE_CHECKING, Callable, Sequence
 
 if __name__ == "__main__":  # local import check
     import sys
@@ -44,33 +44,81 @@ from pyRfactor2SharedMemory.rF2MMap import (
     rFactor2Constants,
 )
 
-logger = logging.getLogger(__name__)
+from .frame_bus import FrameScheduler
+from .mmap_snapshot import MMapSnapshot, copy_struct
 
+logger = logging.getLogger(__name__)
 
-def copy_struct(struct_data):
-    """Allow to copy ctypes struct data with __slots__"""
-    return type(struct_data).from_buffer_copy(
-        ctypes.string_at(
-            ctypes.byref(struct_data),
-            ctypes.sizeof(struct_data),
-        )
-    )
+# Vehicle data region, vehicle array is located at the end of data
+SCOR_VEH_OFFSET = rF2data.rF2Scoring.mVehicles.offset
+SCOR_VEH_SIZE = ctypes.sizeof(rF2data.rF2VehicleScoring)
+TELE_VEH_OFFSET = rF2data.rF2Telemetry.mVehicles.offset
+TELE_VEH_SIZE = ctypes.sizeof(rF2data.rF2VehicleTelemetry)
+VEH_RECORDS = min(
+    rF2data.rF2Scoring.mVehicles.size // SCOR_VEH_SIZE,
+    rF2data.rF2Telemetry.mVehicles.size // TELE_VEH_SIZE,
+)
 
 
-def local_scoring_index(scor_veh: Sequence[rF2data.rF2VehicleScoring]) -> int:
+def local_scoring_index(scor_veh: Sequence[rF2data.rF2VehicleScoring], veh_total: int) -> int:
     """Find local player scoring index
 
     Args:
         scor_veh: scoring mVehicles array.
+        veh_total: total vehicles.
     """
-    for scor_idx, veh_info in enumerate(scor_veh):
+    for scor_idx, veh_info in zip(range(veh_total), scor_veh):
         if veh_info.mIsPlayer:
             return scor_idx
     return INVALID_INDEX
 
 
+def live_vehicles(veh_total: int) -> int:
+    """Number of live vehicle records, limited in 0 to max vehicle records"""
+    return min(max(veh_total, 0), VEH_RECORDS)
+
+
+def scoring_regions(data: rF2data.rF2Scoring) -> tuple[tuple[int, int], ...]:
+    """Scoring data copy regions (offset, size), header & live vehicles only"""
+    return (
+        (0, SCOR_VEH_OFFSET + SCOR_VEH_SIZE * live_vehicles(data.mScoringInfo.mNumVehicles)),
+    )
+
+
+def telemetry_regions(data: rF2data.rF2Telemetry) -> tuple[tuple[int, int], ...]:
+    """Telemetry data copy regions (offset, size), header & live vehicles only"""
+    return (
+        (0, TELE_VEH_OFFSET + TELE_VEH_SIZE * live_vehicles(data.mNumVehicles)),
+    )
+
+
+def scoring_version(data: rF2data.rF2Scoring) -> int | None:
+    """Scoring data version, None if data is being updated"""
+    version = data.mVersionUpdateEnd
+    if data.mVersionUpdateBegin == version:
+        return version
+    return None
+
+
+def telemetry_version(data: rF2data.rF2Telemetry) -> int | None:
+    """Telemetry data version, None if data is being updated"""
+    version = data.mVersionUpdateEnd
+    if data.mVersionUpdateBegin == version:
+        return version
+    return None
+
+
+def _no_publisher() -> None:
+    """Default new frame publisher, no subscriber"""
+
+
 class MMapDataSet:
-    """Create mmap data set"""
+    """Create mmap data set
+
+    Args:
+        mmap_control: mmap control class (or compatible factory) that takes
+            mmap name and data type, such as replay data control.
+    """
 
     __slots__ = (
         "scor",
@@ -80,12 +128,20 @@ class MMapDataSet:
         "rule",
     )
 
-    def __init__(self) -> None:
-        self.scor = MMapControl(rFactor2Constants.MM_SCORING_FILE_NAME, rF2data.rF2Scoring)
-        self.tele = MMapControl(rFactor2Constants.MM_TELEMETRY_FILE_NAME, rF2data.rF2Telemetry)
-        self.ext = MMapControl(rFactor2Constants.MM_EXTENDED_FILE_NAME, rF2data.rF2Extended)
-        self.ffb = MMapControl(rFactor2Constants.MM_FORCE_FEEDBACK_FILE_NAME, rF2data.rF2ForceFeedback)
-        self.rule = MMapControl(rFactor2Constants.MM_RULES_FILE_NAME, rF2data.rF2Rules)
+    def __init__(self, mmap_control: Callable = MMapControl) -> None:
+        self.scor = MMapSnapshot(
+            mmap_control(rFactor2Constants.MM_SCORING_FILE_NAME, rF2data.rF2Scoring),
+            scoring_version,
+            scoring_regions,
+        )
+        self.tele = MMapSnapshot(
+            mmap_control(rFactor2Constants.MM_TELEMETRY_FILE_NAME, rF2data.rF2Telemetry),
+            telemetry_version,
+            telemetry_regions,
+        )
+        self.ext = mmap_control(rFactor2Constants.MM_EXTENDED_FILE_NAME, rF2data.rF2Extended)
+        self.ffb = mmap_control(rFactor2Constants.MM_FORCE_FEEDBACK_FILE_NAME, rF2data.rF2ForceFeedback)
+        self.rule = mmap_control(rFactor2Constants.MM_RULES_FILE_NAME, rF2data.rF2Rules)
 
     def __del__(self):
         logger.info("sharedmemory: GC: MMapDataSet")
@@ -94,7 +150,7 @@ class MMapDataSet:
         """Create mmap instance
 
         Args:
-            access_mode: 0 = copy access, 1 = direct access.
+            access_mode: 0 = copy access, 1 = direct access, 2 = double-buffered snapshot access.
             rf2_pid: rF2 Process ID for accessing server data.
         """
         self.scor.create(access_mode, rf2_pid)
@@ -127,6 +183,8 @@ class SyncData:
         player_scor_index: Local player scoring index.
         player_scor: Local player scoring data.
         player_tele: Local player telemetry data.
+        tele_index_table: Scoring index to telemetry index table (list).
+        publish_frame: New frame publisher (callable).
     """
 
     __slots__ = (
@@ -134,26 +192,30 @@ class SyncData:
         "_update_thread",
         "_event",
         "_tele_indexes",
+        "tele_index_table",
         "paused",
         "override_player_index",
         "player_scor_index",
         "player_scor",
         "player_tele",
+        "publish_frame",
         "dataset",
     )
 
-    def __init__(self) -> None:
+    def __init__(self, mmap_control: Callable = MMapControl) -> None:
         self._updating = False
         self._update_thread = None
         self._event = threading.Event()
         self._tele_indexes = {_index: _index for _index in range(128)}
+        self.tele_index_table = list(range(MAX_VEHICLES))
 
         self.paused = False
         self.override_player_index = False
         self.player_scor_index = INVALID_INDEX
         self.player_scor = None
         self.player_tele = None
-        self.dataset = MMapDataSet()
+        self.publish_frame: Callable[[], None] = _no_publisher
+        self.dataset = MMapDataSet(mmap_control)
 
     def __del__(self):
         logger.info("sharedmemory: GC: SyncData")
@@ -175,7 +237,10 @@ class SyncData:
         """
         if not self.override_player_index:
             # Update scoring index
-            scor_idx = local_scoring_index(self.dataset.scor.data.mVehicles)
+            scor_idx = local_scoring_index(
+                self.dataset.scor.data.mVehicles,
+                self.dataset.scor.data.mScoringInfo.mNumVehicles,
+            )
             if scor_idx == INVALID_INDEX:
                 return False  # index not found, not synced
             self.player_scor_index = scor_idx
@@ -198,12 +263,22 @@ class SyncData:
         for tele_idx, veh_info in zip(range(tele_data.mNumVehicles), tele_data.mVehicles):
             tele_indexes[veh_info.mID] = tele_idx
 
-    def sync_tele_index(self, scor_idx: int) -> int:
-        """Sync telemetry index
+    def __update_tele_index_table(self) -> None:
+        """Update scoring index to telemetry index table, once per data update
 
         Use scoring index to find scoring mID,
         then match with telemetry mID in reference dictionary
         to find telemetry index.
+        """
+        tele_indexes = self._tele_indexes
+        table = self.tele_index_table
+        scor_data = self.dataset.scor.data
+        veh_total = min(scor_data.mScoringInfo.mNumVehicles, MAX_VEHICLES)
+        for scor_idx, veh_info in zip(range(veh_total), scor_data.mVehicles):
+            table[scor_idx] = tele_indexes.get(veh_info.mID, INVALID_INDEX)
+
+    def sync_tele_index(self, scor_idx: int) -> int:
+        """Sync telemetry index from scoring index to telemetry index table
 
         Args:
             scor_idx: Player scoring index.
@@ -211,14 +286,13 @@ class SyncData:
         Returns:
             Player telemetry index.
         """
-        return self._tele_indexes.get(
-            self.dataset.scor.data.mVehicles[scor_idx].mID, INVALID_INDEX)
+        return self.tele_index_table[scor_idx]
 
     def start(self, access_mode: int, rf2_pid: str) -> None:
         """Update & sync mmap data copy in separate thread
 
         Args:
-            access_mode: 0 = copy access, 1 = direct access.
+            access_mode: 0 = copy access, 1 = direct access, 2 = double-buffered snapshot access.
             rf2_pid: rF2 Process ID for accessing server data.
         """
         if self._updating:
@@ -228,6 +302,7 @@ class SyncData:
             # Initialize mmap data
             self.dataset.create_mmap(access_mode, rf2_pid)
             self.__update_tele_indexes(self.dataset.tele.data, self._tele_indexes)
+            self.__update_tele_index_table()
             if not self.__sync_player_data():
                 self.__sync_player_scor()
                 self.__sync_player_tele()
@@ -260,12 +335,16 @@ class SyncData:
         last_version_update = 0  # store last update version number
         last_update_time = 0.0
         data_freezed = True  # whether data is freezed
+        last_frame_scor = 0  # store last published scoring frame
+        last_frame_tele = 0  # store last published telemetry frame
         reset_counter = 0
-        update_delay = 0.5  # longer delay while inactive
+        scheduler = FrameScheduler()
+        update_delay = scheduler.idle_delay  # longer delay while inactive
 
         while not _event_wait(update_delay):
             self.dataset.update_mmap()
             self.__update_tele_indexes(self.dataset.tele.data, self._tele_indexes)
+            self.__update_tele_index_table()
             # Update player data & index
             if not data_freezed:
                 # Get player data
@@ -291,7 +370,7 @@ class SyncData:
             if data_freezed:
                 # Check while IN freeze state
                 if freezed_version != last_version_update:
-                    update_delay = 0.01
+                    scheduler.reset()
                     self.paused = data_freezed = False
                     logger.info(
                         "sharedmemory: UPDATING: resumed, data version %s",
@@ -300,7 +379,6 @@ class SyncData:
             # Check while NOT IN freeze state
             # Set freeze state if data stopped updating after 2s
             elif monotonic() - last_update_time > 2:
-                update_delay = 0.5
                 self.paused = data_freezed = True
                 freezed_version = last_version_update
                 logger.info(
@@ -308,11 +386,28 @@ class SyncData:
                     freezed_version,
                 )
 
+            # Publish new frame if either scoring or telemetry data updated
+            if data_freezed:
+                update_delay = scheduler.idle_delay
+            else:
+                frame_tele = self.dataset.tele.data.mVersionUpdateEnd
+                new_frame = last_frame_scor != last_version_update or last_frame_tele != frame_tele
+                if new_frame:
+                    last_frame_scor = last_version_update
+                    last_frame_tele = frame_tele
+                    self.publish_frame()
+                # Wake up at expected next frame
+                update_delay = scheduler.next_delay(new_frame)
+
         logger.info("sharedmemory: UPDATING: thread stopped")
 
 
 class RF2Info:
-    """RF2 shared memory data output"""
+    """RF2 shared memory data output
+
+    Args:
+        mmap_control: mmap control class (or compatible factory), see MMapDataSet.
+    """
 
     __slots__ = (
         "_sync",
@@ -327,8 +422,8 @@ class RF2Info:
         "_rule",
     )
 
-    def __init__(self) -> None:
-        self._sync = SyncData()
+    def __init__(self, mmap_control: Callable = MMapControl) -> None:
+        self._sync = SyncData(mmap_control)
         self._access_mode = 0
         self._rf2_pid = ""
         self._state_override = False
@@ -359,7 +454,7 @@ class RF2Info:
         """Set rF2 mmap access mode
 
         Args:
-            mode: 0 = copy access, 1 = direct access
+            mode: 0 = copy access, 1 = direct access, 2 = double-buffered snapshot access
         """
         self._access_mode = mode
 
@@ -379,6 +474,24 @@ class RF2Info:
         """Manual override player index"""
         self._sync.player_scor_index = min(max(index, INVALID_INDEX), MAX_VEHICLES - 1)
 
+    def setFramePublisher(self, publisher: Callable[[], None] = _no_publisher) -> None:
+        """Set new frame publisher, called once per new frame from updating thread"""
+        self._sync.publish_frame = publisher
+
+    def captureSources(self) -> tuple[tuple[str, Callable, Callable | None], ...]:
+        """Data sources for telemetry capture
+
+        Returns:
+            Tuple of (mmap name, data getter, data regions function or None for full data).
+        """
+        return (
+            (rFactor2Constants.MM_SCORING_FILE_NAME, lambda: self._scor.data, scoring_regions),
+            (rFactor2Constants.MM_TELEMETRY_FILE_NAME, lambda: self._tele.data, telemetry_regions),
+            (rFactor2Constants.MM_EXTENDED_FILE_NAME, lambda: self._ext.data, None),
+            (rFactor2Constants.MM_FORCE_FEEDBACK_FILE_NAME, lambda: self._ffb.data, None),
+            (rFactor2Constants.MM_RULES_FILE_NAME, lambda: self._rule.data, None),
+        )
+
     @property
     def rf2ScorInfo(self) -> rF2data.rF2ScoringInfo:
         """rF2 scoring info data"""
@@ -406,7 +519,7 @@ class RF2Info:
         """
         if index is None:
             return self._sync.player_tele
-        return self._tele.data.mVehicles[self._sync.sync_tele_index(index)]
+        return self._tele.data.mVehicles[self._sync.tele_index_table[index]]
 
     @property
     def rf2Ext(self) -> rF2data.rF2Extended:
@@ -462,6 +575,13 @@ def test_api():
     info.start()
     sleep(0.2)
 
+    print(SEPARATOR)
+    print("Test API - Restart (snapshot access)")
+    info.stop()
+    info.setMode(2)  # set double-buffered snapshot access
+    info.start()
+    sleep(0.2)
+
     print(SEPARATOR)
     print("Test API - Restart")
     info.stop()
@@ -33,14 +33,17 @@ from ..calculation import (
     slip_angle,
     vel2speed,
 )
-from ..const_common import MAX_SECONDS, STINT_USAGE_DEFAULT
+from ..const_common import MAX_SECONDS, MAX_VEHICLES, STINT_USAGE_DEFAULT
 from ..formatter import strip_invalid_char
 from ..process.weather import WeatherNode
 from ..validator import bytes_to_str as tostr
 from ..validator import infnan_to_zero as rmnan
 from . import _reader
+from .frame_bus import frame_bus
+from .frame_cache import frame_cache
 from .rf2_connector import RF2Info
 from .rf2_restapi import RestAPIData
+from .snapshot import VehicleSnapshot
 
 
 class DataAdapter:
@@ -102,6 +105,7 @@ class Brake(_reader.Brake, DataAdapter):
         """Brake migration (percent)"""
         return -1.0
 
+    @frame_cache.cached
     def pressure(self, index: int | None = None, scale: float = 1) -> tuple[float, ...]:
         """Brake pressure (fraction)"""
         wheel_data = self.shmm.rf2TeleVeh(index).mWheels
@@ -112,6 +116,7 @@ class Brake(_reader.Brake, DataAdapter):
             rmnan(wheel_data[3].mBrakePressure) * scale,
         )
 
+    @frame_cache.cached
     def temperature(self, index: int | None = None) -> tuple[float, ...]:
         """Brake temperature (Celsius)"""
         wheel_data = self.shmm.rf2TeleVeh(index).mWheels
@@ -723,6 +728,7 @@ class Tyre(_reader.Tyre, DataAdapter):
         rear = f"{class_name} - {tostr(tele_veh.mRearTireCompoundName)}"
         return front, front, rear, rear
 
+    @frame_cache.cached
     def surface_temperature_avg(self, index: int | None = None) -> tuple[float, ...]:
         """Tyre surface temperature set (Celsius) average"""
         wheel_data = self.shmm.rf2TeleVeh(index).mWheels
@@ -733,6 +739,7 @@ class Tyre(_reader.Tyre, DataAdapter):
             rmnan(mean(wheel_data[3].mTemperature)) - 273.15,
         )
 
+    @frame_cache.cached
     def surface_temperature_ico(self, index: int | None = None) -> tuple[float, ...]:
         """Tyre surface temperature set (Celsius) inner,center,outer"""
         wheel_data = self.shmm.rf2TeleVeh(index).mWheels
@@ -751,6 +758,7 @@ class Tyre(_reader.Tyre, DataAdapter):
             rmnan(wheel_data[3].mTemperature[2]) - 273.15,
         )
 
+    @frame_cache.cached
     def inner_temperature_avg(self, index: int | None = None) -> tuple[float, ...]:
         """Tyre inner temperature set (Celsius) average"""
         wheel_data = self.shmm.rf2TeleVeh(index).mWheels
@@ -761,6 +769,7 @@ class Tyre(_reader.Tyre, DataAdapter):
             rmnan(mean(wheel_data[3].mTireInnerLayerTemperature)) - 273.15,
         )
 
+    @frame_cache.cached
     def inner_temperature_ico(self, index: int | None = None) -> tuple[float, ...]:
         """Tyre inner temperature set (Celsius) inner,center,outer"""
         wheel_data = self.shmm.rf2TeleVeh(index).mWheels
@@ -779,6 +788,7 @@ class Tyre(_reader.Tyre, DataAdapter):
             rmnan(wheel_data[3].mTireInnerLayerTemperature[2]) - 273.15,
         )
 
+    @frame_cache.cached
     def pressure(self, index: int | None = None) -> tuple[float, ...]:
         """Tyre pressure (kPa)"""
         wheel_data = self.shmm.rf2TeleVeh(index).mWheels
@@ -789,6 +799,7 @@ class Tyre(_reader.Tyre, DataAdapter):
             rmnan(wheel_data[3].mPressure),
         )
 
+    @frame_cache.cached
     def load(self, index: int | None = None) -> tuple[float, ...]:
         """Tyre load (Newtons)"""
         wheel_data = self.shmm.rf2TeleVeh(index).mWheels
@@ -799,6 +810,7 @@ class Tyre(_reader.Tyre, DataAdapter):
             rmnan(wheel_data[3].mTireLoad),
         )
 
+    @frame_cache.cached
     def wear(self, index: int | None = None) -> tuple[float, ...]:
         """Tyre wear (fraction)"""
         wheel_data = self.shmm.rf2TeleVeh(index).mWheels
@@ -809,6 +821,7 @@ class Tyre(_reader.Tyre, DataAdapter):
             rmnan(wheel_data[3].mWear),
         )
 
+    @frame_cache.cached
     def carcass_temperature(self, index: int | None = None) -> tuple[float, ...]:
         """Tyre carcass temperature (Celsius)"""
         wheel_data = self.shmm.rf2TeleVeh(index).mWheels
@@ -819,6 +832,7 @@ class Tyre(_reader.Tyre, DataAdapter):
             rmnan(wheel_data[3].mTireCarcassTemperature) - 273.15,
         )
 
+    @frame_cache.cached
     def vertical_deflection(self, index: int | None = None) -> tuple[float, ...]:
         """Tyre vertical deflection (millimeters)"""
         wheel_data = self.shmm.rf2TeleVeh(index).mWheels
@@ -833,7 +847,13 @@ class Tyre(_reader.Tyre, DataAdapter):
 class Vehicle(_reader.Vehicle, DataAdapter):
     """Vehicle"""
 
-    __slots__ = ()
+    __slots__ = (
+        "_snapshot",
+    )
+
+    def __init__(self, shmm: RF2Info, rest: RestAPIData) -> None:
+        super().__init__(shmm, rest)
+        self._snapshot = VehicleSnapshot()
 
     def is_player(self, index: int=0) -> bool:
         """Is local player"""
@@ -954,6 +974,7 @@ class Vehicle(_reader.Vehicle, DataAdapter):
         ori = self.shmm.rf2TeleVeh(index).mOri[2]
         return rmnan(oriyaw2rad(ori.x, ori.z))
 
+    @frame_cache.cached
     def position_xyz(self, index: int | None = None) -> tuple[float, float, float]:
         """Raw x,y,z position (meters)"""
         pos = self.shmm.rf2TeleVeh(index).mPos
@@ -1051,12 +1072,48 @@ class Vehicle(_reader.Vehicle, DataAdapter):
         """Car setup data"""
         return self.rest.lastCarSetup
 
+    def snapshot(self) -> VehicleSnapshot:
+        """All vehicles data snapshot, updated once per telemetry frame"""
+        snap = self._snapshot
+        version = frame_bus.version
+        if snap.version == version:
+            return snap
+        total = min(self.shmm.rf2ScorInfo.mNumVehicles, MAX_VEHICLES)
+        for index in range(total):
+            scor = self.shmm.rf2ScorVeh(index)
+            tele = self.shmm.rf2TeleVeh(index)
+            # Scoring
+            snap.slot_id[index] = scor.mID
+            snap.place[index] = scor.mPlace
+            snap.completed_laps[index] = scor.mTotalLaps
+            snap.in_pits[index] = scor.mInPits
+            snap.in_garage[index] = scor.mInGarageStall
+            snap.class_name[index] = tostr(scor.mVehicleClass)
+            snap.distance[index] = rmnan(scor.mLapDist)
+            snap.estimated_laptime[index] = rmnan(scor.mEstimatedLapTime)
+            snap.estimated_time_into[index] = rmnan(scor.mTimeIntoLap)
+            snap.best_laptime[index] = rmnan(scor.mBestLapTime)
+            snap.last_laptime[index] = rmnan(scor.mLastLapTime)
+            # Telemetry
+            vel = tele.mLocalVel
+            pos = tele.mPos
+            ori = tele.mOri[2]
+            snap.speed[index] = rmnan(vel2speed(vel.x, vel.y, vel.z))
+            snap.elapsed[index] = rmnan(tele.mElapsedTime)
+            snap.position_longitudinal[index] = rmnan(pos.x)
+            snap.position_lateral[index] = -rmnan(pos.z)
+            snap.orientation_yaw_radians[index] = rmnan(oriyaw2rad(ori.x, ori.z))
+        snap.total = total
+        snap.version = version  # set last, so partially filled snapshot is never reused
+        return snap
+
 
 class Wheel(_reader.Wheel, DataAdapter):
     """Wheel & suspension (front left, front right, rear left, rear right)"""
 
     __slots__ = ()
 
+    @frame_cache.cached
     def camber(self, index: int | None = None) -> tuple[float, ...]:
         """Wheel camber (radians)"""
         wheel_data = self.shmm.rf2TeleVeh(index).mWheels
@@ -1067,6 +1124,7 @@ class Wheel(_reader.Wheel, DataAdapter):
             rmnan(wheel_data[3].mCamber),
         )
 
+    @frame_cache.cached
     def toe(self, index: int | None = None) -> tuple[float, ...]:
         """Wheel toe (radians)"""
         wheel_data = self.shmm.rf2TeleVeh(index).mWheels
@@ -1077,6 +1135,7 @@ class Wheel(_reader.Wheel, DataAdapter):
             rmnan(wheel_data[3].mToe),
         )
 
+    @frame_cache.cached
     def toe_symmetric(self, index: int | None = None) -> tuple[float, ...]:
         """Wheel toe symmetric (radians)"""
         wheel_data = self.shmm.rf2TeleVeh(index).mWheels
@@ -1087,6 +1146,7 @@ class Wheel(_reader.Wheel, DataAdapter):
             -rmnan(wheel_data[3].mToe),
         )
 
+    @frame_cache.cached
     def rotation(self, index: int | None = None) -> tuple[float, ...]:
         """Wheel rotation (radians per second)"""
         wheel_data = self.shmm.rf2TeleVeh(index).mWheels
@@ -1097,6 +1157,7 @@ class Wheel(_reader.Wheel, DataAdapter):
             rmnan(wheel_data[3].mRotation),
         )
 
+    @frame_cache.cached
     def velocity_lateral(self, index: int | None = None) -> tuple[float, ...]:
         """Lateral velocity (m/s) x"""
         wheel_data = self.shmm.rf2TeleVeh(index).mWheels
@@ -1107,6 +1168,7 @@ class Wheel(_reader.Wheel, DataAdapter):
             rmnan(wheel_data[3].mLateralGroundVel),
         )
 
+    @frame_cache.cached
     def velocity_longitudinal(self, index: int | None = None) -> tuple[float, ...]:
         """Longitudinal velocity (m/s) y"""
         wheel_data = self.shmm.rf2TeleVeh(index).mWheels
@@ -1145,6 +1207,7 @@ class Wheel(_reader.Wheel, DataAdapter):
             wheel_data.mLateralGroundVel,
             wheel_data.mLongitudinalGroundVel))
 
+    @frame_cache.cached
     def ride_height(self, index: int | None = None) -> tuple[float, ...]:
         """Ride height (convert meters to millimeters)"""
         wheel_data = self.shmm.rf2TeleVeh(index).mWheels
@@ -1162,6 +1225,7 @@ class Wheel(_reader.Wheel, DataAdapter):
         rear = rmnan(wheel_data.mRear3rdDeflection) * 1000
         return (front, front, rear, rear)
 
+    @frame_cache.cached
     def suspension_deflection(self, index: int | None = None) -> tuple[float, ...]:
         """Suspension deflection (convert meters to millimeters)"""
         wheel_data = self.shmm.rf2TeleVeh(index).mWheels
@@ -1172,6 +1236,7 @@ class Wheel(_reader.Wheel, DataAdapter):
             rmnan(wheel_data[3].mSuspensionDeflection) * 1000,
         )
 
+    @frame_cache.cached
     def suspension_force(self, index: int | None = None) -> tuple[float, ...]:
         """Suspension force (Newtons)"""
         wheel_data = self.shmm.rf2TeleVeh(index).mWheels
@@ -1186,6 +1251,7 @@ class Wheel(_reader.Wheel, DataAdapter):
         """Suspension damage (fraction), 0.0 no damage, 1.0 totaled"""
         return self.rest.suspensionDamage
 
+    @frame_cache.cached
     def position_vertical(self, index: int | None = None) -> tuple[float, ...]:
         """Vertical wheel position (convert meters to millimeters) related to vehicle"""
         wheel_data = self.shmm.rf2TeleVeh(index).mWheels
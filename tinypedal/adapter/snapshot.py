@@ -0,0 +1,90 @@
+#  TinyPedal is an open-source overlay application for racing simulation.
+#  Copyright (C) 2022-2026 TinyPedal developers, see contributors.md file
+#
+#  This file is part of TinyPedal.
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+Vehicle snapshot
+"""
+
+from __future__ import annotations
+
+from array import array
+
+from ..const_common import MAX_VEHICLES
+
+
+def _column(typecode: str) -> array:
+    """Create fixed size column array for all vehicles"""
+    return array(typecode, bytes(array(typecode).itemsize * MAX_VEHICLES))
+
+
+class VehicleSnapshot:
+    """All vehicles data snapshot (struct-of-arrays)
+
+    Each column holds data from all vehicles in scoring index order,
+    filled once per telemetry frame. Only first `total` items are valid.
+
+    Attributes:
+        version: frame version this snapshot was taken from.
+        total: total vehicles in snapshot.
+    """
+
+    __slots__ = (
+        "version",
+        "total",
+        "slot_id",
+        "place",
+        "completed_laps",
+        "in_pits",
+        "in_garage",
+        "class_name",
+        "distance",
+        "speed",
+        "elapsed",
+        "estimated_laptime",
+        "estimated_time_into",
+        "best_laptime",
+        "last_laptime",
+        "position_longitudinal",
+        "position_lateral",
+        "orientation_yaw_radians",
+    )
+
+    def __init__(self) -> None:
+        self.version = -1
+        self.total = 0
+        # Scoring
+        self.slot_id = _column("i")
+        self.place = _column("i")
+        self.completed_laps = _column("i")
+        self.in_pits = _column("b")
+        self.in_garage = _column("b")
+        self.class_name = [""] * MAX_VEHICLES
+        self.distance = _column("d")
+        self.estimated_laptime = _column("d")
+        self.estimated_time_into = _column("d")
+        self.best_laptime = _column("d")
+        self.last_laptime = _column("d")
+        # Telemetry
+        self.speed = _column("d")
+        self.elapsed = _column("d")
+        self.position_longitudinal = _column("d")
+        self.position_lateral = _column("d")
+        self.orientation_yaw_radians = _column("d")
+
+    def in_paddock(self, index: int) -> int:
+        """Is in paddock (either pit lane or garage), 0 = on track, 1 = pit lane, 2 = garage"""
+        return 2 if self.in_garage[index] else self.in_pits[index]
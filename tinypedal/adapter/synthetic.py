@@ -0,0 +1,481 @@
+#  TinyPedal is an open-source overlay application for racing simulation.
+#  Copyright (C) 2022-2026 TinyPedal developers, see contributors.md file
+#
+#  This file is part of TinyPedal.
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Synthetic grid
+
+Generate rF2 sharedmemory data of a simulated multi-class grid (up to max vehicles),
+which is read through rF2 API connector & data reader for load testing.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import random
+from bisect import bisect_right
+from math import cos, hypot, pi, sin
+from time import monotonic
+
+from ..userfile.track_map import load_track_map_file
+
+logger = logging.getLogger(__name__)
+
+CLASS_NAMES = ("Hypercar", "LMP2", "LMP3", "GTE", "GT3", "GT4", "TCR", "Cup")
+GRID_SPACING = 8.0  # meters
+PIT_SPEED = 22.0  # m/s
+PIT_EXIT_FRACTION = 0.05  # pit lane exit at lap progress fraction
+TYRE_WEAR_PER_LAP = 0.01  # fraction
+FUEL_PER_LAP = 2.5  # liters
+FUEL_CAPACITY = 100.0  # liters
+RPM_MAX = 9000.0
+GEAR_MAX = 6
+GEAR_SPEED = 15.0  # m/s per gear
+
+
+class SyntheticTrack:
+    """Synthetic track path
+
+    Load track path from recorded track map file, or generate circular track.
+
+    Attributes:
+        name: track name.
+        length: track length (meters).
+        sectors: sector 1 & 2 end distance (meters).
+    """
+
+    __slots__ = (
+        "name",
+        "length",
+        "sectors",
+        "_dists",
+        "_coords",
+        "_elevations",
+    )
+
+    def __init__(self, track_map_file: str = "", track_length: float = 5000.0) -> None:
+        raw_coords = raw_dists = sector_index = None
+        if track_map_file:
+            filepath, filename = os.path.split(track_map_file)
+            filename, extension = os.path.splitext(filename)
+            raw_coords, raw_dists, sector_index = load_track_map_file(
+                f"{filepath}/", filename, extension)
+        if raw_coords and raw_dists and len(raw_dists) > 1:
+            self.name = filename
+            self._coords = raw_coords
+            self._dists = tuple(dist for dist, _ in raw_dists)
+            self._elevations = tuple(elevation for _, elevation in raw_dists)
+            self.length = self._dists[-1]
+            self.sectors = (self._dists[sector_index[0]], self._dists[sector_index[1]])
+        else:
+            if track_map_file:
+                logger.warning("SYNTHETIC: invalid track map, use circular track")
+            length = max(track_length, 500.0)
+            nodes = int(length // 10)
+            radius = length / (2 * pi)
+            self.name = "Synthetic Circuit"
+            self._dists = tuple(length * index / nodes for index in range(nodes + 1))
+            self._coords = tuple(
+                (radius * sin(dist / radius), radius - radius * cos(dist / radius))
+                for dist in self._dists
+            )
+            self._elevations = (0.0,) * len(self._dists)
+            self.length = length
+            self.sectors = (length / 3, length * 2 / 3)
+
+    def position(self, distance: float) -> tuple[float, float, float, float, float]:
+        """Position at lap distance
+
+        Returns:
+            x, y coordinates (svg map plane), elevation, heading x, y (unit vector).
+        """
+        dists = self._dists
+        index = min(max(bisect_right(dists, distance % self.length), 1), len(dists) - 1)
+        dist_a = dists[index - 1]
+        x_a, y_a = self._coords[index - 1]
+        x_b, y_b = self._coords[index]
+        seg_length = dists[index] - dist_a
+        ratio = (distance % self.length - dist_a) / seg_length if seg_length else 0.0
+        dir_x = x_b - x_a
+        dir_y = y_b - y_a
+        dir_length = hypot(dir_x, dir_y) or 1.0
+        elv_a = self._elevations[index - 1]
+        return (
+            x_a + dir_x * ratio,
+            y_a + dir_y * ratio,
+            elv_a + (self._elevations[index] - elv_a) * ratio,
+            dir_x / dir_length,
+            dir_y / dir_length,
+        )
+
+
+class SyntheticControl:
+    """Synthetic data control
+
+    Same interface as mmap control, data is generated by synthetic grid.
+
+    Attributes:
+        data: generated data (updated in place).
+    """
+
+    __slots__ = (
+        "_grid",
+        "data",
+    )
+
+    def __init__(self, grid: SyntheticGrid, struct_type: type) -> None:
+        self._grid = grid
+        self.data = struct_type()
+
+    def create(self, access_mode: int = 0, rf2_pid: str = "") -> None:
+        """Create synthetic instance, primary control starts new session"""
+        if self._grid.is_primary(self):
+            self._grid.reset()
+
+    def close(self) -> None:
+        """Close synthetic instance"""
+
+    def update(self) -> None:
+        """Update synthetic data, primary control advances simulation"""
+        if self._grid.is_primary(self):
+            self._grid.advance()
+
+
+class SyntheticGrid:
+    """Synthetic grid
+
+    Simulate vehicles driving on track with constant pace per vehicle,
+    with multi-class pace gap, random pace variation, scheduled pit stops,
+    and lapping. Scoring & telemetry data are updated at separate rates.
+    First created control is scoring data (primary control), second is telemetry data.
+    """
+
+    __slots__ = (
+        "_controls",
+        "_track",
+        "_start_time",
+        "_last_time",
+        "_last_scoring",
+        "_last_telemetry",
+        "_version_scoring",
+        "_version_telemetry",
+        # Vehicle state
+        "_laptime",
+        "_progress",
+        "_lap_start",
+        "_pit_lap",
+        "_pit_until",
+        "_in_pits",
+        "_pitstops",
+        "_stint_start",
+        # Config
+        "vehicles",
+        "classes",
+        "class_gap",
+        "base_laptime",
+        "variation",
+        "pit_interval",
+        "pit_duration",
+        "scoring_interval",
+        "telemetry_interval",
+        "track_map_file",
+        "track_length",
+    )
+
+    def __init__(self) -> None:
+        self._controls: list[SyntheticControl] = []
+        self._track = SyntheticTrack()
+        self._start_time = 0.0
+        self._last_time = 0.0
+        self._last_scoring = 0.0
+        self._last_telemetry = 0.0
+        self._version_scoring = 0
+        self._version_telemetry = 0
+        self._laptime: list[float] = []
+        self._progress: list[float] = []
+        self._lap_start: list[float] = []
+        self._pit_lap: list[int] = []
+        self._pit_until: list[float] = []
+        self._in_pits: list[bool] = []
+        self._pitstops: list[int] = []
+        self._stint_start: list[float] = []
+        self.vehicles = 128
+        self.classes = 3
+        self.class_gap = 0.06
+        self.base_laptime = 100.0
+        self.variation = 0.02
+        self.pit_interval = 12
+        self.pit_duration = 30.0
+        self.scoring_interval = 0.2
+        self.telemetry_interval = 0.01
+        self.track_map_file = ""
+        self.track_length = 5000.0
+
+    def setup(self, config: dict, max_vehicles: int) -> None:
+        """Setup grid parameters, applied on next session start"""
+        self.vehicles = min(max(int(config["number_of_vehicles"]), 1), max_vehicles)
+        self.classes = min(max(int(config["number_of_classes"]), 1), len(CLASS_NAMES), self.vehicles)
+        self.class_gap = max(config["class_lap_time_gap"], 0.0)
+        self.base_laptime = max(config["base_lap_time"], 10.0)
+        self.variation = max(config["lap_time_variation"], 0.0)
+        self.pit_interval = max(int(config["pit_stop_lap_interval"]), 0)
+        self.pit_duration = max(config["pit_stop_duration"], 0.0)
+        self.scoring_interval = max(config["scoring_update_interval"], 10) / 1000
+        self.telemetry_interval = max(config["telemetry_update_interval"], 10) / 1000
+        self.track_map_file = config["track_map_file_name"]
+        self.track_length = config["track_length"]
+
+    def control(self, mmap_name: str, struct_type: type) -> SyntheticControl:
+        """Create synthetic control, compatible with mmap control class arguments"""
+        synthetic_control = SyntheticControl(self, struct_type)
+        self._controls.append(synthetic_control)
+        return synthetic_control
+
+    def is_primary(self, synthetic_control: SyntheticControl) -> bool:
+        """Whether is primary synthetic control"""
+        return synthetic_control is self._controls[0]
+
+    def reset(self) -> None:
+        """Start new session, set grid & static data"""
+        self._track = track = SyntheticTrack(self.track_map_file, self.track_length)
+        total = self.vehicles
+        spacing = min(GRID_SPACING, track.length * 0.5 / total)
+        rand = random.Random(total)  # same grid for same number of vehicles
+        class_size = -(-total // self.classes)  # ceil
+        self._laptime = [
+            self.base_laptime
+            * (1 + self.class_gap * (index // class_size))
+            * (1 + self.variation * rand.random())
+            for index in range(total)
+        ]
+        self._progress = [((total - index) * spacing) / track.length for index in range(total)]
+        self._lap_start = [0.0] * total
+        self._pit_lap = [
+            rand.randint(1, self.pit_interval) if self.pit_interval else 0
+            for _ in range(total)
+        ]
+        self._pit_until = [0.0] * total
+        self._in_pits = [False] * total
+        self._pitstops = [0] * total
+        self._stint_start = self._progress.copy()
+        self._start_time = self._last_time = monotonic()
+        self._last_scoring = self._last_telemetry = -1.0
+        logger.info(
+            "SYNTHETIC: %s vehicles, %s classes, track: %s (%sm)",
+            total, self.classes, track.name, round(track.length),
+        )
+
+        track_name = track.name.encode()[:63]
+        scor = self._controls[0].data
+        scor_info = scor.mScoringInfo
+        scor_info.mTrackName = track_name
+        scor_info.mSession = 10  # race
+        scor_info.mGamePhase = 5  # green flag
+        scor_info.mInRealtime = 1
+        scor_info.mNumVehicles = total
+        scor_info.mLapDist = track.length
+        scor_info.mMaxLaps = 2147483647
+        scor_info.mEndET = 86400.0
+        scor_info.mAmbientTemp = 25.0
+        scor_info.mTrackTemp = 30.0
+        for index, scor_veh in zip(range(total), scor.mVehicles):
+            class_index = index // class_size
+            scor_veh.mID = index
+            scor_veh.mIsPlayer = index == 0
+            scor_veh.mControl = 0 if index == 0 else 1  # local player, AI
+            scor_veh.mDriverName = f"Driver {index + 1}".encode()
+            scor_veh.mVehicleName = f"{CLASS_NAMES[class_index]} #{index + 1}".encode()
+            scor_veh.mVehicleClass = CLASS_NAMES[class_index].encode()
+            scor_veh.mEstimatedLapTime = self._laptime[index]
+            scor_veh.mBestLapTime = scor_veh.mLastLapTime = -1.0
+            scor_veh.mBestSector1 = scor_veh.mBestSector2 = -1.0
+            scor_veh.mLastSector1 = scor_veh.mLastSector2 = -1.0
+            scor_veh.mCurSector1 = scor_veh.mCurSector2 = -1.0
+            scor_veh.mTotalLaps = 0
+            scor_veh.mNumPitstops = 0
+            scor_veh.mFuelFraction = 255
+        if len(self._controls) > 1:
+            tele = self._controls[1].data
+            tele.mNumVehicles = total
+            for index, (scor_veh, tele_veh) in enumerate(zip(scor.mVehicles[:total], tele.mVehicles)):
+                tele_veh.mID = index
+                tele_veh.mVehicleName = scor_veh.mVehicleName
+                tele_veh.mTrackName = track_name
+                tele_veh.mIgnitionStarter = 1
+                tele_veh.mMaxGears = GEAR_MAX
+                tele_veh.mEngineMaxRPM = RPM_MAX
+                tele_veh.mFuelCapacity = FUEL_CAPACITY
+                tele_veh.mEngineWaterTemp = 90.0
+                tele_veh.mEngineOilTemp = 100.0
+                tele_veh.mPhysicalSteeringWheelRange = 540.0
+                tele_veh.mVisualSteeringWheelRange = 540.0
+                tele_veh.mRearBrakeBias = 0.45
+                for wheel in tele_veh.mWheels:
+                    wheel.mPressure = 170.0
+                    wheel.mBrakeTemp = 673.15
+                    wheel.mTireCarcassTemperature = 353.15
+                    wheel.mTemperature[0] = wheel.mTemperature[1] = wheel.mTemperature[2] = 353.15
+                    wheel.mTireInnerLayerTemperature[0] = 353.15
+                    wheel.mTireInnerLayerTemperature[1] = 353.15
+                    wheel.mTireInnerLayerTemperature[2] = 353.15
+        if len(self._controls) > 2:
+            self._controls[2].data.mVersion = b"Synthetic"
+        self.advance()
+
+    def advance(self) -> None:
+        """Advance simulation to current time"""
+        now = monotonic()
+        delta = now - self._last_time
+        self._last_time = now
+        elapsed = now - self._start_time
+        track_length = self._track.length
+        laptime = self._laptime
+        progress = self._progress
+        pit_until = self._pit_until
+        in_pits = self._in_pits
+        for index, pace in enumerate(laptime):
+            if pit_until[index]:  # stopped in pit
+                if elapsed < pit_until[index]:
+                    continue
+                pit_until[index] = 0.0
+            if in_pits[index]:
+                progress[index] += PIT_SPEED / track_length * delta
+                if progress[index] % 1 > PIT_EXIT_FRACTION:
+                    in_pits[index] = False
+            else:
+                progress[index] += delta / pace
+        if elapsed - self._last_scoring >= self.scoring_interval:
+            self._last_scoring = elapsed
+            self.__update_scoring(elapsed)
+        if elapsed - self._last_telemetry >= self.telemetry_interval and len(self._controls) > 1:
+            self._last_telemetry = elapsed
+            self.__update_telemetry(elapsed)
+
+    def __update_scoring(self, elapsed: float) -> None:
+        """Update scoring data"""
+        track = self._track
+        sector1, sector2 = track.sectors
+        scor = self._controls[0].data
+        self._version_scoring += 1
+        scor.mVersionUpdateBegin = self._version_scoring
+        scor.mScoringInfo.mCurrentET = elapsed
+        progress = self._progress
+        order = sorted(range(len(progress)), key=progress.__getitem__, reverse=True)
+        leader_progress = progress[order[0]]
+        next_progress = leader_progress
+        for place, index in enumerate(order, 1):
+            scor_veh = scor.mVehicles[index]
+            curr_progress = progress[index]
+            laps = int(curr_progress)
+            distance = (curr_progress - laps) * track.length
+            pace = self._laptime[index]
+            # Lap & sector timing
+            if laps > scor_veh.mTotalLaps:
+                self.__complete_lap(index, scor_veh, laps, elapsed)
+            sector = 1 if distance < sector1 else 2 if distance < sector2 else 0
+            if sector != scor_veh.mSector:
+                sector_time = elapsed - self._lap_start[index]
+                if sector == 2:
+                    scor_veh.mCurSector1 = sector_time
+                elif sector == 0:
+                    scor_veh.mCurSector2 = sector_time
+                scor_veh.mSector = sector
+            # Standings
+            scor_veh.mPlace = place
+            scor_veh.mLapDist = distance
+            scor_veh.mTimeIntoLap = elapsed - self._lap_start[index]
+            scor_veh.mLapsBehindLeader = int(leader_progress) - laps
+            scor_veh.mTimeBehindLeader = (leader_progress - curr_progress) * pace
+            scor_veh.mLapsBehindNext = int(next_progress) - laps
+            scor_veh.mTimeBehindNext = (next_progress - curr_progress) * pace
+            scor_veh.mInPits = self._in_pits[index]
+            scor_veh.mPitState = 3 if self._pit_until[index] else 4 if self._in_pits[index] else 0
+            scor_veh.mNumPitstops = self._pitstops[index]
+            scor_veh.mFuelFraction = int(self.__fuel(index) / FUEL_CAPACITY * 255)
+            next_progress = curr_progress
+        scor.mVersionUpdateEnd = self._version_scoring
+
+    def __complete_lap(self, index: int, scor_veh, laps: int, elapsed: float) -> None:
+        """Complete lap, update lap timing & pit stop schedule"""
+        lap_start = self._lap_start[index]
+        if laps > 1:  # first crossing from grid is not timed lap
+            laptime = elapsed - lap_start
+            sector1 = scor_veh.mCurSector1
+            sector2 = scor_veh.mCurSector2
+            scor_veh.mLastLapTime = laptime
+            scor_veh.mLastSector1 = sector1
+            scor_veh.mLastSector2 = sector2
+            if scor_veh.mBestLapTime < 0 or laptime < scor_veh.mBestLapTime:
+                scor_veh.mBestLapTime = laptime
+            if 0 < sector1 and (scor_veh.mBestSector1 < 0 or sector1 < scor_veh.mBestSector1):
+                scor_veh.mBestSector1 = sector1
+            if 0 < sector2 and (scor_veh.mBestSector2 < 0 or sector2 < scor_veh.mBestSector2):
+                scor_veh.mBestSector2 = sector2
+        scor_veh.mCurSector1 = scor_veh.mCurSector2 = -1.0
+        scor_veh.mTotalLaps = laps
+        self._lap_start[index] = elapsed
+        # Pit stop
+        if self.pit_interval and laps >= self._pit_lap[index]:
+            self._pit_lap[index] = laps + self.pit_interval
+            self._pit_until[index] = elapsed + self.pit_duration
+            self._in_pits[index] = True
+            self._pitstops[index] += 1
+            self._progress[index] = self._stint_start[index] = float(laps)
+
+    def __fuel(self, index: int) -> float:
+        """Remaining fuel (liters) from stint laps"""
+        return max(FUEL_CAPACITY - FUEL_PER_LAP * (self._progress[index] - self._stint_start[index]), 0.0)
+
+    def __update_telemetry(self, elapsed: float) -> None:
+        """Update telemetry data"""
+        track = self._track
+        track_length = track.length
+        tele = self._controls[1].data
+        self._version_telemetry += 1
+        tele.mVersionUpdateBegin = self._version_telemetry
+        for index, (curr_progress, tele_veh) in enumerate(zip(self._progress, tele.mVehicles)):
+            if self._pit_until[index]:
+                speed = 0.0
+            elif self._in_pits[index]:
+                speed = PIT_SPEED
+            else:
+                speed = track_length / self._laptime[index]
+            laps = int(curr_progress)
+            pos_x, pos_y, elevation, dir_x, dir_y = track.position((curr_progress - laps) * track_length)
+            tele_veh.mElapsedTime = elapsed
+            tele_veh.mLapNumber = laps + 1
+            tele_veh.mLapStartET = self._lap_start[index]
+            # RF2 coord system: svg map x = pos x, svg map y = -pos z, forward = -local z
+            tele_veh.mPos.x = pos_x
+            tele_veh.mPos.y = elevation
+            tele_veh.mPos.z = -pos_y
+            tele_veh.mOri[2].x = -dir_x
+            tele_veh.mOri[2].z = dir_y
+            tele_veh.mLocalVel.z = -speed
+            gear = min(int(speed // GEAR_SPEED) + 1, GEAR_MAX) if speed else 0
+            tele_veh.mGear = gear
+            tele_veh.mEngineRPM = (
+                RPM_MAX * (0.6 + 0.4 * (speed % GEAR_SPEED) / GEAR_SPEED) if gear else 1000.0)
+            tele_veh.mUnfilteredThrottle = tele_veh.mFilteredThrottle = 1.0 if speed else 0.0
+            tele_veh.mSpeedLimiter = self._in_pits[index]
+            tele_veh.mFuel = self.__fuel(index)
+            wear = max(1 - TYRE_WEAR_PER_LAP * (curr_progress - self._stint_start[index]), 0.0)
+            for wheel in tele_veh.mWheels:
+                wheel.mWear = wear
+                wheel.mRotation = -speed / 0.33
+        tele.mVersionUpdateEnd = self._version_telemetry
@@ -20,8 +20,10 @@
 API connector
 """
 
+import logging
 from abc import ABC, abstractmethod
 from functools import partial
+from typing import Callable
 
 # Import APIs
 from .adapter import (
@@ -29,14 +31,36 @@ from .adapter import (
     lmu_connector,
     lmu_reader,
     lmu_restapi,
+    replay,
     restapi_connector,
     rf2_connector,
     rf2_reader,
     rf2_restapi,
+    synthetic,
 )
-from .const_api import API_LMU_NAME, API_LMULEGACY_NAME, API_RF2_NAME
+from .adapter.frame_bus import frame_bus
+from .const_api import (
+    API_LMU_NAME,
+    API_LMULEGACY_NAME,
+    API_REPLAY_NAME,
+    API_RF2_NAME,
+    API_SYNTHETIC_NAME,
+)
+from .const_common import MAX_VEHICLES
 from .validator import bytes_to_str
 
+logger = logging.getLogger(__name__)
+
+
+def session_event_source(session, vehicle) -> Callable[[], tuple]:
+    """Rest API session event source, state changes on session change or pit entry & exit
+
+    Args:
+        session: session data reader.
+        vehicle: vehicle data reader.
+    """
+    return lambda: (session.identifier()[0], vehicle.in_pits())
+
 
 class Connector(ABC):
     """API Connector"""
@@ -44,8 +68,12 @@ class Connector(ABC):
     __slots__ = ()
 
     @abstractmethod
-    def start(self):
-        """Start API & load info access function"""
+    def start(self, restapi: bool = True):
+        """Start API & load info access function
+
+        Args:
+            restapi: whether to start Rest API updating (if available).
+        """
 
     @abstractmethod
     def stop(self):
@@ -59,6 +87,16 @@ class Connector(ABC):
     def setup(self, config: dict):
         """Setup API parameters"""
 
+    def restapi_data(self):
+        """Rest API data set, None if Rest API not available"""
+        return None
+
+    def start_capture(self, filename_full: str):
+        """Start telemetry capture, not supported by default"""
+
+    def stop_capture(self):
+        """Stop telemetry capture"""
+
     def close(self):
         """Dereference all instances"""
         for var in self.__slots__:
@@ -74,6 +112,8 @@ class SimLMU(Connector):
         # Secondary API
         "_restapi",
         "_restapi_dataset",
+        # Telemetry capture
+        "_recorder",
     )
     NAME = API_LMU_NAME
 
@@ -81,10 +121,16 @@ class SimLMU(Connector):
         self._shmmapi = lmu_connector.LMUInfo()
         self._restapi_dataset = lmu_restapi.RestAPIData()
         self._restapi = restapi_connector.RestAPIConnector(lmu_restapi.lmu_restapi_tasks(), self._restapi_dataset)
+        self._restapi.setEventSource(session_event_source(
+            lmu_reader.Session(self._shmmapi, self._restapi_dataset),
+            lmu_reader.Vehicle(self._shmmapi, self._restapi_dataset),
+        ))
+        self._recorder = None
 
-    def start(self):
+    def start(self, restapi: bool = True):
         self._shmmapi.start()  # 1 load first
-        self._restapi.start()  # 2
+        if restapi:
+            self._restapi.start()  # 2
 
     def stop(self):
         self._restapi.stop()  # 1 unload first
@@ -108,15 +154,30 @@ class SimLMU(Connector):
             lmu_reader.Wheel(shmm, rest),
         )
 
+    def restapi_data(self):
+        return self._restapi_dataset
+
     def setup(self, config: dict):
         self._shmmapi.setMode(config["access_mode"])
         self._shmmapi.setStateOverride(config["enable_active_state_override"])
         self._shmmapi.setActiveState(config["active_state"])
         self._shmmapi.setPlayerOverride(config["enable_player_index_override"])
         self._shmmapi.setPlayerIndex(config["player_index"])
+        self._shmmapi.setFramePublisher(frame_bus.publish)
         self._restapi.setConnection(config.copy())
         lmu_reader.tostr = partial(bytes_to_str, char_encoding=config["character_encoding"].lower())
 
+    def start_capture(self, filename_full: str):
+        self._recorder = replay.FrameRecorder(filename_full, self.NAME, self._shmmapi.captureSources())
+        self._recorder.start()
+        self._shmmapi.setFramePublisher(self._recorder.publisher(frame_bus.publish))
+
+    def stop_capture(self):
+        if self._recorder is not None:
+            self._shmmapi.setFramePublisher(frame_bus.publish)
+            self._recorder.stop()
+            self._recorder = None
+
 
 class SimRF2(Connector):
     """rFactor 2 - RF2 Sharedmemory Map Plugin API"""
@@ -127,6 +188,8 @@ class SimRF2(Connector):
         # Secondary API
         "_restapi",
         "_restapi_dataset",
+        # Telemetry capture
+        "_recorder",
     )
     NAME = API_RF2_NAME
 
@@ -134,10 +197,16 @@ class SimRF2(Connector):
         self._shmmapi = rf2_connector.RF2Info()
         self._restapi_dataset = rf2_restapi.RestAPIData()
         self._restapi = restapi_connector.RestAPIConnector(rf2_restapi.rf2_restapi_tasks(), self._restapi_dataset)
+        self._restapi.setEventSource(session_event_source(
+            rf2_reader.Session(self._shmmapi, self._restapi_dataset),
+            rf2_reader.Vehicle(self._shmmapi, self._restapi_dataset),
+        ))
+        self._recorder = None
 
-    def start(self):
+    def start(self, restapi: bool = True):
         self._shmmapi.start()  # 1 load first
-        self._restapi.start()  # 2
+        if restapi:
+            self._restapi.start()  # 2
 
     def stop(self):
         self._restapi.stop()  # 1 unload first
@@ -161,6 +230,9 @@ class SimRF2(Connector):
             rf2_reader.Wheel(shmm, rest),
         )
 
+    def restapi_data(self):
+        return self._restapi_dataset
+
     def setup(self, config: dict):
         if self.NAME == API_RF2_NAME:
             self._shmmapi.setPID(config["process_id"])
@@ -169,9 +241,21 @@ class SimRF2(Connector):
         self._shmmapi.setActiveState(config["active_state"])
         self._shmmapi.setPlayerOverride(config["enable_player_index_override"])
         self._shmmapi.setPlayerIndex(config["player_index"])
+        self._shmmapi.setFramePublisher(frame_bus.publish)
         self._restapi.setConnection(config.copy())
         rf2_reader.tostr = partial(bytes_to_str, char_encoding=config["character_encoding"].lower())
 
+    def start_capture(self, filename_full: str):
+        self._recorder = replay.FrameRecorder(filename_full, self.NAME, self._shmmapi.captureSources())
+        self._recorder.start()
+        self._shmmapi.setFramePublisher(self._recorder.publisher(frame_bus.publish))
+
+    def stop_capture(self):
+        if self._recorder is not None:
+            self._shmmapi.setFramePublisher(frame_bus.publish)
+            self._recorder.stop()
+            self._recorder = None
+
 
 class SimLMULegacy(SimRF2):
     """Le Mans Ultimate (legacy) - RF2 Sharedmemory Map Plugin API"""
@@ -182,6 +266,8 @@ class SimLMULegacy(SimRF2):
         # Secondary API
         "_restapi",
         "_restapi_dataset",
+        # Telemetry capture
+        "_recorder",
     )
     NAME = API_LMULEGACY_NAME
 
@@ -189,3 +275,145 @@ class SimLMULegacy(SimRF2):
         self._shmmapi = rf2_connector.RF2Info()
         self._restapi_dataset = lmu_restapi.RestAPIData()
         self._restapi = restapi_connector.RestAPIConnector(lmu_restapi.lmu_restapi_tasks(), self._restapi_dataset)
+        self._restapi.setEventSource(session_event_source(
+            rf2_reader.Session(self._shmmapi, self._restapi_dataset),
+            rf2_reader.Vehicle(self._shmmapi, self._restapi_dataset),
+        ))
+        self._recorder = None
+
+
+class SimReplay(Connector):
+    """Telemetry replay - replay captured API data from file
+
+    Captured data is replayed through same API connector & data reader as captured API,
+    which is selected from capture file on first setup. Rest API is not available.
+    """
+
+    __slots__ = (
+        "_player",
+        "_is_lmu",
+        # Primary API
+        "_shmmapi",
+        # Secondary API
+        "_restapi_dataset",
+    )
+    NAME = API_REPLAY_NAME
+
+    def __init__(self):
+        self._player = replay.ReplayPlayer()
+        self._is_lmu = False
+        self._shmmapi = None
+        self._restapi_dataset = None
+
+    def start(self, restapi: bool = True):
+        self._shmmapi.start()
+
+    def stop(self):
+        self._shmmapi.stop()
+
+    def reader(self) -> APIDataReader:
+        shmm = self._shmmapi
+        rest = self._restapi_dataset
+        api_reader = lmu_reader if self._is_lmu else rf2_reader
+        return APIDataReader(
+            api_reader.State(shmm, rest),
+            api_reader.Brake(shmm, rest),
+            api_reader.ElectricMotor(shmm, rest),
+            api_reader.Engine(shmm, rest),
+            api_reader.Inputs(shmm, rest),
+            api_reader.Lap(shmm, rest),
+            api_reader.Session(shmm, rest),
+            api_reader.Switch(shmm, rest),
+            api_reader.Timing(shmm, rest),
+            api_reader.Tyre(shmm, rest),
+            api_reader.Vehicle(shmm, rest),
+            api_reader.Wheel(shmm, rest),
+        )
+
+    def setup(self, config: dict):
+        filename = config["replay_file_name"]
+        try:
+            self._player.open(filename)
+        except (OSError, ValueError, KeyError):
+            logger.warning("REPLAY: invalid capture file: %s", filename)
+        self._player.speed = max(config["replay_speed"], 0)
+        self._player.loop = config["enable_replay_loop"]
+        is_lmu = self._player.api_name == API_LMU_NAME
+        if self._shmmapi is None:
+            # API connector & data reader are only created once
+            self._is_lmu = is_lmu
+            if is_lmu:
+                self._shmmapi = lmu_connector.LMUInfo(self._player.control)
+                self._restapi_dataset = lmu_restapi.RestAPIData()
+            else:
+                self._shmmapi = rf2_connector.RF2Info(self._player.control)
+                self._restapi_dataset = rf2_restapi.RestAPIData()
+        elif self._is_lmu != is_lmu:
+            logger.warning("REPLAY: captured API changed, restart TinyPedal to apply")
+        self._shmmapi.setMode(0)  # copy access, data is provided by replay player
+        self._shmmapi.setStateOverride(config["enable_active_state_override"])
+        self._shmmapi.setActiveState(config["active_state"])
+        self._shmmapi.setPlayerOverride(config["enable_player_index_override"])
+        self._shmmapi.setPlayerIndex(config["player_index"])
+        self._shmmapi.setFramePublisher(frame_bus.publish)
+        char_encoding = config["character_encoding"].lower()
+        if self._is_lmu:
+            lmu_reader.tostr = partial(bytes_to_str, char_encoding=char_encoding)
+        else:
+            rf2_reader.tostr = partial(bytes_to_str, char_encoding=char_encoding)
+
+
+class SimSynthetic(Connector):
+    """Synthetic grid - simulated multi-class grid for load testing
+
+    Synthetic data is generated in rF2 sharedmemory data format,
+    and read through rF2 API connector & data reader. Rest API is not available.
+    """
+
+    __slots__ = (
+        "_grid",
+        # Primary API
+        "_shmmapi",
+        # Secondary API
+        "_restapi_dataset",
+    )
+    NAME = API_SYNTHETIC_NAME
+
+    def __init__(self):
+        self._grid = synthetic.SyntheticGrid()
+        self._shmmapi = rf2_connector.RF2Info(self._grid.control)
+        self._restapi_dataset = rf2_restapi.RestAPIData()
+
+    def start(self, restapi: bool = True):
+        self._shmmapi.start()
+
+    def stop(self):
+        self._shmmapi.stop()
+
+    def reader(self) -> APIDataReader:
+        shmm = self._shmmapi
+        rest = self._restapi_dataset
+        return APIDataReader(
+            rf2_reader.State(shmm, rest),
+            rf2_reader.Brake(shmm, rest),
+            rf2_reader.ElectricMotor(shmm, rest),
+            rf2_reader.Engine(shmm, rest),
+            rf2_reader.Inputs(shmm, rest),
+            rf2_reader.Lap(shmm, rest),
+            rf2_reader.Session(shmm, rest),
+            rf2_reader.Switch(shmm, rest),
+            rf2_reader.Timing(shmm, rest),
+            rf2_reader.Tyre(shmm, rest),
+            rf2_reader.Vehicle(shmm, rest),
+            rf2_reader.Wheel(shmm, rest),
+        )
+
+    def setup(self, config: dict):
+        self._grid.setup(config, MAX_VEHICLES)
+        self._shmmapi.setMode(0)  # copy access, data is provided by synthetic grid
+        self._shmmapi.setStateOverride(config["enable_active_state_override"])
+        self._shmmapi.setActiveState(config["active_state"])
+        self._shmmapi.setPlayerOverride(config["enable_player_index_override"])
+        self._shmmapi.setPlayerIndex(config["player_index"])
+        self._shmmapi.setFramePublisher(frame_bus.publish)
+        rf2_reader.tostr = partial(bytes_to_str, char_encoding=config["character_encoding"].lower())
@@ -21,10 +21,13 @@ API control
 """
 
 import logging
+from time import strftime
 
 from . import api_connector, realtime_state
+from .adapter.frame_cache import frame_cache
 from .const_api import API_MAP_ALIAS
 from .const_app import PLATFORM
+from .const_file import FileExt
 from .setting import cfg
 
 logger = logging.getLogger(__name__)
@@ -38,12 +41,16 @@ def _set_available_api():
             (api_connector.SimLMU, False),  # API, is legacy
             (api_connector.SimLMULegacy, not enable_legacy),
             (api_connector.SimRF2, False),
+            (api_connector.SimReplay, False),
+            (api_connector.SimSynthetic, False),
         )
     else:
         available_api = (
             (api_connector.SimLMU, False),  # API, is legacy
             (api_connector.SimLMULegacy, not enable_legacy),
             (api_connector.SimRF2, False),
+            (api_connector.SimReplay, False),
+            (api_connector.SimSynthetic, False),
         )
     # Sort API by name
     api_gen = (_api for _api, _legacy in available_api if not _legacy)
@@ -90,11 +97,21 @@ class APIControl:
         self._api = self._available_api[0]()
         cfg.api_name = self._api.NAME
 
-    def start(self):
-        """Start API"""
+    def start(self, capture: bool = True, restapi: bool = True):
+        """Start API
+
+        Args:
+            capture: whether to start telemetry capture if enabled.
+                Should be disabled for secondary API connection (such as module worker).
+            restapi: whether to start Rest API updating (if available).
+                Should be disabled for secondary API connection (such as module worker),
+                which receives Rest API data from primary API connection instead.
+        """
         logger.info("CONNECTING: %s API", self._api.NAME)
         self.setup()
-        self._api.start()
+        self._api.start(restapi)
+        if capture:
+            self.__start_capture()
 
         # Reload dataset if API changed
         if self.read is None or not self._same_api_loaded:
@@ -108,6 +125,7 @@ class APIControl:
     def stop(self):
         """Stop API"""
         logger.info("DISCONNECTING: %s API (%s)", self._api.NAME, self.read.state.version())
+        self._api.stop_capture()
         self._api.stop()
         logger.info("DISCONNECTED: %s API", self._api.NAME)
 
@@ -129,13 +147,31 @@ class APIControl:
         setting_api = cfg.api
         realtime_state.overriding = setting_api["enable_active_state_override"]
         realtime_state.spectating = setting_api["enable_player_index_override"]
+        frame_cache.enabled = cfg.application["enable_frame_cache"]
+        frame_cache.clear()
         self._api.setup(setting_api)
 
+    def __start_capture(self):
+        """Start telemetry capture if enabled"""
+        if not cfg.api.get("enable_telemetry_capture", False):
+            return
+        alias = "".join(char for char in self.alias if char.isalnum())
+        filename = f"{alias}_{strftime('%Y-%m-%d_%H-%M-%S')}{FileExt.TPCAP}"
+        try:
+            self._api.start_capture(f"{cfg.path.captures}{filename}")
+        except OSError:
+            logger.error("CAPTURE: failed creating capture file: %s", filename)
+
     @property
     def available(self):
         """Available API"""
         return self._available_api
 
+    @property
+    def restapi_data(self):
+        """Rest API data set, None if Rest API not available"""
+        return self._api.restapi_data()
+
     @property
     def name(self) -> str:
         """API full name"""
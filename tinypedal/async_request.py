@@ -22,15 +22,11 @@ Asynchronous request
 
 from __future__ import annotations
 
-from asyncio import StreamReader, open_connection, wait_for
+from asyncio import IncompleteReadError, StreamReader, StreamWriter, open_connection, wait_for
 from contextlib import asynccontextmanager
 from time import perf_counter
 from typing import Awaitable
 
-# Default limit from asyncio.open_connection is 2 ** 16
-# Lower limit to avoid getting incomplete data
-BUFFER_LIMIT = 32768  # 2 ** 15
-
 
 def set_header_get(uri: str = "/", host: str = "localhost", *headers: str) -> bytes:
     """Set GET request header"""
@@ -39,39 +35,149 @@ def set_header_get(uri: str = "/", host: str = "localhost", *headers: str) -> by
     return f"GET {uri} HTTP/1.1\r\nHost: {host}{extra_headers}\r\n\r\n".encode()
 
 
-async def parse_response(reader: StreamReader) -> bytes:
-    """Parse response"""
+def content_length(header_bytes: bytes) -> int:
+    """Get content length from (lowercase) header, -1 if not found"""
+    pos_beg = header_bytes.find(b"content-length:")
+    if pos_beg < 0:
+        return -1
+    try:
+        pos_beg += 15  # offset
+        pos_end = header_bytes.find(b"\r\n", pos_beg)
+        return max(int(header_bytes[pos_beg:pos_end]), 0)
+    except (AttributeError, TypeError, IndexError, ValueError):
+        return -1
+
+
+async def read_chunked(reader: StreamReader) -> bytes:
+    """Read chunked body"""
+    temp_bytes = bytearray()
+    while True:
+        size_line = await reader.readuntil(b"\r\n")
+        chunk_size = int(size_line.split(b";", 1)[0], 16)  # ignore chunk extension
+        if chunk_size <= 0:  # end chunk
+            break
+        temp_bytes += await reader.readexactly(chunk_size)
+        await reader.readexactly(2)  # cut off CRLF
+    # Skip trailer section
+    while (await reader.readuntil(b"\r\n")) != b"\r\n":
+        pass
+    return bytes(temp_bytes)
+
+
+async def read_response(reader: StreamReader) -> tuple[bytes, bool]:
+    """Read full response, so that connection can be reused
+
+    Returns:
+        Response body (empty if status code is not 200),
+        and whether connection can be kept alive.
+    """
     # Get headers
     header_bytes = await reader.readuntil(b"\r\n\r\n")
-    if b"200" not in header_bytes:  # check http status code
-        return b""
-    # Get non-chunked data
-    if b"chunked" not in header_bytes:
-        # Get body length
-        body_length = 0
-        pos_beg = header_bytes.find(b"Content-Length")
-        if pos_beg >= 0:
+    header_lower = header_bytes.lower()
+    status_code = header_bytes[9:12]
+    keep_alive = header_bytes.startswith(b"HTTP/1.1") and b"connection: close" not in header_lower
+    # Get body
+    if status_code in (b"204", b"304") or status_code.startswith(b"1"):  # no body
+        body_bytes = b""
+    elif b"chunked" in header_lower:  # chunked data
+        body_bytes = await read_chunked(reader)
+    else:  # non-chunked data
+        body_length = content_length(header_lower)
+        if body_length < 0:  # no length, read until connection closed
+            body_bytes = await reader.read()
+            keep_alive = False
+        elif body_length > 0:
+            body_bytes = await reader.readexactly(body_length)
+        else:
+            body_bytes = b""
+    if status_code != b"200":  # check http status code
+        return b"", keep_alive
+    return body_bytes, keep_alive
+
+
+async def parse_response(reader: StreamReader) -> bytes:
+    """Parse response"""
+    body_bytes, _ = await read_response(reader)
+    return body_bytes
+
+
+async def close_connection(writer: StreamWriter) -> None:
+    """Close connection"""
+    writer.close()
+    try:
+        await writer.wait_closed()
+    except (ConnectionError, OSError):
+        pass
+
+
+class HttpConnectionPool:
+    """HTTP/1.1 keep-alive connection pool
+
+    Reuse idle connections to same host & port across requests,
+    new connection is opened only while no idle connection available.
+    Pool must be used and closed in same event loop.
+
+    Args:
+        host: url host.
+        port: url port.
+        max_idle: maximum idle connections kept alive.
+    """
+
+    __slots__ = (
+        "_host",
+        "_port",
+        "_max_idle",
+        "_idle",
+    )
+
+    def __init__(self, host: str, port: int, max_idle: int = 8):
+        self._host = host
+        self._port = port
+        self._max_idle = max_idle
+        self._idle: list[tuple[StreamReader, StreamWriter]] = []
+
+    async def get(self, request: bytes, time_out: float) -> bytes:
+        """Send request and get response data (bytes)"""
+        # Reuse idle connection, skip if closed by server
+        while self._idle:
+            reader, writer = self._idle.pop()
+            if reader.at_eof() or writer.is_closing():
+                await close_connection(writer)
+                continue
             try:
-                pos_beg += 15  # offset
-                pos_end = header_bytes.find(b"\r\n", pos_beg)
-                body_length = int(header_bytes[pos_beg:pos_end])
-            except (AttributeError, TypeError, IndexError, ValueError):
-                body_length = 0
-        if body_length <= 0:
-            return b""
-        if body_length <= BUFFER_LIMIT:
-            return await reader.read(body_length)
-        # Exceeded buffer limit
-        temp_bytes = bytearray()
-        while body_length > 0:
-            temp_bytes.extend(await reader.read(BUFFER_LIMIT))
-            body_length -= BUFFER_LIMIT
-        return bytes(temp_bytes)
-    # Get chunked data
-    temp_bytes = bytearray()
-    while (await reader.readuntil()) != b"0\r\n":  # end chunk
-        temp_bytes[-2:] = await reader.readuntil()  # cut off CRLF
-    return bytes(temp_bytes)
+                return await self.__request(reader, writer, request, time_out)
+            except (ConnectionError, IncompleteReadError):
+                continue
+        # Open new connection
+        reader, writer = await wait_for(open_connection(self._host, self._port), time_out)
+        return await self.__request(reader, writer, request, time_out)
+
+    async def __request(
+        self, reader: StreamReader, writer: StreamWriter, request: bytes, time_out: float
+    ) -> bytes:
+        """Send request, keep connection alive if allowed"""
+        keep_alive = False
+        try:
+            writer.write(request)
+            await writer.drain()
+            body_bytes, keep_alive = await wait_for(read_response(reader), time_out)
+            return body_bytes
+        finally:
+            if keep_alive and len(self._idle) < self._max_idle:
+                self._idle.append((reader, writer))
+            else:
+                await close_connection(writer)
+
+    async def close(self) -> None:
+        """Close all idle connections"""
+        while self._idle:
+            _, writer = self._idle.pop()
+            await close_connection(writer)
+
+    @property
+    def idle(self) -> int:
+        """Number of idle connections"""
+        return len(self._idle)
 
 
 @asynccontextmanager
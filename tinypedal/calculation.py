@@ -22,9 +22,11 @@ Calculation function
 
 from __future__ import annotations
 
+from array import array
+from itertools import chain
 from math import acos, atan, atan2, ceil, cos, degrees, dist, hypot, radians, sin
 from statistics import fmean
-from typing import Any, Sequence, Tuple
+from typing import Any, Iterable, Sequence, Tuple
 
 from .const_common import FLOAT_INF
 
@@ -433,25 +435,39 @@ def sec2stinttime(seconds: float) -> str:
 
 
 def delta_telemetry(
-    dataset: list, position: float, target: float,
-    condition: bool = True, position_column: int = 0, target_column: int = 1) -> float:
-    """Calculate delta telemetry data"""
+    dataset: Sequence[float], position: float, target: float,
+    condition: bool = True, position_column: int = 0, target_column: int = 1,
+    columns: int = 2, cursor: TraceCursor | None = None) -> float:
+    """Calculate delta telemetry data from flat trace data set (row by row),
+    optionally located with trace cursor
+    """
     if not condition:
         return 0
-    index_higher = binary_search_higher_column(
-        dataset, position, 0, len(dataset) - 1, position_column)
+    end = len(dataset) // columns - 1
+    if cursor is None:
+        index_higher = binary_search_higher_flat(
+            dataset, position, 0, end, position_column, columns)
+    else:
+        index_higher = cursor.search_higher_flat(
+            dataset, position, end, position_column, columns)
     if index_higher > 0:
-        index_lower = index_higher - 1
+        offset_higher = index_higher * columns
+        offset_lower = offset_higher - columns
         return target - linear_interp(
             position,
-            dataset[index_lower][position_column],
-            dataset[index_lower][target_column],
-            dataset[index_higher][position_column],
-            dataset[index_higher][target_column],
+            dataset[offset_lower + position_column],
+            dataset[offset_lower + target_column],
+            dataset[offset_higher + position_column],
+            dataset[offset_higher + target_column],
         )
     return 0
 
 
+def trace_array(dataset: Iterable[Sequence[float]]) -> array:
+    """Convert trace row tuples to flat float array (row by row)"""
+    return array("d", chain.from_iterable(dataset))
+
+
 def exp_mov_avg(factor: float, ema_last: float, source: float) -> float:
     """Calculate exponential moving average"""
     return ema_last + factor * (source - ema_last)
@@ -541,6 +557,122 @@ def binary_search_higher_column(
     return end
 
 
+def binary_search_higher_flat(
+    data: Sequence[float], target: float, start: int, end: int,
+    column: int = 0, columns: int = 2) -> int:
+    """Binary search nearest value higher row index from ordered flat list (row by row)
+    with column index and number of columns
+    """
+    while start < end:
+        center = (start + end) // 2
+        value = data[center * columns + column]
+        if target == value:
+            return center
+        if target > value:
+            start = center + 1
+        else:
+            end = center
+    return end
+
+
+class TraceCursor:
+    """Trace cursor
+
+    Locate nearest value higher index from ordered trace data set (same result
+    as binary_search_higher_column, or binary_search_higher_flat for flat data set),
+    by walking forward from last located index while target increases monotonically,
+    such as lap distance during a lap. Fall back to binary search on data set change,
+    backward move, or forward jump exceeding max steps.
+
+    Args:
+        max_steps: max forward walking steps before fall back to binary search.
+    """
+
+    __slots__ = (
+        "_data",
+        "_end",
+        "_index",
+        "_max_steps",
+    )
+
+    def __init__(self, max_steps: int = 8):
+        self._data: Sequence | None = None
+        self._end = -1
+        self._index = 0
+        self._max_steps = max_steps
+
+    def reset(self) -> None:
+        """Reset cursor, next search uses binary search"""
+        self._data = None
+
+    def search_higher(
+        self, data: Sequence[Sequence], target: float, end: int, column: int = 0) -> int:
+        """Search nearest value higher index from ordered list with column index
+
+        Args:
+            data: ordered data set, change is detected by identity.
+            target: target value.
+            end: end index (inclusive).
+            column: column index.
+
+        Returns:
+            Nearest value higher index.
+        """
+        index = self._index
+        if data is not self._data or end != self._end:
+            self._data = data
+            self._end = end
+            index = binary_search_higher_column(data, target, 0, end, column)
+        elif index > 0 and data[index - 1][column] > target:  # moved backward
+            index = binary_search_higher_column(data, target, 0, index - 1, column)
+        else:
+            steps = self._max_steps
+            while index < end and data[index][column] < target:
+                if steps <= 0:  # jumped forward
+                    index = binary_search_higher_column(data, target, index, end, column)
+                    break
+                index += 1
+                steps -= 1
+        self._index = index
+        return index
+
+    def search_higher_flat(
+        self, data: Sequence[float], target: float, end: int,
+        column: int = 0, columns: int = 2) -> int:
+        """Search nearest value higher row index from ordered flat list (row by row)
+        with column index and number of columns
+
+        Args:
+            data: ordered flat data set, change is detected by identity.
+            target: target value.
+            end: end row index (inclusive).
+            column: column index.
+            columns: number of columns per row.
+
+        Returns:
+            Nearest value higher row index.
+        """
+        index = self._index
+        if data is not self._data or end != self._end:
+            self._data = data
+            self._end = end
+            index = binary_search_higher_flat(data, target, 0, end, column, columns)
+        elif index > 0 and data[(index - 1) * columns + column] > target:  # moved backward
+            index = binary_search_higher_flat(data, target, 0, index - 1, column, columns)
+        else:
+            steps = self._max_steps
+            offset = index * columns + column
+            while index < end and data[offset] < target:
+                if steps <= 0:  # jumped forward
+                    index = binary_search_higher_flat(data, target, index, end, column, columns)
+                    break
+                index += 1
+                offset += columns
+                steps -= 1
+        self._index = index
+        return index
+
+
 def select_grade(data: Sequence[Sequence], source: float) -> Any:
     """Select grade (linear lower) from reference list (column: 0 target, 1 value)"""
     last = data[0][1]
@@ -36,6 +36,14 @@ API_RF2_NAME = "rFactor 2"
 API_RF2_ALIAS = "RF2"
 API_RF2_CONFIG = "api_rf2"
 
+API_REPLAY_NAME = "Replay"
+API_REPLAY_ALIAS = "REPLAY"
+API_REPLAY_CONFIG = "api_replay"
+
+API_SYNTHETIC_NAME = "Synthetic"
+API_SYNTHETIC_ALIAS = "SYNTH"
+API_SYNTHETIC_CONFIG = "api_synthetic"
+
 # DEFAULT API
 if PLATFORM.WINDOWS:
     API_DEFAULT_NAME = API_LMU_NAME
@@ -47,9 +55,13 @@ API_MAP_ALIAS = MappingProxyType({
     API_LMU_NAME: API_LMU_ALIAS,
     API_LMULEGACY_NAME: API_LMULEGACY_ALIAS,
     API_RF2_NAME: API_RF2_ALIAS,
+    API_REPLAY_NAME: API_REPLAY_ALIAS,
+    API_SYNTHETIC_NAME: API_SYNTHETIC_ALIAS,
 })
 API_MAP_CONFIG = MappingProxyType({
     API_LMU_NAME: API_LMU_CONFIG,
     API_LMULEGACY_NAME: API_LMULEGACY_CONFIG,
     API_RF2_NAME: API_RF2_CONFIG,
+    API_REPLAY_NAME: API_REPLAY_CONFIG,
+    API_SYNTHETIC_NAME: API_SYNTHETIC_CONFIG,
 })
@@ -44,6 +44,8 @@ CRLF = "\r\n"
 EMPTY_DICT: MappingProxyType = MappingProxyType({})
 DELTA_ZERO = (0.0, 0.0)  # pos, target
 DELTA_DEFAULT = (DELTA_ZERO,)
+DELTA_TRACE_DEFAULT = DELTA_ZERO  # flat trace (row by row), single zero row of pos, target
+FUEL_DELTA_ZERO = (0.0, 0.0, 0.0)  # pos, used, laptime
 POS_XY_ZERO = (0.0, 0.0)  # world origin position
 POS_XYZ_ZERO = (0.0, 0.0, 0.0)  # world origin position
 POS_XYZ_INF = (FLOAT_INF, FLOAT_INF, FLOAT_INF)  # infinite position
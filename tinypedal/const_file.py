@@ -73,6 +73,10 @@ class FileExt:
     SECTOR = ".sector"
     TPPN = ".tppn"
     TPTN = ".tptn"
+    TPDB = ".tpdb"
+    TPED = ".tped"
+    TPFD = ".tpfd"
+    TPCAP = ".tpcap"
     STATS = ".stats"
     LOCK = ".lock"
     TYRESTRATEGY = ".tyre-strategy"
@@ -67,7 +67,7 @@ def hotkey_vr_compatibility():
 
 def hotkey_restart_api():
     """Command - restart api"""
-    api.restart()
+    loader.restart_api()
     app_signal.refresh.emit(True)
 
 
@@ -86,7 +86,7 @@ def hotkey_select_next_api():
     else:
         save_type = ConfigType.CONFIG
     cfg.save(config_type=save_type)
-    api.restart()
+    loader.restart_api()
     app_signal.refresh.emit(True)
 
 
@@ -105,7 +105,7 @@ def hotkey_select_previous_api():
     else:
         save_type = ConfigType.CONFIG
     cfg.save(config_type=save_type)
-    api.restart()
+    loader.restart_api()
     app_signal.refresh.emit(True)
 
 
@@ -158,7 +158,7 @@ def hotkey_spectate_next_driver():
     for player_index in range(total_vehicles):
         if api.read.vehicle.place(player_index) == place:
             cfg.api["player_index"] = player_index
-            api.setup()
+            loader.setup_api()
             cfg.save()
             return
 
@@ -174,7 +174,7 @@ def hotkey_spectate_previous_driver():
     for player_index in range(total_vehicles):
         if api.read.vehicle.place(player_index) == place:
             cfg.api["player_index"] = player_index
-            api.setup()
+            loader.setup_api()
             cfg.save()
             return
 
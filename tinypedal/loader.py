@@ -32,9 +32,11 @@ from .api_control import api
 from .const_file import FileExt
 from .hotkey_control import kctrl
 from .module_control import mctrl, wctrl
+from .module_worker import module_worker
 from .overlay_control import octrl
 from .setting import cfg
 from .update import update_checker
+from .widget._painter import text_pixmap_cache
 
 logger = logging.getLogger(__name__)
 
@@ -57,8 +59,10 @@ def start():
     api.connect()
     api.start()
     # 3 start modules
+    module_worker.start()
     mctrl.start()
     # 4 start widgets
+    setup_widget_resource()
     wctrl.start()
     # 5 start main window
     from .ui.app import AppWindow
@@ -133,12 +137,41 @@ def reload(reload_preset: bool = False):
     load_modules()
 
 
+def restart_api():
+    """Restart api
+
+    In multi-process mode, reload modules with api, so that module worker
+    process reconnects to same (newly selected) api as GUI process, or falls
+    back to single process if selected api is not supported by module worker.
+    """
+    if cfg.application["enable_multiprocess_mode"]:
+        reload()
+    else:
+        api.restart()
+
+
+def setup_api():
+    """Setup & apply API changes (such as spectate), also apply to module worker process"""
+    api.setup()
+    module_worker.send("setup_api", cfg.api_key, dict(cfg.api))
+
+
+def setup_widget_resource():
+    """Setup resource shared by all widgets, once before starting widgets"""
+    text_pixmap_cache.setup(
+        cfg.application["enable_text_pixmap_cache"],
+        cfg.application["text_pixmap_cache_size"],
+    )
+
+
 def load_modules():
     """Load modules, widgets"""
     octrl.enable()  # 1 overlay control
-    mctrl.start()  # 2 module
-    wctrl.start()  # 3 widget
-    kctrl.enable()  # 4 hotkey
+    module_worker.start()  # 2 module worker (multi-process mode)
+    mctrl.start()  # 3 module
+    setup_widget_resource()
+    wctrl.start()  # 4 widget
+    kctrl.enable()  # 5 hotkey
 
 
 def unload_modules():
@@ -146,4 +179,5 @@ def unload_modules():
     kctrl.disable()  # 1 hotkey
     wctrl.close()  # 2 widget
     mctrl.close()  # 3 module
-    octrl.disable()  # 4 overlay control
+    module_worker.close()  # 4 module worker (multi-process mode)
+    octrl.disable()  # 5 overlay control
@@ -24,6 +24,8 @@ import logging
 import threading
 from functools import partial
 
+from ..adapter.frame_bus import frame_bus
+from ..profiler import ProfileStats, profiler
 from ..setting import Setting
 
 logger = logging.getLogger(__name__)
@@ -43,6 +45,8 @@ class DataModule:
         "active_interval",
         "idle_interval",
         "_event",
+        "_new_frame",
+        "_profile",
     )
 
     def __init__(self, config: Setting, module_name: str):
@@ -57,6 +61,8 @@ class DataModule:
 
         # Module update interval
         self._event = threading.Event()
+        self._new_frame = threading.Event()
+        self._profile: ProfileStats | None = None
         self.active_interval = max(
             self.mcfg["update_interval"],
             self.cfg.application["minimum_update_interval"]) / 1000
@@ -70,12 +76,44 @@ class DataModule:
         if self.closed:
             self.closed = False
             self._event.clear()
+            self._new_frame = frame_bus.subscribe()
+            if self.cfg.application["enable_performance_profiler"]:
+                self._profile = profiler.register(
+                    self.module_name, "module", self.active_interval)
+            else:
+                self._profile = None
             threading.Thread(target=self.__tasks, daemon=True).start()
             logger.info("ENABLED: %s", self.module_name.replace("_", " "))
 
     def stop(self):
         """Stop update thread"""
         self._event.set()
+        self._new_frame.set()  # wake up from frame waiting
+
+    def wait_frame(self, interval: float) -> bool:
+        """Wait for new telemetry frame
+
+        Wait for update interval first (as update rate limit).
+        If in active interval, continue waiting until new frame published,
+        or until idle interval timeout if no new frame available.
+
+        Args:
+            interval: update interval (seconds).
+
+        Returns:
+            True if stopped, same as threading.Event.wait().
+        """
+        profile = self._profile
+        if profile is not None:  # time last loop iteration
+            profile.end()
+        if self._event.wait(interval):
+            return True
+        if interval < self.idle_interval:
+            self._new_frame.wait(self.idle_interval)
+            self._new_frame.clear()
+        if profile is not None:
+            profile.begin()
+        return self._event.is_set()
 
     def update_data(self):
         """Update module data, rewrite in child class"""
@@ -84,5 +122,6 @@ class DataModule:
         """Run tasks in separated thread"""
         self.update_data()
         # Wait update_data exit
+        frame_bus.unsubscribe(self._new_frame)
         self.closed = True
         logger.info("DISABLED: %s", self.module_name.replace("_", " "))
@@ -27,6 +27,7 @@ from .. import realtime_state
 from ..api_control import api
 from ..const_common import (
     DELTA_DEFAULT,
+    DELTA_TRACE_DEFAULT,
     DELTA_ZERO,
     FLOAT_INF,
     MAX_SECONDS,
@@ -48,7 +49,7 @@ class Realtime(DataModule):
 
     def update_data(self):
         """Update module data"""
-        _event_wait = self._event.wait
+        _event_wait = self.wait_frame
         reset = False
         update_interval = self.idle_interval
 
@@ -56,8 +57,8 @@ class Realtime(DataModule):
         output = minfo.delta
 
         last_session_id = ("",-1,-1,-1)
-        delta_array_session = DELTA_DEFAULT
-        delta_array_stint = DELTA_DEFAULT
+        delta_array_session = DELTA_TRACE_DEFAULT
+        delta_array_stint = DELTA_TRACE_DEFAULT
         laptime_session_best = MAX_SECONDS
         laptime_stint_best = MAX_SECONDS
         min_delta_distance = self.mcfg["minimum_delta_distance"]
@@ -90,24 +91,29 @@ class Realtime(DataModule):
 
                     # Reset delta session best if not same session
                     if not is_same_session(combo_name, session_id, last_session_id):
-                        delta_array_session = DELTA_DEFAULT
+                        delta_array_session = DELTA_TRACE_DEFAULT
                         laptime_session_best = MAX_SECONDS
                         last_session_id = (combo_name, *session_id)
 
                     delta_array_best, laptime_best = load_delta_best_file(
                         filepath=userpath_delta_best,
                         filename=combo_name,
-                        defaults=(DELTA_DEFAULT, MAX_SECONDS)
+                        defaults=(DELTA_TRACE_DEFAULT, MAX_SECONDS)
                     )
                     output.deltaBestData = delta_array_best
                     delta_array_raw = [DELTA_ZERO]  # distance, laptime
-                    delta_array_last = DELTA_DEFAULT  # last lap
+                    delta_array_last = DELTA_TRACE_DEFAULT  # last lap
 
                     delta_ema_best = 0.0
                     delta_ema_last = 0.0
                     delta_ema_session = 0.0
                     delta_ema_stint = 0.0
 
+                    cursor_best = calc.TraceCursor()
+                    cursor_last = calc.TraceCursor()
+                    cursor_session = calc.TraceCursor()
+                    cursor_stint = calc.TraceCursor()
+
                     laptime_curr = 0.0  # current laptime
                     laptime_last = 0.0  # last laptime
                     laptime_pace = api.read.timing.reference_laptime(laptime=laptime_best)
@@ -132,7 +138,7 @@ class Realtime(DataModule):
 
                 # Reset delta stint best if in pit and stopped
                 if in_pits and laptime_stint_best != MAX_SECONDS and api.read.vehicle.speed() < 0.1:
-                    delta_array_stint = DELTA_DEFAULT
+                    delta_array_stint = DELTA_TRACE_DEFAULT
                     laptime_stint_best = MAX_SECONDS
 
                 # Lap start & finish detection
@@ -140,7 +146,7 @@ class Realtime(DataModule):
                     laptime_last = lap_stime - last_lap_stime
                     if valid_delta_raw(delta_array_raw, laptime_last, 1):  # set end value
                         delta_array_raw.append((round6(pos_last + 10), round6(laptime_last)))
-                        delta_array_last = tuple(delta_array_raw)
+                        delta_array_last = calc.trace_array(delta_array_raw)
                         validating = api.read.timing.elapsed()
                     delta_array_raw[:] = DELTA_DEFAULT
                     pos_last = pos_recorded = pos_curr
@@ -222,6 +228,7 @@ class Realtime(DataModule):
                             pos_synced,
                             laptime_curr,
                             delay_update,
+                            cursor=cursor_best,
                         ),
                     )
                     delta_ema_last = calc_ema_delta(
@@ -231,6 +238,7 @@ class Realtime(DataModule):
                             pos_synced,
                             laptime_curr,
                             delay_update,
+                            cursor=cursor_last,
                         ),
                     )
                     delta_ema_session = calc_ema_delta(
@@ -240,6 +248,7 @@ class Realtime(DataModule):
                             pos_synced,
                             laptime_curr,
                             delay_update,
+                            cursor=cursor_session,
                         ),
                     )
                     delta_ema_stint = calc_ema_delta(
@@ -249,6 +258,7 @@ class Realtime(DataModule):
                             pos_synced,
                             laptime_curr,
                             delay_update,
+                            cursor=cursor_stint,
                         ),
                     )
 
@@ -275,6 +285,7 @@ class Realtime(DataModule):
                 output.lapTimeStint = laptime_stint_best
                 output.lapTimePace = laptime_pace
                 output.lapDistance = pos_synced
+                output.version += 1
 
             else:
                 if reset:
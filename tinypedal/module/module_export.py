@@ -0,0 +1,213 @@
+#  TinyPedal is an open-source overlay application for racing simulation.
+#  Copyright (C) 2022-2026 TinyPedal developers, see contributors.md file
+#
+#  This file is part of TinyPedal.
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Export module
+
+Publish selected module info data as fixed layout binary snapshot
+via named shared memory, for external tools on same machine.
+
+Shared memory layout (little-endian):
+    header: magic, layout version, active state, data size, sequence, frame version.
+    data: EXPORT_FIELDS values in order, then standings count & vehicle indexes.
+
+Sequence is a seqlock counter, which is odd while writing, and even after written.
+Reader should read sequence (retry if odd), copy data, then read sequence again,
+and discard copied data if sequence changed.
+"""
+
+from __future__ import annotations
+
+import logging
+import mmap
+import os
+import struct
+from operator import attrgetter
+
+from .. import realtime_state
+from ..adapter.frame_bus import frame_bus
+from ..const_app import PLATFORM
+from ..const_common import MAX_VEHICLES
+from ..formatter import strip_invalid_char
+from ..module_info import minfo
+from ._base import DataModule
+
+EXPORT_MAGIC = b"TPMI"
+EXPORT_VERSION = 1
+EXPORT_HEADER = struct.Struct("<4sHHIIQ")
+SEQUENCE = struct.Struct("<I")
+SEQUENCE_OFFSET = 12
+ACTIVE = struct.Struct("<H")
+ACTIVE_OFFSET = 6
+FRAME_VERSION = struct.Struct("<Q")
+FRAME_VERSION_OFFSET = 16
+EXPORT_FIELDS = (
+    # Module info path, struct format
+    ("delta.deltaBest", "d"),
+    ("delta.deltaLast", "d"),
+    ("delta.deltaSession", "d"),
+    ("delta.deltaStint", "d"),
+    ("delta.isValidLap", "?"),
+    ("delta.lapTimeCurrent", "d"),
+    ("delta.lapTimeLast", "d"),
+    ("delta.lapTimeBest", "d"),
+    ("delta.lapTimeEstimated", "d"),
+    ("delta.lapTimeSession", "d"),
+    ("delta.lapTimeStint", "d"),
+    ("delta.lapTimePace", "d"),
+    ("fuel.capacity", "d"),
+    ("fuel.amountCurrent", "d"),
+    ("fuel.amountEndStint", "d"),
+    ("fuel.neededRelative", "d"),
+    ("fuel.estimatedConsumption", "d"),
+    ("fuel.estimatedLaps", "d"),
+    ("fuel.estimatedMinutes", "d"),
+    ("fuel.estimatedNumPitStopsEnd", "d"),
+    ("fuel.deltaConsumption", "d"),
+    ("fuel.oneLessPitConsumption", "d"),
+    ("energy.capacity", "d"),
+    ("energy.amountCurrent", "d"),
+    ("energy.amountEndStint", "d"),
+    ("energy.neededRelative", "d"),
+    ("energy.estimatedConsumption", "d"),
+    ("energy.estimatedLaps", "d"),
+    ("energy.estimatedMinutes", "d"),
+    ("energy.estimatedNumPitStopsEnd", "d"),
+    ("energy.deltaConsumption", "d"),
+    ("energy.oneLessPitConsumption", "d"),
+    ("force.lgtGForceRaw", "d"),
+    ("force.latGForceRaw", "d"),
+    ("force.downForceRatio", "d"),
+    ("wheels.currentTreadDepth", "4d"),
+    ("wheels.estimatedTreadWear", "4d"),
+    ("wheels.currentBrakeThickness", "4d"),
+    ("wheels.estimatedBrakeWear", "4d"),
+    ("vehicles.playerIndex", "h"),
+    ("vehicles.leaderIndex", "h"),
+    ("vehicles.totalVehicles", "h"),
+)
+EXPORT_DATA = struct.Struct(
+    "<" + "".join(fmt for _, fmt in EXPORT_FIELDS) + f"H{MAX_VEHICLES}h")
+
+logger = logging.getLogger(__name__)
+
+
+class Realtime(DataModule):
+    """Export data"""
+
+    __slots__ = ()
+
+    def __init__(self, config, module_name):
+        super().__init__(config, module_name)
+
+    def update_data(self):
+        """Update module data"""
+        _event_wait = self.wait_frame
+        reset = False
+        update_interval = self.idle_interval
+
+        name = strip_invalid_char(self.mcfg["shared_memory_name"]) or "TinyPedal_ModuleInfo"
+        try:
+            shared_data = SharedMemoryWriter(name, EXPORT_HEADER.size + EXPORT_DATA.size)
+        except (OSError, ValueError):
+            logger.error("EXPORT: failed creating shared memory: %s", name)
+            return
+        getters = tuple(
+            (attrgetter(path), fmt[0].isdigit()) for path, fmt in EXPORT_FIELDS
+        )
+        standings_padding = (-1,) * MAX_VEHICLES
+
+        while not _event_wait(update_interval):
+            if realtime_state.active:
+
+                if not reset:
+                    reset = True
+                    update_interval = self.active_interval
+                    shared_data.set_active(True)
+
+                values = []
+                for getter, is_array in getters:
+                    if is_array:
+                        values.extend(getter(minfo))
+                    else:
+                        values.append(getter(minfo))
+                standings = minfo.relative.standings[:MAX_VEHICLES]
+                values.append(len(standings))
+                values.extend(standings)
+                values.extend(standings_padding[len(standings):])
+                shared_data.write(values, frame_bus.version)
+
+            else:
+                if reset:
+                    reset = False
+                    update_interval = self.idle_interval
+                    shared_data.set_active(False)
+
+        shared_data.close()
+
+
+class SharedMemoryWriter:
+    """Named shared memory writer with seqlock
+
+    Args:
+        name: shared memory name.
+        size: shared memory size in bytes.
+    """
+
+    __slots__ = (
+        "_filename",
+        "_mmap",
+        "_sequence",
+    )
+
+    def __init__(self, name: str, size: int):
+        if PLATFORM.WINDOWS:
+            self._filename = ""
+            self._mmap = mmap.mmap(-1, size, tagname=name)
+        else:
+            self._filename = f"/dev/shm/{name}"
+            with open(self._filename, "w+b") as file:
+                file.truncate(size)
+                self._mmap = mmap.mmap(file.fileno(), size)
+        self._sequence = 0
+        EXPORT_HEADER.pack_into(
+            self._mmap, 0, EXPORT_MAGIC, EXPORT_VERSION, 0, EXPORT_DATA.size, 0, 0)
+        logger.info("EXPORT: shared memory created: %s", name)
+
+    def set_active(self, active: bool):
+        """Set active state"""
+        ACTIVE.pack_into(self._mmap, ACTIVE_OFFSET, active)
+
+    def write(self, values: list, frame_version: int):
+        """Write data, sequence is odd while writing"""
+        data = self._mmap
+        self._sequence = (self._sequence + 1) & 0xFFFFFFFF
+        SEQUENCE.pack_into(data, SEQUENCE_OFFSET, self._sequence)
+        EXPORT_DATA.pack_into(data, EXPORT_HEADER.size, *values)
+        FRAME_VERSION.pack_into(data, FRAME_VERSION_OFFSET, frame_version)
+        self._sequence = (self._sequence + 1) & 0xFFFFFFFF
+        SEQUENCE.pack_into(data, SEQUENCE_OFFSET, self._sequence)
+
+    def close(self):
+        """Close shared memory"""
+        self._mmap.close()
+        if self._filename:
+            try:
+                os.remove(self._filename)
+            except OSError:
+                pass
@@ -40,7 +40,7 @@ class Realtime(DataModule):
 
     def update_data(self):
         """Update module data"""
-        _event_wait = self._event.wait
+        _event_wait = self.wait_frame
         reset = False
         update_interval = self.idle_interval
 
@@ -127,6 +127,7 @@ class Realtime(DataModule):
                 output.transientMaxBrakingRate = max_transient_rate
                 output.maxBrakingRate = max_braking_rate
                 output.deltaBrakingRate = delta_braking_rate
+                output.version += 1
 
             else:
                 if reset:
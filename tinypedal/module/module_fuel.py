@@ -29,10 +29,14 @@ from .. import calculation as calc
 from .. import realtime_state
 from ..api_control import api
 from ..const_api import API_RF2_NAME
-from ..const_common import DELTA_DEFAULT, DELTA_ZERO, FLOAT_INF, POS_XYZ_ZERO
+from ..const_common import FLOAT_INF, FUEL_DELTA_ZERO, POS_XYZ_ZERO
 from ..const_file import FileExt
 from ..module_info import FuelInfo, minfo
-from ..userfile.fuel_delta import load_fuel_delta_file, save_fuel_delta_file
+from ..userfile.fuel_delta import (
+    FUEL_DELTA_COLUMNS,
+    load_fuel_delta_file,
+    save_fuel_delta_file,
+)
 from ..validator import generator_init, valid_delta_raw
 from ._base import DataModule, round6
 
@@ -47,7 +51,7 @@ class Realtime(DataModule):
 
     def update_data(self):
         """Update module data"""
-        _event_wait = self._event.wait
+        _event_wait = self.wait_frame
         reset = False
         update_interval = self.idle_interval
 
@@ -67,7 +71,7 @@ class Realtime(DataModule):
                         telemetry_func=detect_consumption_type(),
                         filepath=userpath_fuel_delta,
                         filename=combo_name,
-                        extension=FileExt.FUEL,
+                        extension=FileExt.TPFD,
                         min_delta_distance=self.mcfg["minimum_delta_distance"],
                     )
                     gen_energy_usage = calc_consumption(
@@ -75,7 +79,7 @@ class Realtime(DataModule):
                         telemetry_func=telemetry_energy,
                         filepath=userpath_energy_delta,
                         filename=combo_name,
-                        extension=FileExt.ENERGY,
+                        extension=FileExt.TPED,
                         min_delta_distance=self.mcfg["minimum_delta_distance"],
                     )
                     # Reset module output
@@ -85,6 +89,7 @@ class Realtime(DataModule):
 
                 # Calculate fuel
                 gen_fuel_usage.send(True)
+                minfo.fuel.version += 1
 
                 # Calculate virtual energy if available
                 minfo.energy.available = (api.read.vehicle.virtual_energy() != 0)
@@ -99,6 +104,8 @@ class Realtime(DataModule):
                     minfo.hybrid.fuelEnergyBias = (
                         minfo.fuel.estimatedLaps - minfo.energy.estimatedLaps
                     )
+                    minfo.hybrid.version += 1
+                minfo.energy.version += 1
 
             else:
                 if reset:
@@ -151,11 +158,12 @@ def calc_consumption(
         filepath=filepath,
         filename=filename,
         extension=extension,
-        defaults=(DELTA_DEFAULT, 0.0, 0.0)
+        defaults=(FUEL_DELTA_ZERO, 0.0, 0.0)
     )
-    delta_array_raw = [DELTA_ZERO]  # distance, fuel used, laptime
-    delta_array_temp = DELTA_DEFAULT  # last lap temp
+    delta_array_raw = [FUEL_DELTA_ZERO]  # distance, fuel used, laptime
+    delta_array_temp = FUEL_DELTA_ZERO  # last lap temp (flat trace)
     delta_fuel = 0.0  # delta fuel consumption compare to last lap
+    delta_cursor = calc.TraceCursor()  # last lap delta trace cursor
 
     amount_start = -FLOAT_INF  # start fuel reading
     amount_last = 0.0  # last fuel reading
@@ -230,9 +238,9 @@ def calc_consumption(
                     round6(used_curr),
                     round6(lap_stime - last_lap_stime)
                 ))
-                delta_array_temp = tuple(delta_array_raw)
+                delta_array_temp = calc.trace_array(delta_array_raw)
                 validating = api.read.timing.elapsed()
-            delta_array_raw[:] = DELTA_DEFAULT
+            delta_array_raw[:] = (FUEL_DELTA_ZERO,)
             pos_last = pos_recorded = pos_curr
             used_last_raw = used_curr
             used_curr = 0
@@ -247,7 +255,7 @@ def calc_consumption(
         # Update if position value is different & positive
         if 0 <= pos_curr != pos_last:
             if recording and pos_curr - pos_recorded >= min_delta_distance:
-                delta_array_raw.append((round6(pos_curr), round6(used_curr)))
+                delta_array_raw.append((round6(pos_curr), round6(used_curr), round6(laptime_curr)))
                 pos_recorded = pos_curr
             pos_last = pos_curr  # reset last position
             is_pos_synced = True
@@ -261,7 +269,7 @@ def calc_consumption(
                 api.read.timing.last_laptime() > 0):  # is valid laptime
                 used_last_valid = used_last_raw
                 delta_array_last = delta_array_temp
-                delta_array_temp = DELTA_DEFAULT
+                delta_array_temp = FUEL_DELTA_ZERO
                 delayed_save = True
                 validating = 0
 
@@ -279,6 +287,8 @@ def calc_consumption(
                 pos_estimate,
                 used_curr,
                 laptime_curr > 0.3 and not in_garage,  # 300ms delay
+                columns=FUEL_DELTA_COLUMNS,
+                cursor=delta_cursor,
             )
 
         # Exclude first lap & pit in/out lap
@@ -23,7 +23,7 @@ Hybrid module
 from .. import calculation as calc
 from .. import realtime_state
 from ..api_control import api
-from ..const_common import DELTA_DEFAULT, DELTA_ZERO, FLOAT_INF, MAX_SECONDS
+from ..const_common import DELTA_DEFAULT, DELTA_TRACE_DEFAULT, DELTA_ZERO, FLOAT_INF, MAX_SECONDS
 from ..module_info import minfo
 from ._base import DataModule
 
@@ -38,7 +38,7 @@ class Realtime(DataModule):
 
     def update_data(self):
         """Update module data"""
-        _event_wait = self._event.wait
+        _event_wait = self.wait_frame
         reset = False
         update_interval = self.idle_interval
 
@@ -69,7 +69,8 @@ class Realtime(DataModule):
                     delta_reset = False
                     delta_recording = False
                     delta_array_raw = [DELTA_ZERO]  # distance, battery net change
-                    delta_array_last = DELTA_DEFAULT
+                    delta_array_last = DELTA_TRACE_DEFAULT  # flat trace
+                    delta_cursor = calc.TraceCursor()  # last lap delta trace cursor
                     pos_last = 0.0  # last checked vehicle position
                     net_change_last = 0.0
                     est_net_change = 0.0  # estimated battery charge net change
@@ -142,12 +143,12 @@ class Realtime(DataModule):
                     if delta_reset:
                         delta_reset = False
                         if len(delta_array_raw) > 1 and not is_pit_lap:
-                            delta_array_last = tuple(delta_array_raw)
+                            delta_array_last = calc.trace_array(delta_array_raw)
                         delta_array_raw[:] = DELTA_DEFAULT
                         pos_last = pos_curr
                         delta_recording = laptime_curr < 1
                         net_change_last = battery_regen_last - battery_drain_last
-                        is_valid_delta = len(delta_array_last) > 1
+                        is_valid_delta = len(delta_array_last) > 2  # more than 1 row
                         is_pit_lap = 0
 
                     # Distance desync check at start of new lap, reset if higher than normal distance
@@ -169,6 +170,7 @@ class Realtime(DataModule):
                             pos_curr,
                             net_change_curr,
                             laptime_curr > 0.3,
+                            cursor=delta_cursor,
                         )
                         est_net_change = net_change_last + delta_net_change
 
@@ -182,6 +184,7 @@ class Realtime(DataModule):
                 output.motorActiveTimer = motor_active_timer
                 output.motorInactiveTimer = motor_inactive_timer
                 output.motorState = motor_state
+                output.version += 1
 
             else:
                 if reset:
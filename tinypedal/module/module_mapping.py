@@ -41,7 +41,7 @@ class Realtime(DataModule):
 
     def update_data(self):
         """Update module data"""
-        _event_wait = self._event.wait
+        _event_wait = self.wait_frame
         reset = False
         update_interval = self.idle_interval
 
@@ -63,6 +63,7 @@ class Realtime(DataModule):
                         output.elevations = recorder.output.dists
                         output.sectors = recorder.output.sectors
                         output.lastModified = recorder.last_modified
+                        output.version += 1
                     else:
                         recorder.reset()
                         output.reset()
@@ -109,11 +110,13 @@ def update_track_info(output: MappingInfo, track_name: str):
     pit_speed = load_track_info(track_name, "pit_speed")
     output.speedTrapPosition = load_track_info(track_name, "speed_trap")
     output.sunlightPhases = set_sunlight_phase(load_track_info(track_name, "sunrise"), load_track_info(track_name, "sunset"))
+    output.version += 1
     # Set default
     pos_last = 0.0
     last_speed = 0.0
     pitlane_length = 0.0
     last_in_pits = -1
+    last_pit_info = None
     while True:
         # Save check
         updating = yield None
@@ -156,11 +159,16 @@ def update_track_info(output: MappingInfo, track_name: str):
                 pit_exit,
             )
 
-        output.pitSpeedLimit = pit_speed
-        output.pitEntryPosition = pit_entry
-        output.pitExitPosition = pit_exit
-        output.pitLaneLength = pitlane_length
-        output.pitPassTime = pitlane_length / pit_speed if pit_speed else 0.0
+        # Output only if changed
+        pit_info = (pit_speed, pit_entry, pit_exit, pitlane_length)
+        if last_pit_info != pit_info:
+            last_pit_info = pit_info
+            output.pitSpeedLimit = pit_speed
+            output.pitEntryPosition = pit_entry
+            output.pitExitPosition = pit_exit
+            output.pitLaneLength = pitlane_length
+            output.pitPassTime = pitlane_length / pit_speed if pit_speed else 0.0
+            output.version += 1
 
 
 class MapCoords:
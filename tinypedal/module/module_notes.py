@@ -50,7 +50,7 @@ class Realtime(DataModule):
 
     def update_data(self):
         """Update module data"""
-        _event_wait = self._event.wait
+        _event_wait = self.wait_frame
         reset = False
         update_interval = self.idle_interval
 
@@ -164,6 +164,7 @@ def notes_selector(output: NotesInfo, dataset: list[Mapping]):
         output.currentNote = dataset[curr_index]
         output.nextIndex = next_index
         output.nextNote = dataset[next_index]
+        output.version += 1
 
 
 def reference_position(notes: list[Mapping]) -> tuple[float, ...]:
@@ -15,18 +15,18 @@
 #
 #  You should have received a copy of the GNU General Public License
 #  along with this program.  If not, see <https://www.gnu.org/licenses/>.
-
 """
 Relative module
 """
 
 from __future__ import annotations
 
+from array import array
 from functools import lru_cache
 from itertools import chain
-from operator import itemgetter
 
 from .. import realtime_state
+from ..adapter.snapshot import VehicleSnapshot
 from ..api_control import api
 from ..calculation import asym_max
 from ..const_common import MAX_SECONDS, MAX_VEHICLES
@@ -35,11 +35,7 @@ from ..validator import state_timer
 from ._base import DataModule
 
 REF_PLACES = tuple(range(1, MAX_VEHICLES + 1))
-TEMP_RELATIVE_AHEAD = [(0.0, -1)] * MAX_VEHICLES
-TEMP_RELATIVE_BEHIND = [(0.0, -1)] * MAX_VEHICLES
-TEMP_CLASSES = [("", -1, -1, -1.0, -1.0)] * MAX_VEHICLES
 TEMP_CLASSES_POS = [[0, 1, "", 0.0, -1, -1, -1, False] for _ in range(MAX_VEHICLES)]
-TEMP_DRAW_ORDER = list(range(MAX_VEHICLES))
 
 
 class Realtime(DataModule):
@@ -52,7 +48,7 @@ class Realtime(DataModule):
 
     def update_data(self):
         """Update module data"""
-        _event_wait = self._event.wait
+        _event_wait = self.wait_frame
         reset = False
         update_interval = self.idle_interval
 
@@ -60,6 +56,7 @@ class Realtime(DataModule):
         setting_relative = self.cfg.user.setting["relative"]
         setting_standings = self.cfg.user.setting["standings"]
         last_version_update = None
+        vehicle_order = VehicleOrder()
 
         gen_one_second_timer = state_timer(1.0)
 
@@ -88,43 +85,44 @@ class Realtime(DataModule):
                         setting_standings["maximum_vehicles_per_split_player"], min_top_veh, 2)
 
                 # Base info
-                veh_total = max(api.read.vehicle.total_vehicles(), 1)
+                vehicles = api.read.vehicle.snapshot()
+                veh_total = max(vehicles.total, 1)
                 plr_index = api.read.vehicle.player_index()
                 plr_place = api.read.vehicle.place()
 
-                # Get vehicles info
-                (relative_ahead, relative_behind, classes_list, draw_order_list, is_multi_class,
-                 ) = get_vehicles_info(
-                    veh_total, plr_index, show_in_garage, next(gen_one_second_timer),
+                # Update vehicle order (only re-sort while place or class changed)
+                vehicle_order.update(vehicles, veh_total)
+
+                # Get relative time gap
+                relative_ahead, relative_behind = calc_relative_gap(
+                    vehicles, veh_total, plr_index, show_in_garage, next(gen_one_second_timer),
                     output.relativeDeltaAhead, output.relativeDeltaBehind)
 
-                # Create vehicle class position list (initially ordered by class name)
+                # Create vehicle class position list (ordered by player index)
                 class_pos_list, plr_class_name, plr_class_place = create_position_in_class(
-                    classes_list, plr_index)
+                    vehicles, vehicle_order.by_class, veh_total, plr_index)
 
                 # Create standings index list
                 if is_exclusive_mode:  # single class exclusive list
                     standings_index_list = standings_index_from_same_class(
-                        min_top_veh, class_pos_list, plr_class_name, plr_class_place,
+                        min_top_veh, vehicle_order, plr_class_name, plr_class_place,
                         veh_limit_exclusive)
-                elif is_split_mode and is_multi_class:  # multi-class split list
+                elif is_split_mode and vehicle_order.is_multi_class:  # multi-class split list
                     standings_index_list = list(chain(*list(standings_index_from_all_classes(
-                        min_top_veh, class_pos_list, plr_class_name, plr_class_place,
+                        min_top_veh, vehicle_order, plr_class_name, plr_class_place,
                         veh_limit_other, veh_limit_player))))
                 else:  # mixed class list
-                    classes_list.sort(key=itemgetter(1))  # sort by overall position
                     standings_index_list = calc_standings_index(
-                        min_top_veh, veh_limit_combined, plr_place, classes_list, 2)
-
-                # Sort vehicle class position list (by player index) for output
-                class_pos_list.sort()
+                        min_top_veh, veh_limit_combined, plr_place, vehicle_order.by_place)
 
                 # Output data
                 output.relativeAhead = relative_ahead
                 output.relativeBehind = relative_behind
                 output.standings = standings_index_list
                 output.classes = class_pos_list
-                output.drawOrder = draw_order_list
+                output.drawOrder = create_draw_order(
+                    vehicles, veh_total, plr_index, vehicle_order.leader_index)
+                output.version += 1
 
             else:
                 if reset:
@@ -133,113 +131,149 @@ class Realtime(DataModule):
                     create_reference_place.cache_clear()
 
 
-def get_vehicles_info(
-    veh_total: int, plr_index: int, show_in_garage: bool, update_relative_delta: bool,
-    relative_delta_ahead: tuple, relative_delta_behind: tuple,
+class VehicleOrder:
+    """Vehicle order
+
+    Keep vehicle index lists sorted by class name & place, and by overall place.
+    Sorting is only repaired while any vehicle place or class changed,
+    starting from last sorted order, which is nearly sorted in most cases.
+
+    Attributes:
+        places: last vehicle place column.
+        classes: last vehicle class name column.
+        by_class: vehicle index list sorted by class name, then overall place.
+        by_place: vehicle index list sorted by overall place.
+        class_ranges: list of class name, start & end range in by_class list.
+    """
+
+    __slots__ = (
+        "places",
+        "classes",
+        "by_class",
+        "by_place",
+        "class_ranges",
+    )
+
+    def __init__(self):
+        self.places = array("i")
+        self.classes: list[str] = []
+        self.by_class: list[int] = []
+        self.by_place: list[int] = []
+        self.class_ranges: list[tuple[str, int, int]] = []
+
+    def update(self, vehicles: VehicleSnapshot, veh_total: int) -> None:
+        """Update vehicle order"""
+        places = vehicles.place[:veh_total]
+        classes = vehicles.class_name[:veh_total]
+        if places == self.places and classes == self.classes:
+            return
+        if len(self.by_class) != veh_total:  # vehicle joined or left, rebuild order
+            self.by_class = list(range(veh_total))
+        sort_keys = list(zip(classes, places, range(veh_total)))
+        self.by_class.sort(key=sort_keys.__getitem__)
+        self.by_place = sorted(self.by_class, key=places.__getitem__)
+        self.class_ranges = list(split_class_range(self.by_class, classes))
+        self.places = places
+        self.classes = classes
+
+    @property
+    def is_multi_class(self) -> bool:
+        """Is multi classes"""
+        return len(self.class_ranges) > 1
+
+    @property
+    def leader_index(self) -> int:
+        """Overall leader index, fallback to first vehicle if no leader found"""
+        leader_index = self.by_place[0] if self.by_place else 0
+        if self.places and self.places[leader_index] == 1:
+            return leader_index
+        return 0
+
+
+def split_class_range(by_class: list[int], classes: list[str]):
+    """Split class sorted index list into class name, start & end range"""
+    veh_total = len(by_class)
+    index_start = 0
+    for index_end in range(1, veh_total):
+        if classes[by_class[index_end]] != classes[by_class[index_start]]:
+            yield classes[by_class[index_start]], index_start, index_end
+            index_start = index_end
+    # Final split
+    if veh_total:
+        yield classes[by_class[index_start]], index_start, veh_total
+
+
+def calc_relative_gap(
+    vehicles: VehicleSnapshot, veh_total: int, plr_index: int, show_in_garage: bool,
+    update_relative_delta: bool, relative_delta_ahead: tuple, relative_delta_behind: tuple,
 ):
-    """Get vehicles info: relative time gap, classes, places, laptime"""
+    """Calculate relative time gap list ahead & behind (sorted by reversed time gap)"""
     laptime_est = api.read.timing.estimated_laptime()
+    if not laptime_est:
+        return [], []
     plr_time = api.read.timing.estimated_time_into()
-    last_class_name = None
-    classes_count = 0
-    recorded_index = 0
-    leader_index = 0
-    pitter_index = 0
-    draw_order = TEMP_DRAW_ORDER[:veh_total]
+    veh_in_garage = vehicles.in_garage
+    veh_time_into = vehicles.estimated_time_into
+
+    # Relative time gap ahead in range 0 to laptime
+    relative_ahead = [
+        ((veh_time_into[index] - plr_time) % laptime_est, index)
+        for index in range(veh_total)
+        if index != plr_index and (show_in_garage or not veh_in_garage[index])
+    ]
+    relative_ahead.sort(reverse=True)
+    # Relative time gap behind in range -laptime to 0
+    relative_behind = [
+        (diff_time - laptime_est if diff_time > 0 else diff_time, index)
+        for diff_time, index in relative_ahead
+    ]
+
+    if update_relative_delta:  # update at 1 sec interval
+        for (diff_time_ahead, index), (diff_time_behind, _) in zip(relative_ahead, relative_behind):
+            relative_delta_ahead[index].update(diff_time_ahead)
+            relative_delta_behind[index].update(-diff_time_behind)
+
+    # Only zero gap items are out of order, merge sort in linear time
+    relative_behind.sort(reverse=True)
+    return relative_ahead, relative_behind
+
+
+def create_draw_order(
+    vehicles: VehicleSnapshot, veh_total: int, plr_index: int, leader_index: int
+) -> list[int]:
+    """Create draw order list
 
+    Draw opponents in pit or garage first, then opponents on track,
+    then local player (if not leader), and leader at last.
+    """
+    veh_in_pits = vehicles.in_pits
+    veh_in_garage = vehicles.in_garage
+    draw_order = []
+    on_track = []
     for index in range(veh_total):
-        in_garage = api.read.vehicle.in_garage(index)
-        in_pitlane = api.read.vehicle.in_pits(index) or in_garage
-
-        # Update relative time gap list
-        if index != plr_index and laptime_est and (show_in_garage or not in_garage):
-            opt_time = api.read.timing.estimated_time_into(index)
-            diff_time = opt_time - plr_time
-            diff_time_ahead = diff_time_behind = diff_time - diff_time // laptime_est * laptime_est
-            if diff_time_ahead < 0:
-                diff_time_ahead += laptime_est
-            if diff_time_behind > 0:
-                diff_time_behind -= laptime_est
-
-            TEMP_RELATIVE_AHEAD[recorded_index] = (
-                diff_time_ahead,  # 0 relative time gap
-                index,  # 1 player index
-            )
-            TEMP_RELATIVE_BEHIND[recorded_index] = (
-                diff_time_behind,  # 0 relative time gap
-                index,  # 1 player index
-            )
-            recorded_index += 1
-
-            if update_relative_delta:  # update at 1 sec interval
-                relative_delta_ahead[index].update(diff_time_ahead)
-                relative_delta_behind[index].update(-diff_time_behind)
-
-        # Update classes list
-        class_name = api.read.vehicle.class_name(index)
-        place_overall = api.read.vehicle.place(index)
-        laptime_best = api.read.timing.best_laptime(index)
-        laptime_last = api.read.timing.last_laptime(index)
-
-        if laptime_last > 0 and not in_pitlane:
-            laptime_personal_last = laptime_last
-        else:
-            laptime_personal_last = MAX_SECONDS
-
-        if laptime_best > 0:
-            laptime_personal_best = laptime_best
+        if index == leader_index or index == plr_index:
+            continue
+        if veh_in_pits[index] or veh_in_garage[index]:
+            draw_order.append(index)
         else:
-            laptime_personal_best = MAX_SECONDS
-
-        TEMP_CLASSES[index] = (
-            class_name,  # 0 vehicle class name
-            place_overall,  # 1 overall position/place
-            index,  # 2 player index
-            laptime_personal_best,  # 3 best lap time
-            laptime_personal_last,  # 4 last lap time (for fastest last lap check)
-        )
-
-        # Update draw order list
-        if place_overall == 1:  # save leader index
-            leader_index = index
-        elif in_pitlane:  # swap opponent in pit/garage to start
-            draw_order[index], draw_order[pitter_index] = draw_order[pitter_index], draw_order[index]
-            pitter_index += 1
-
-        # Check is multi classes
-        if classes_count < 2 and last_class_name != class_name:
-            last_class_name = class_name
-            classes_count += 1
-
-    # Finalize draw order list
-    if 0 <= leader_index < veh_total and leader_index != draw_order[-1]:  # move leader to end
-        leader_pos = draw_order.index(leader_index)
-        draw_order[leader_pos], draw_order[-1] = draw_order[-1], draw_order[leader_pos]
-    if 0 <= plr_index < veh_total and plr_index != leader_index:   # move player to 2nd end if not leader
-        player_pos = draw_order.index(plr_index)
-        draw_order[player_pos], draw_order[-2] = draw_order[-2], draw_order[player_pos]
-
-    # Sort output in-place
-    relative_ahead = TEMP_RELATIVE_AHEAD[:recorded_index]
-    relative_ahead.sort(reverse=True)  # by reversed time gap
-
-    relative_behind = TEMP_RELATIVE_BEHIND[:recorded_index]
-    relative_behind.sort(reverse=True)  # by reversed time gap
-
-    new_classes = TEMP_CLASSES[:veh_total]
-    new_classes.sort()  # by vehicle class
-
-    return (
-        relative_ahead,
-        relative_behind,
-        new_classes,  # classes_list
-        draw_order,
-        classes_count > 1,  # is_multi_class
-    )
+            on_track.append(index)
+    draw_order += on_track
+    if 0 <= plr_index < veh_total and plr_index != leader_index:
+        draw_order.append(plr_index)
+    if 0 <= leader_index < veh_total:
+        draw_order.append(leader_index)
+    return draw_order
 
 
-def create_position_in_class(sorted_veh_class: list, plr_index: int):
-    """Create vehicle position in class list"""
+def create_position_in_class(
+    vehicles: VehicleSnapshot, sorted_veh_class: list[int], veh_total: int, plr_index: int
+):
+    """Create vehicle position in class list (ordered by player index)"""
+    veh_class_name = vehicles.class_name
+    veh_in_pits = vehicles.in_pits
+    veh_in_garage = vehicles.in_garage
+    veh_best_laptime = vehicles.best_laptime
+    veh_last_laptime = vehicles.last_laptime
     last_class_name = None
     place_in_class = 0
     opt_index_ahead = -1
@@ -247,15 +281,22 @@ def create_position_in_class(sorted_veh_class: list, plr_index: int):
     laptime_class_best = MAX_SECONDS
     last_fastest_laptime = MAX_SECONDS
     last_fastest_index = -1
-    veh_total = len(sorted_veh_class)
     plr_class_name = ""
     plr_class_place = 0
-    slot_index = 0
 
-    for class_name, _, opt_index, laptime_best, laptime_last in sorted_veh_class:
+    for opt_index in sorted_veh_class:
+        class_name = veh_class_name[opt_index]
+        laptime_best = veh_best_laptime[opt_index]
+        laptime_last = veh_last_laptime[opt_index]
+
+        if laptime_best <= 0:
+            laptime_best = MAX_SECONDS
+        if laptime_last <= 0 or veh_in_pits[opt_index] or veh_in_garage[opt_index]:
+            laptime_last = MAX_SECONDS
+
         if last_class_name == class_name:
             place_in_class += 1
-            TEMP_CLASSES_POS[slot_index - 1][5] = opt_index  # set opponent index behind
+            TEMP_CLASSES_POS[opt_index_ahead][5] = opt_index  # set opponent index behind
         else:
             last_class_name = class_name  # reset class name
             place_in_class = 1  # reset position counter
@@ -273,12 +314,12 @@ def create_position_in_class(sorted_veh_class: list, plr_index: int):
 
         if last_fastest_laptime > laptime_last:
             last_fastest_laptime = laptime_last
-            last_fastest_index = slot_index
+            last_fastest_index = opt_index
 
-        TEMP_CLASSES_POS[slot_index][:] = (
-            opt_index,  # 0 - 2 player index
+        TEMP_CLASSES_POS[opt_index][:] = (
+            opt_index,  # 0 - player index
             place_in_class,  # 1 - position in class
-            class_name,  # 2 - 0 class name
+            class_name,  # 2 - class name
             laptime_class_best,  # 3 classes best
             opt_index_ahead,  # 4 opponent index ahead
             -1,  # 5 opponent index behind
@@ -286,7 +327,6 @@ def create_position_in_class(sorted_veh_class: list, plr_index: int):
             False,  # 7 is class fastest last laptime
         )
         opt_index_ahead = opt_index  # store opponent index for next
-        slot_index += 1
 
     if last_fastest_index != -1:  # mark for last class
         TEMP_CLASSES_POS[last_fastest_index][7] = True
@@ -295,38 +335,47 @@ def create_position_in_class(sorted_veh_class: list, plr_index: int):
 
 
 def standings_index_from_all_classes(
-    min_top_veh: int, class_pos_list: list, plr_class_name: str, plr_class_place: int,
+    min_top_veh: int, vehicle_order: VehicleOrder, plr_class_name: str, plr_class_place: int,
     veh_limit_other: int, veh_limit_player: int):
     """Generate class standings index list from all classes"""
-    class_collection = sorted(split_class_list(class_pos_list), key=sort_class_collection)
-    for class_list in class_collection:
-        if plr_class_name == class_list[0][2]:  # match class name
+    by_class = vehicle_order.by_class
+    # Sort class collection by class best laptime
+    class_collection = sorted(
+        vehicle_order.class_ranges,
+        key=lambda class_range: TEMP_CLASSES_POS[by_class[class_range[1]]][3],
+    )
+    for class_name, index_start, index_end in class_collection:
+        if plr_class_name == class_name:
             veh_limit = veh_limit_player
             plr_place = plr_class_place  # 1 position in class
         else:
             veh_limit = veh_limit_other
             plr_place = 0
-        yield calc_standings_index(min_top_veh, veh_limit, plr_place, class_list, 0)
+        yield calc_standings_index(
+            min_top_veh, veh_limit, plr_place, by_class[index_start:index_end])
 
 
 def standings_index_from_same_class(
-    min_top_veh: int, class_pos_list: list, plr_class_name: str, plr_class_place: int, veh_limit_player: int
+    min_top_veh: int, vehicle_order: VehicleOrder, plr_class_name: str, plr_class_place: int,
+    veh_limit_player: int
 ) -> list[int]:
     """Generate class standings index list from same class only"""
-    class_list = list(class_data for class_data in class_pos_list if plr_class_name == class_data[2])
-    if not class_list:
-        return [-1]
-    return calc_standings_index(min_top_veh, veh_limit_player, plr_class_place, class_list, 0)
+    for class_name, index_start, index_end in vehicle_order.class_ranges:
+        if plr_class_name == class_name:
+            return calc_standings_index(
+                min_top_veh, veh_limit_player, plr_class_place,
+                vehicle_order.by_class[index_start:index_end])
+    return [-1]
 
 
 def calc_standings_index(
-    min_top_veh: int, veh_limit: int, plr_place: int, class_index_list: list, column: int
+    min_top_veh: int, veh_limit: int, plr_place: int, sorted_index_list: list[int]
 ) -> list[int]:
     """Calculate vehicle standings index list"""
-    veh_total = len(class_index_list)
+    veh_total = len(sorted_index_list)
     ref_place_list = create_reference_place(min_top_veh, veh_total, plr_place, veh_limit)
     # Create final standing index list
-    return list(standings_index_from_place_reference(ref_place_list, class_index_list, veh_total, column))
+    return list(standings_index_from_place_reference(ref_place_list, sorted_index_list, veh_total))
 
 
 @lru_cache(maxsize=20)
@@ -356,33 +405,16 @@ def create_reference_place(
 
 
 def standings_index_from_place_reference(
-    ref_place_list: tuple, class_index_list: list, veh_total: int, column: int):
+    ref_place_list: tuple, sorted_index_list: list, veh_total: int):
     """Match place from reference list to generate standings player index list"""
     for ref_index in ref_place_list:
         if 0 < ref_index <= veh_total:  # prevent out of range
-            yield class_index_list[ref_index - 1][column]  # column - player index
+            yield sorted_index_list[ref_index - 1]  # player index
         else:
             break
     yield -1  # append an empty index as gap between classes
 
 
-def split_class_list(class_list: list):
-    """Split class list into class collection"""
-    class_name = class_list[0][2]
-    index_start = 0
-    index_end = 0
-    for vehicle in class_list:
-        if vehicle[2] == class_name:
-            index_end +=1
-        elif vehicle[2] != class_name:
-            class_name = vehicle[2]
-            yield class_list[index_start:index_end]
-            index_start = index_end
-            index_end +=1
-    # Final split
-    yield class_list[index_start:index_end]
-
-
 def min_top_vehicles_in_class(min_top_veh: int) -> int:
     """Minimum number of top vehicles in class list
 
@@ -400,7 +432,3 @@ def max_vehicles_in_class(max_cls_veh: int, min_top_veh: int, min_add_veh: int =
     """
     return max(int(max_cls_veh), min_top_veh + min_add_veh)
 
-
-def sort_class_collection(collection: list) -> float:
-    """Sort class collection by class best laptime"""
-    return collection[0][3]  # 3 class best laptime
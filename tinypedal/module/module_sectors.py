@@ -41,7 +41,7 @@ class Realtime(DataModule):
 
     def update_data(self):
         """Update module data"""
-        _event_wait = self._event.wait
+        _event_wait = self.wait_frame
         reset = False
         update_interval = self.idle_interval
 
@@ -71,6 +71,7 @@ class Realtime(DataModule):
                 sector_idx = api.read.lap.sector_index()
                 gen_calc_sectors_session.send(sector_idx)
                 gen_calc_sectors_alltime.send(sector_idx)
+                minfo.sectors.version += 1
 
             else:
                 if reset:
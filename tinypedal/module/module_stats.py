@@ -51,7 +51,7 @@ class Realtime(DataModule):
 
     def update_data(self):
         """Update module data"""
-        _event_wait = self._event.wait
+        _event_wait = self.wait_frame
         reset = False
         update_interval = self.idle_interval
 
@@ -180,6 +180,7 @@ class Realtime(DataModule):
 
                 # Output stats data
                 output.metersDriven = driver_stats.meters + loaded_stats.meters
+                output.version += 1
 
             else:
                 if reset:
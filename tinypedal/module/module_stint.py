@@ -48,7 +48,7 @@ class Realtime(DataModule):
 
     def update_data(self):
         """Update module data"""
-        _event_wait = self._event.wait
+        _event_wait = self.wait_frame
         reset = False
         update_interval = self.idle_interval
 
@@ -80,6 +80,7 @@ class Realtime(DataModule):
 
                 # Update stint history
                 next(gen_stint_history)
+                minfo.history.version += 1
 
             else:
                 if reset:
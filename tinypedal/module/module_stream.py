@@ -0,0 +1,356 @@
+#  TinyPedal is an open-source overlay application for racing simulation.
+#  Copyright (C) 2022-2026 TinyPedal developers, see contributors.md file
+#
+#  This file is part of TinyPedal.
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Stream module
+
+Stream selected module info data to local clients, such as remote dashboard
+or browser source, via WebSocket or HTTP newline-delimited JSON (NDJSON).
+
+Request (HTTP GET, query is optional):
+    /?sections=delta,fuel&interval=200
+
+    sections: comma separated STREAM_FIELDS section names, default all sections.
+    interval: client update interval (milliseconds), not lower than server limit.
+
+Request with "Upgrade: websocket" header is served as WebSocket (text message),
+otherwise served as NDJSON (one message per line) until connection closed.
+
+Message:
+    {"frame": frame version, "data": {"section.name": value, ...}}
+
+First message contains all selected fields, following messages contain
+only fields that changed since last message sent to same client.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+from base64 import b64encode
+from hashlib import sha1
+from operator import attrgetter
+from time import monotonic
+from urllib.parse import parse_qs, urlsplit
+
+from .. import realtime_state
+from ..adapter.frame_bus import frame_bus
+from ..async_request import close_connection
+from ..module_info import minfo
+from ._base import DataModule
+
+STREAM_FIELDS = (
+    # Module info path
+    "relative.relativeAhead",
+    "relative.relativeBehind",
+    "relative.standings",
+    "relative.classes",
+    "delta.deltaBest",
+    "delta.deltaLast",
+    "delta.deltaSession",
+    "delta.deltaStint",
+    "delta.isValidLap",
+    "delta.lapTimeCurrent",
+    "delta.lapTimeLast",
+    "delta.lapTimeBest",
+    "delta.lapTimeEstimated",
+    "delta.lapTimePace",
+    "fuel.capacity",
+    "fuel.amountCurrent",
+    "fuel.amountEndStint",
+    "fuel.neededRelative",
+    "fuel.estimatedConsumption",
+    "fuel.estimatedLaps",
+    "fuel.estimatedMinutes",
+    "fuel.estimatedNumPitStopsEnd",
+    "fuel.deltaConsumption",
+    "fuel.oneLessPitConsumption",
+    "wheels.currentTreadDepth",
+    "wheels.estimatedTreadWear",
+    "wheels.currentBrakeThickness",
+    "wheels.estimatedBrakeWear",
+    "vehicles.playerIndex",
+    "vehicles.leaderIndex",
+    "vehicles.totalVehicles",
+)
+STREAM_SECTIONS = frozenset(path.split(".", 1)[0] for path in STREAM_FIELDS)
+WEBSOCKET_GUID = "258EAFA5-E914-47DA-95CA-C5AB0DC85B11"
+MAX_WRITE_BUFFER = 1 << 18  # skip sending to slow client while buffer above limit
+MAX_READ_PAYLOAD = 1 << 16  # disconnect client if incoming WebSocket payload above limit
+
+logger = logging.getLogger(__name__)
+
+
+class Realtime(DataModule):
+    """Stream data"""
+
+    __slots__ = (
+        "_clients",
+    )
+
+    def __init__(self, config, module_name):
+        super().__init__(config, module_name)
+        self._clients: set[StreamClient] = set()
+
+    def update_data(self):
+        """Update module data"""
+        asyncio.run(self.__serve())
+
+    async def __serve(self):
+        """Serve clients until stopped"""
+        host = self.mcfg["url_host"]
+        port = self.mcfg["url_port"]
+        try:
+            server = await asyncio.start_server(self.__accept, host, port)
+        except (OSError, ValueError):
+            logger.error("STREAM: failed starting server: %s:%s", host, port)
+            return
+        logger.info("STREAM: serving at %s:%s", host, port)
+        async with server:
+            await self.__broadcast()
+            # Stop accepting, then close active clients before waiting server closed,
+            # since server waits for all active connections closed (python 3.12.1+)
+            server.close()
+            for client in tuple(self._clients):
+                await close_connection(client.writer)
+            self._clients.clear()
+
+    async def __broadcast(self):
+        """Broadcast changed data to clients"""
+        loop = asyncio.get_running_loop()
+        _event_wait = self.wait_frame
+        getters = tuple((path, attrgetter(path)) for path in STREAM_FIELDS)
+        min_interval = max(self.mcfg["minimum_client_update_interval"], 10) / 1000
+        reset = False
+        update_interval = self.idle_interval
+
+        while not await loop.run_in_executor(None, _event_wait, update_interval):
+            if realtime_state.active:
+
+                if not reset:
+                    reset = True
+                    update_interval = self.active_interval
+
+            else:
+                if reset:
+                    reset = False
+                    update_interval = self.idle_interval
+
+            clients = self._clients
+            if not clients:
+                continue
+
+            # Encode each field once per update, and compare encoded value per client
+            snapshot = {"active": json.dumps(reset)}
+            for path, getter in getters:
+                snapshot[path] = json.dumps(getter(minfo))
+            frame_version = frame_bus.version
+
+            now = monotonic()
+            for client in tuple(clients):
+                if client.writer.is_closing():
+                    clients.discard(client)
+                    continue
+                if now < client.next_time:
+                    continue
+                if client.writer.transport.get_write_buffer_size() > MAX_WRITE_BUFFER:
+                    continue
+                client.next_time = now + max(client.interval, min_interval)
+                client.send(snapshot, frame_version)
+
+    async def __accept(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        """Accept new client"""
+        try:
+            header_bytes = await asyncio.wait_for(reader.readuntil(b"\r\n\r\n"), 5)
+            client = StreamClient.from_request(header_bytes, writer)
+        except (asyncio.TimeoutError, asyncio.IncompleteReadError,
+                asyncio.LimitOverrunError, ConnectionError, ValueError):
+            await close_connection(writer)
+            return
+
+        max_clients = max(self.mcfg["maximum_number_of_clients"], 1)
+        if len(self._clients) >= max_clients:
+            writer.write(b"HTTP/1.1 503 Service Unavailable\r\nConnection: close\r\n\r\n")
+            await close_connection(writer)
+            return
+
+        writer.write(client.handshake)
+        self._clients.add(client)
+        logger.info("STREAM: client connected (%s)", len(self._clients))
+        try:
+            await client.read_until_closed(reader)
+        except (asyncio.IncompleteReadError, ConnectionError, ValueError):
+            pass
+        finally:
+            self._clients.discard(client)
+            await close_connection(writer)
+            logger.info("STREAM: client disconnected (%s)", len(self._clients))
+
+
+class StreamClient:
+    """Stream client state
+
+    Args:
+        writer: client stream writer.
+        websocket: whether to send WebSocket frame, or NDJSON line.
+        handshake: response header bytes.
+        sections: selected STREAM_FIELDS sections.
+        interval: client update interval (seconds).
+    """
+
+    __slots__ = (
+        "writer",
+        "websocket",
+        "handshake",
+        "paths",
+        "interval",
+        "next_time",
+        "_last",
+    )
+
+    def __init__(
+        self, writer: asyncio.StreamWriter, websocket: bool, handshake: bytes,
+        sections: frozenset[str], interval: float):
+        self.writer = writer
+        self.websocket = websocket
+        self.handshake = handshake
+        self.paths = ("active",) + tuple(
+            path for path in STREAM_FIELDS if path.split(".", 1)[0] in sections)
+        self.interval = interval
+        self.next_time = 0.0
+        self._last: dict[str, str] = {}
+
+    @classmethod
+    def from_request(cls, header_bytes: bytes, writer: asyncio.StreamWriter) -> StreamClient:
+        """Create client from HTTP GET request header"""
+        lines = header_bytes.decode("latin-1").split("\r\n")
+        method, target, _ = lines[0].split(" ", 2)
+        if method != "GET":
+            raise ValueError("invalid request method")
+        headers = {}
+        for line in lines[1:]:
+            name, sep, value = line.partition(":")
+            if sep:
+                headers[name.strip().lower()] = value.strip()
+
+        query = parse_qs(urlsplit(target).query)
+        sections = frozenset(
+            name for value in query.get("sections", ())
+            for name in value.split(",") if name in STREAM_SECTIONS
+        ) or STREAM_SECTIONS
+        try:
+            interval = max(float(query.get("interval", ("0",))[0]), 0) / 1000
+        except ValueError:
+            interval = 0.0
+
+        if headers.get("upgrade", "").lower() == "websocket":
+            key = headers.get("sec-websocket-key", "")
+            if not key:
+                raise ValueError("missing websocket key")
+            return cls(writer, True, websocket_handshake(key), sections, interval)
+        return cls(writer, False, NDJSON_HEADER, sections, interval)
+
+    def send(self, snapshot: dict[str, str], frame_version: int):
+        """Send fields that changed since last sent"""
+        last = self._last
+        changed = []
+        for path in self.paths:
+            value = snapshot[path]
+            if last.get(path) != value:
+                last[path] = value
+                changed.append(f'"{path}":{value}')
+        if not changed:
+            return
+        message = f'{{"frame":{frame_version},"data":{{{",".join(changed)}}}}}'.encode()
+        if self.websocket:
+            self.writer.write(websocket_frame(message))
+        else:
+            self.writer.write(message + b"\n")
+
+    async def read_until_closed(self, reader: asyncio.StreamReader):
+        """Read incoming data until closed, reply WebSocket ping & close"""
+        if not self.websocket:
+            while await reader.read(1024):
+                pass
+            return
+        while True:
+            opcode, payload = await read_websocket_frame(reader)
+            if opcode == 0x8:  # close
+                self.writer.write(websocket_frame(payload[:2], 0x8))
+                return
+            if opcode == 0x9:  # ping
+                self.writer.write(websocket_frame(payload, 0xA))
+
+
+NDJSON_HEADER = (
+    b"HTTP/1.1 200 OK\r\n"
+    b"Content-Type: application/x-ndjson\r\n"
+    b"Cache-Control: no-cache\r\n"
+    b"Access-Control-Allow-Origin: *\r\n"
+    b"Connection: close\r\n\r\n"
+)
+
+
+def websocket_handshake(key: str) -> bytes:
+    """Set WebSocket handshake response header"""
+    accept = b64encode(sha1((key + WEBSOCKET_GUID).encode()).digest()).decode()
+    return (
+        "HTTP/1.1 101 Switching Protocols\r\n"
+        "Upgrade: websocket\r\n"
+        "Connection: Upgrade\r\n"
+        f"Sec-WebSocket-Accept: {accept}\r\n\r\n"
+    ).encode()
+
+
+def websocket_frame(payload: bytes, opcode: int = 0x1) -> bytes:
+    """Set unmasked (server) WebSocket frame"""
+    length = len(payload)
+    if length < 126:
+        header = bytes((0x80 | opcode, length))
+    elif length < 65536:
+        header = bytes((0x80 | opcode, 126)) + length.to_bytes(2, "big")
+    else:
+        header = bytes((0x80 | opcode, 127)) + length.to_bytes(8, "big")
+    return header + payload
+
+
+async def read_websocket_frame(reader: asyncio.StreamReader) -> tuple[int, bytes]:
+    """Read (client) WebSocket frame, returns opcode & unmasked payload
+
+    Raises:
+        ValueError: if payload length above MAX_READ_PAYLOAD.
+    """
+    head = await reader.readexactly(2)
+    opcode = head[0] & 0x0F
+    length = head[1] & 0x7F
+    if length == 126:
+        length = int.from_bytes(await reader.readexactly(2), "big")
+    elif length == 127:
+        length = int.from_bytes(await reader.readexactly(8), "big")
+    if length > MAX_READ_PAYLOAD:
+        raise ValueError("websocket payload too large")
+    if head[1] & 0x80:
+        mask = await reader.readexactly(4)
+        payload = bytes(
+            byte ^ mask[index & 3]
+            for index, byte in enumerate(await reader.readexactly(length))
+        )
+    else:
+        payload = await reader.readexactly(length)
+    return opcode, payload
@@ -24,6 +24,7 @@ from __future__ import annotations
 
 from .. import calculation as calc
 from .. import realtime_state
+from ..adapter.snapshot import VehicleSnapshot
 from ..api_control import api
 from ..const_common import MAX_METERS, MAX_SECONDS
 from ..module_info import VehicleDataSet, VehiclesInfo, minfo
@@ -42,7 +43,7 @@ class Realtime(DataModule):
 
     def update_data(self):
         """Update module data"""
-        _event_wait = self._event.wait
+        _event_wait = self.wait_frame
         reset = False
         update_interval = self.idle_interval
 
@@ -62,12 +63,14 @@ class Realtime(DataModule):
                     output.dataSetVersion = -1
                     last_veh_total = 0
 
-                veh_total = output.totalVehicles = api.read.vehicle.total_vehicles()
+                vehicles = api.read.vehicle.snapshot()
+                veh_total = output.totalVehicles = vehicles.total
                 if veh_total > 0:
                     update_low_priority = next(gen_low_priority_timer)
 
                     update_vehicle_data(
                         output,
+                        vehicles,
                         max_lap_diff_ahead,
                         max_lap_diff_behind,
                         update_low_priority,
@@ -80,6 +83,8 @@ class Realtime(DataModule):
 
                         update_finish_time(output, max_finish_time_diff)
 
+                output.version += 1
+
             else:
                 if reset:
                     reset = False
@@ -88,10 +93,12 @@ class Realtime(DataModule):
         # Must reset on close
         output.finishTimeOffset = 0.0
         output.finishAsLap = True
+        output.version += 1
 
 
 def update_vehicle_data(
     output: VehiclesInfo,
+    vehicles: VehicleSnapshot,
     max_lap_diff_ahead: float,
     max_lap_diff_behind: float,
     update_low_priority: bool,
@@ -125,21 +132,22 @@ def update_vehicle_data(
     plr_pos_x = api.read.vehicle.position_longitudinal()
     plr_pos_y = api.read.vehicle.position_lateral()
     plr_ori_yaw = api.read.vehicle.orientation_yaw_radians()
+    plr_index = api.read.vehicle.player_index()
 
     # Update dataset from all vehicles in current session
     for index, data, class_pos in zip(range(output.totalVehicles), output.dataSet, minfo.relative.classes):
         # Temp var only
-        laps_completed = api.read.lap.completed_laps(index)
-        lap_distance = api.read.lap.distance(index)
-        speed = api.read.vehicle.speed(index)
+        laps_completed = vehicles.completed_laps[index]
+        lap_distance = vehicles.distance[index]
+        speed = vehicles.speed[index]
 
         # Update high priority info
-        data.isPlayer = api.read.vehicle.is_player(index)
+        data.isPlayer = index == plr_index
         data.currentLapProgress = calc.lap_progress_distance(lap_distance, track_length)
         data.totalLapProgress = laps_completed + data.currentLapProgress
         data.isYellow = speed < 8
-        data.inPit = api.read.vehicle.in_paddock(index)
-        data.pitTimer.update(api.read.vehicle.slot_id(index), data.inPit, elapsed_time, laps_completed, speed)
+        data.inPit = vehicles.in_paddock(index)
+        data.pitTimer.update(vehicles.slot_id[index], data.inPit, elapsed_time, laps_completed, speed)
 
         if not data.inPit:
             data.speedTrap.update(speed, lap_distance, speedtrap_distance, track_length)
@@ -154,11 +162,11 @@ def update_vehicle_data(
                 nearest_yellow_behind = 0.0
         else:
             # Relative position & orientation
-            opt_etime = api.read.timing.elapsed(index)
+            opt_etime = vehicles.elapsed[index]
             if data.elapsedTime != opt_etime:
-                opt_pos_x = api.read.vehicle.position_longitudinal(index)
-                opt_pos_y = api.read.vehicle.position_lateral(index)
-                opt_ori_yaw = api.read.vehicle.orientation_yaw_radians(index)
+                opt_pos_x = vehicles.position_longitudinal[index]
+                opt_pos_y = vehicles.position_lateral[index]
+                opt_ori_yaw = vehicles.orientation_yaw_radians[index]
                 # Player data update rate may be (twice) higher than opponents
                 # Interpolate coordinates to avoid desync
                 est_pos_x, est_pos_y = calc.time_interp_coordinate(
@@ -199,7 +207,7 @@ def update_vehicle_data(
                 opt_time_behind = calc.circular_position_relative(
                     plr_laptime_est,
                     plr_timeinto_est,
-                    api.read.timing.estimated_time_into(index),
+                    vehicles.estimated_time_into[index],
                 )
                 if 0 > opt_time_behind > nearest_time_behind:
                     nearest_time_behind = opt_time_behind
@@ -222,14 +230,14 @@ def update_vehicle_data(
             data.classBestLapTime = class_pos[3]
             data.isClassFastestLastLap = class_pos[7]
 
-            data.positionOverall = api.read.vehicle.place(index)
-            data.bestLapTime = api.read.timing.best_laptime(index)
+            data.positionOverall = vehicles.place[index]
+            data.bestLapTime = vehicles.best_laptime[index]
             data.numPitStops = api.read.vehicle.number_pitstops(index, api.read.vehicle.number_penalties(index))
             data.pitRequested = api.read.vehicle.pit_request(index)
             data.driverName = api.read.vehicle.driver_name(index)
             data.vehicleName = api.read.vehicle.vehicle_name(index)
             data.vehicleBrand = select_brand_name(index, data.vehicleName)
-            data.vehicleClass = api.read.vehicle.class_name(index)
+            data.vehicleClass = vehicles.class_name[index]
             data.vehicleIntegrity = api.read.vehicle.integrity(index)
             data.tireCompoundName = api.read.tyre.compound_class(index)
             data.isFinished = api.read.vehicle.finish_state(index) == 1
@@ -242,7 +250,7 @@ def update_vehicle_data(
                 opt_index_leader, index, output.dataSet[opt_index_leader].totalLapProgress - data.totalLapProgress)
 
             lap_start_time = api.read.timing.start(index)
-            last_laptime = api.read.timing.last_laptime(index)
+            last_laptime = vehicles.last_laptime[index]
             fuel_remaining = api.read.vehicle.fuel_fraction(index)
 
             data.lapTimeHistory.update(lap_start_time, elapsed_time, data.bestLapTime)
@@ -290,6 +298,7 @@ def update_finish_time(output: VehiclesInfo, max_finish_time_diff: float) -> Non
     if finish_type == 0:
         output.finishTimeOffset = 0.0
         output.finishAsLap = True
+        output.version += 1
         return
 
     remaining_time = api.read.session.remaining()
@@ -36,6 +36,8 @@ from ..userfile.heatmap import (
 from ..validator import generator_init
 from ._base import DataModule
 
+WHEELS_DELTA_COLUMNS = len(WHEELS_DELTA_DEFAULT)  # distance, wear diff set
+
 logger = logging.getLogger(__name__)
 
 
@@ -49,7 +51,7 @@ class Realtime(DataModule):
 
     def update_data(self):
         """Update module data"""
-        _event_wait = self._event.wait
+        _event_wait = self.wait_frame
         reset = False
         update_interval = self.idle_interval
 
@@ -102,6 +104,7 @@ class Realtime(DataModule):
                 gen_brake_wear.send(in_garage)
                 gen_susp_travel.send(in_pits)
                 gen_cornering_radius.send(True)
+                minfo.wheels.version += 1
 
             else:
                 if reset:
@@ -222,7 +225,8 @@ def calc_tyre_wear(output: WheelsInfo, min_delta_distance: float):
     is_pit_lap = 0  # whether pit in or pit out lap
     delta_recording = False
     delta_array_raw = [WHEELS_DELTA_DEFAULT]  # distance, wear diff
-    delta_array_last = tuple(delta_array_raw)
+    delta_array_last = WHEELS_DELTA_DEFAULT  # flat trace
+    delta_cursor = calc.TraceCursor()  # last lap delta trace cursor
     is_valid_delta = False
     pos_last = 0.0  # last checked vehicle position
 
@@ -236,7 +240,7 @@ def calc_tyre_wear(output: WheelsInfo, min_delta_distance: float):
             tread_wear_curr[:] = WHEELS_ZERO
             tread_wear_valid[:] = WHEELS_ZERO
             delta_array_raw[:] = (WHEELS_DELTA_DEFAULT,)
-            delta_array_last = (WHEELS_DELTA_DEFAULT,)
+            delta_array_last = WHEELS_DELTA_DEFAULT
             is_valid_delta = False
             last_lap_stime = 0.0
             output.lastLapTreadWear[:] = WHEELS_ZERO
@@ -253,14 +257,14 @@ def calc_tyre_wear(output: WheelsInfo, min_delta_distance: float):
             output.lastLapTreadWear[:] = tread_wear_curr
             # Update delta array for non-pit lap
             if len(delta_array_raw) > 1 and not is_pit_lap:
-                delta_array_last = tuple(delta_array_raw)
+                delta_array_last = calc.trace_array(delta_array_raw)
                 tread_wear_valid[:] = tread_wear_curr
             elif not is_valid_delta:  # save for first/out lap
                 tread_wear_valid[:] = tread_wear_curr
             tread_wear_curr[:] = WHEELS_ZERO
             delta_array_raw[:] = (WHEELS_DELTA_DEFAULT,)
             delta_recording = laptime_curr < 1
-            is_valid_delta = len(delta_array_last) > 1
+            is_valid_delta = len(delta_array_last) > WHEELS_DELTA_COLUMNS  # more than 1 row
             pos_last = pos_curr
             is_pit_lap = 0
 
@@ -277,10 +281,13 @@ def calc_tyre_wear(output: WheelsInfo, min_delta_distance: float):
 
         # Find delta data index
         if is_valid_delta and laptime_curr > 0.3:
-            index_higher = calc.binary_search_higher_column(
-                delta_array_last, pos_curr, 0, len(delta_array_last) - 1)
+            index_higher = delta_cursor.search_higher_flat(
+                delta_array_last, pos_curr, len(delta_array_last) // WHEELS_DELTA_COLUMNS - 1,
+                0, WHEELS_DELTA_COLUMNS)
         else:
             index_higher = 0
+        offset_higher = index_higher * WHEELS_DELTA_COLUMNS
+        offset_lower = offset_higher - WHEELS_DELTA_COLUMNS
 
         # Calculate wear difference & accumulated wear
         for idx, tread_curr in enumerate(tread_curr_set):
@@ -299,10 +306,10 @@ def calc_tyre_wear(output: WheelsInfo, min_delta_distance: float):
             if index_higher > 0:
                 delta_wear = tread_wear_curr[idx] - calc.linear_interp(
                     pos_curr,
-                    delta_array_last[index_higher - 1][0],
-                    delta_array_last[index_higher - 1][idx + 1],
-                    delta_array_last[index_higher][0],
-                    delta_array_last[index_higher][idx + 1],
+                    delta_array_last[offset_lower],
+                    delta_array_last[offset_lower + idx + 1],
+                    delta_array_last[offset_higher],
+                    delta_array_last[offset_higher + idx + 1],
                 )
             else:
                 delta_wear = 0.0
@@ -341,7 +348,8 @@ def calc_brake_wear(output: WheelsInfo, min_delta_distance: float):
     is_pit_lap = 0  # whether pit in or pit out lap
     delta_recording = False
     delta_array_raw = [WHEELS_DELTA_DEFAULT]  # distance, wear diff
-    delta_array_last = tuple(delta_array_raw)
+    delta_array_last = WHEELS_DELTA_DEFAULT  # flat trace
+    delta_cursor = calc.TraceCursor()  # last lap delta trace cursor
     is_valid_delta = False
     pos_last = 0.0  # last checked vehicle position
 
@@ -356,7 +364,7 @@ def calc_brake_wear(output: WheelsInfo, min_delta_distance: float):
             brake_wear_valid[:] = WHEELS_ZERO
             brake_max_thickness[:] = WHEELS_ZERO
             delta_array_raw[:] = (WHEELS_DELTA_DEFAULT,)
-            delta_array_last = (WHEELS_DELTA_DEFAULT,)
+            delta_array_last = WHEELS_DELTA_DEFAULT
             is_valid_delta = False
             last_lap_stime = 0.0
             output.lastLapBrakeWear[:] = WHEELS_ZERO
@@ -380,14 +388,14 @@ def calc_brake_wear(output: WheelsInfo, min_delta_distance: float):
             output.lastLapBrakeWear[:] = brake_wear_curr
             # Update delta array for non-pit lap
             if len(delta_array_raw) > 1 and not is_pit_lap:
-                delta_array_last = tuple(delta_array_raw)
+                delta_array_last = calc.trace_array(delta_array_raw)
                 brake_wear_valid[:] = brake_wear_curr
             elif not is_valid_delta:  # save for first/out lap
                 brake_wear_valid[:] = brake_wear_curr
             brake_wear_curr[:] = WHEELS_ZERO
             delta_array_raw[:] = (WHEELS_DELTA_DEFAULT,)
             delta_recording = laptime_curr < 1
-            is_valid_delta = len(delta_array_last) > 1
+            is_valid_delta = len(delta_array_last) > WHEELS_DELTA_COLUMNS  # more than 1 row
             pos_last = pos_curr
             is_pit_lap = 0
 
@@ -404,10 +412,13 @@ def calc_brake_wear(output: WheelsInfo, min_delta_distance: float):
 
         # Find delta data index
         if is_valid_delta and laptime_curr > 0.3:
-            index_higher = calc.binary_search_higher_column(
-                delta_array_last, pos_curr, 0, len(delta_array_last) - 1)
+            index_higher = delta_cursor.search_higher_flat(
+                delta_array_last, pos_curr, len(delta_array_last) // WHEELS_DELTA_COLUMNS - 1,
+                0, WHEELS_DELTA_COLUMNS)
         else:
             index_higher = 0
+        offset_higher = index_higher * WHEELS_DELTA_COLUMNS
+        offset_lower = offset_higher - WHEELS_DELTA_COLUMNS
 
         # Calculate wear difference & accumulated wear
         for idx, brake_curr in enumerate(brake_curr_set):
@@ -454,10 +465,10 @@ def calc_brake_wear(output: WheelsInfo, min_delta_distance: float):
             if index_higher > 0:
                 delta_wear = brake_wear_curr[idx] - calc.linear_interp(
                     pos_curr,
-                    delta_array_last[index_higher - 1][0],
-                    delta_array_last[index_higher - 1][idx + 1],
-                    delta_array_last[index_higher][0],
-                    delta_array_last[index_higher][idx + 1],
+                    delta_array_last[offset_lower],
+                    delta_array_last[offset_lower + idx + 1],
+                    delta_array_last[offset_higher],
+                    delta_array_last[offset_higher + idx + 1],
                 )
             else:
                 delta_wear = 0.0
@@ -29,6 +29,7 @@ from typing import Any, KeysView
 
 from . import module, widget
 from .const_file import ConfigType
+from .module_worker import ModuleWorker, RemoteModule, module_worker
 from .setting import cfg
 
 logger = logging.getLogger(__name__)
@@ -51,6 +52,7 @@ class ModuleControl:
 
     Args:
         target: module.
+        worker: module worker, run module in worker process while worker is running.
 
     Attributes:
         type_id: module type indentifier, either "module" or "widget".
@@ -60,13 +62,15 @@ class ModuleControl:
     __slots__ = (
         "_imported_modules",
         "_active_modules",
+        "_worker",
         "type_id",
         "active_modules",
     )
 
-    def __init__(self, target: Any, type_id: str):
+    def __init__(self, target: Any, type_id: str, worker: ModuleWorker | None = None):
         self._imported_modules = MappingProxyType(create_module_pack(target))
         self._active_modules: dict = {}
+        self._worker = worker
         self.type_id = type_id
         self.active_modules: MappingProxyType = MappingProxyType(self._active_modules)
 
@@ -124,7 +128,10 @@ class ModuleControl:
         """Start selected module"""
         if cfg.user.setting[name]["enable"] and name not in self._active_modules:
             # Create module instance and add to dict
-            self._active_modules[name] = self._imported_modules[name].Realtime(cfg, name)
+            if self._worker is not None and self._worker.running:
+                self._active_modules[name] = RemoteModule(self._worker, name)
+            else:
+                self._active_modules[name] = self._imported_modules[name].Realtime(cfg, name)
             self._active_modules[name].start()
 
     def __close_enabled(self):
@@ -158,5 +165,5 @@ class ModuleControl:
         return self._imported_modules.keys()
 
 
-mctrl = ModuleControl(target=module, type_id=ConfigType.MODULE)
+mctrl = ModuleControl(target=module, type_id=ConfigType.MODULE, worker=module_worker)
 wctrl = ModuleControl(target=widget, type_id=ConfigType.WIDGET)
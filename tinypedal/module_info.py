@@ -25,11 +25,11 @@ from __future__ import annotations
 from array import array
 from collections import deque
 from itertools import islice
-from typing import Mapping, NamedTuple
+from typing import Mapping, NamedTuple, Sequence
 
 from .calculation import circular_position_relative, linear_interp
 from .const_common import (
-    DELTA_DEFAULT,
+    DELTA_TRACE_DEFAULT,
     EMPTY_DICT,
     MAX_METERS,
     MAX_SECONDS,
@@ -455,6 +455,7 @@ class DeltaInfo:
     """Delta output data"""
 
     __slots__ = (
+        "version",
         "deltaBestData",
         "deltaBest",
         "deltaLast",
@@ -472,7 +473,8 @@ class DeltaInfo:
     )
 
     def __init__(self):
-        self.deltaBestData: tuple[tuple[float, float], ...] = DELTA_DEFAULT
+        self.version: int = 0
+        self.deltaBestData: Sequence[float] = DELTA_TRACE_DEFAULT  # flat (distance, laptime)
         self.deltaBest: float = 0.0
         self.deltaLast: float = 0.0
         self.deltaSession: float = 0.0
@@ -492,6 +494,7 @@ class ForceInfo:
     """Force output data"""
 
     __slots__ = (
+        "version",
         "lgtGForceRaw",
         "latGForceRaw",
         "maxAvgLatGForce",
@@ -507,6 +510,7 @@ class ForceInfo:
     )
 
     def __init__(self):
+        self.version: int = 0
         self.lgtGForceRaw: float = 0.0
         self.latGForceRaw: float = 0.0
         self.maxAvgLatGForce: float = 0.0
@@ -525,6 +529,7 @@ class FuelInfo:
     """Fuel output data"""
 
     __slots__ = (
+        "version",
         "available",
         "capacity",
         "amountStart",
@@ -545,6 +550,7 @@ class FuelInfo:
     )
 
     def __init__(self):
+        self.version: int = 0
         self.reset()
 
     def reset(self):
@@ -566,12 +572,14 @@ class FuelInfo:
         self.estimatedNumPitStopsEarly: float = 0.0
         self.deltaConsumption: float = 0.0
         self.oneLessPitConsumption: float = 0.0
+        self.version += 1
 
 
 class HistoryInfo:
     """History output data"""
 
     __slots__ = (
+        "version",
         "consumptionDataName",
         "consumptionDataVersion",
         "consumptionDataSet",
@@ -581,6 +589,7 @@ class HistoryInfo:
     )
 
     def __init__(self):
+        self.version: int = 0
         self.consumptionDataName: str = ""
         self.consumptionDataVersion: int = 0
         self.consumptionDataSet: deque[ConsumptionDataSet] = deque([ConsumptionDataSet()], 100)
@@ -594,6 +603,7 @@ class HistoryInfo:
         self.consumptionDataVersion = 0
         self.consumptionDataSet.clear()
         self.consumptionDataSet.appendleft(ConsumptionDataSet())
+        self.version += 1
 
     def reset_stint(self):
         """Reset stint data"""
@@ -601,12 +611,14 @@ class HistoryInfo:
         self.stintData.reset()
         self.stintDataSet.clear()
         self.stintDataSet.appendleft(StintDataSet())
+        self.version += 1
 
 
 class HybridInfo:
     """Hybrid output data"""
 
     __slots__ = (
+        "version",
         "batteryCharge",
         "batteryDrain",
         "batteryRegen",
@@ -621,6 +633,7 @@ class HybridInfo:
     )
 
     def __init__(self):
+        self.version: int = 0
         self.batteryCharge: float = 0.0
         self.batteryDrain: float = 0.0
         self.batteryRegen: float = 0.0
@@ -638,6 +651,7 @@ class MappingInfo:
     """Mapping output data"""
 
     __slots__ = (
+        "version",
         "coordinates",
         "elevations",
         "sectors",
@@ -652,6 +666,7 @@ class MappingInfo:
     )
 
     def __init__(self):
+        self.version: int = 0
         self.reset()
 
     def reset(self):
@@ -667,12 +682,14 @@ class MappingInfo:
         self.pitSpeedLimit: float = 0.0
         self.pitPassTime: float = 0.0
         self.sunlightPhases: tuple[tuple[float, int], ...] | None = None
+        self.version += 1
 
 
 class NotesInfo:
     """Notes output data"""
 
     __slots__ = (
+        "version",
         "currentIndex",
         "currentNote",
         "nextIndex",
@@ -680,6 +697,7 @@ class NotesInfo:
     )
 
     def __init__(self):
+        self.version: int = 0
         self.reset()
 
     def reset(self):
@@ -688,12 +706,14 @@ class NotesInfo:
         self.currentNote: Mapping[str, float | str] = EMPTY_DICT
         self.nextIndex: int = 0
         self.nextNote: Mapping[str, float | str] = EMPTY_DICT
+        self.version += 1
 
 
 class RelativeInfo:
     """Relative output data"""
 
     __slots__ = (
+        "version",
         "relativeAhead",
         "relativeBehind",
         "standings",
@@ -704,6 +724,7 @@ class RelativeInfo:
     )
 
     def __init__(self):
+        self.version: int = 0
         self.relativeAhead: list[tuple[float, int]] = [REL_TIME_DEFAULT]
         self.relativeBehind: list[tuple[float, int]] = [REL_TIME_DEFAULT]
         self.standings: list[int] = [-1]
@@ -745,11 +766,13 @@ class SectorsInfo:
     """Sectors output data"""
 
     __slots__ = (
+        "version",
         "allTimeBest",
         "sessionBest",
     )
 
     def __init__(self):
+        self.version: int = 0
         self.allTimeBest: SectorData = SectorData()
         self.sessionBest: SectorData = SectorData()
 
@@ -758,10 +781,12 @@ class StatsInfo:
     """Stats output data"""
 
     __slots__ = (
+        "version",
         "metersDriven",
     )
 
     def __init__(self):
+        self.version: int = 0
         self.metersDriven: float = 0.0
 
 
@@ -769,6 +794,7 @@ class VehiclesInfo:
     """Vehicles output data"""
 
     __slots__ = (
+        "version",
         "dataSet",
         "dataSetVersion",
         "leaderIndex",
@@ -790,6 +816,7 @@ class VehiclesInfo:
     )
 
     def __init__(self):
+        self.version: int = 0
         self.dataSet: tuple[VehicleDataSet, ...] = tuple(
             VehicleDataSet() for _ in range(MAX_VEHICLES)
         )
@@ -816,6 +843,7 @@ class WheelsInfo:
     """Wheels output data"""
 
     __slots__ = (
+        "version",
         "corneringRadius",
         "lockingPercentFront",
         "lockingPercentRear",
@@ -840,6 +868,7 @@ class WheelsInfo:
     )
 
     def __init__(self):
+        self.version: int = 0
         self.corneringRadius: float = 0.0
         self.lockingPercentFront: float = 0.0
         self.lockingPercentRear: float = 0.0
@@ -864,7 +893,11 @@ class WheelsInfo:
 
 
 class ModuleInfo:
-    """Modules output data"""
+    """Modules output data
+
+    Each output data has a version, which is increased by module
+    on each output update, and can be checked to skip unchanged data.
+    """
 
     __slots__ = (
         "delta",
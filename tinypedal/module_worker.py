@@ -0,0 +1,515 @@
+#  TinyPedal is an open-source overlay application for racing simulation.
+#  Copyright (C) 2022-2026 TinyPedal developers, see contributors.md file
+#
+#  This file is part of TinyPedal.
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Module worker
+
+Run data modules in a separate worker process (multi-process mode),
+so that module updates and widget paints do not compete for same GIL.
+
+Worker process runs its own API connection (without telemetry capture & Rest API)
+and data modules, and publishes module info snapshot via shared memory.
+Rest API data is only requested by GUI process, and sent to worker process on change.
+Replay & synthetic API are not supported, as each process would run its own
+player or grid on separate timeline, which falls back to single process.
+GUI process receives snapshot and updates local module info,
+widgets keep reading module info & API data as usual.
+
+Shared memory layout (little-endian):
+    header: sequence.
+    section table: version, offset, size of each MINFO_SECTIONS pickled data.
+    data: pickled data of each section.
+
+Sequence is a seqlock counter, which is odd while writing, and even after written.
+Section version is increased only if section data changed since last written,
+so that GUI process only unpickles changed section.
+"""
+
+from __future__ import annotations
+
+import copyreg
+import io
+import logging
+import mmap
+import multiprocessing
+import os
+import pickle
+import queue
+import struct
+import sys
+import threading
+from time import monotonic, sleep
+from types import MappingProxyType
+
+from . import realtime_state
+from .api_control import api
+from .const_api import API_REPLAY_NAME, API_SYNTHETIC_NAME
+from .const_app import PLATFORM
+from .const_common import EMPTY_DICT
+from .module_info import ModuleInfo, VehiclesInfo, minfo
+from .profiler import profiler
+from .setting import cfg
+
+MINFO_SECTIONS = ModuleInfo.__slots__
+SHARED_SIZE = 1 << 23  # 8 MB, pages are only committed while written
+SEQUENCE = struct.Struct("<I")
+SECTION = struct.Struct("<III")
+TABLE_OFFSET = SEQUENCE.size
+# Extra section after module info sections for worker profiler report
+PROFILER_INDEX = len(MINFO_SECTIONS)
+PROFILER_REPORT_INTERVAL = 1.0  # seconds, summary sorts all samples, not updated per write
+TOTAL_SECTIONS = PROFILER_INDEX + 1
+DATA_OFFSET = TABLE_OFFSET + SECTION.size * TOTAL_SECTIONS
+# API that plays local data source, each process would run on separate timeline
+LOCAL_SOURCE_API = frozenset((
+    API_REPLAY_NAME,
+    API_SYNTHETIC_NAME,
+))
+# Sections that only increase version while output changed (instead of every update),
+# which can skip pickling if version is same as last written
+CHANGE_VERSIONED_SECTIONS = frozenset((
+    "mapping",
+    "pacenotes",
+    "tracknotes",
+))
+PRESET_KEYS = (
+    "config",
+    "setting",
+    "brakes",
+    "brands",
+    "classes",
+    "compounds",
+    "heatmap",
+    "tracks",
+)
+
+logger = logging.getLogger(__name__)
+
+
+def _mapping_proxy(data: dict) -> MappingProxyType:
+    """Recreate read-only mapping"""
+    return MappingProxyType(data)
+
+
+def _empty_dict() -> MappingProxyType:
+    """Get shared empty mapping"""
+    return EMPTY_DICT
+
+
+def _reduce_mapping_proxy(obj: MappingProxyType):
+    """Reduce read-only mapping (not picklable by default)"""
+    if obj is EMPTY_DICT:
+        return _empty_dict, ()
+    return _mapping_proxy, (dict(obj),)
+
+
+DISPATCH_TABLE = copyreg.dispatch_table.copy()
+DISPATCH_TABLE[MappingProxyType] = _reduce_mapping_proxy
+
+
+def pickle_section(section: object) -> bytes:
+    """Pickle module info section"""
+    data = io.BytesIO()
+    pickler = pickle.Pickler(data, pickle.HIGHEST_PROTOCOL)
+    pickler.dispatch_table = DISPATCH_TABLE
+    pickler.dump(section)
+    return data.getvalue()
+
+
+def restapi_values(data: object) -> tuple:
+    """Get Rest API data values in slot order"""
+    return tuple(getattr(data, name) for name in type(data).__slots__)
+
+
+def update_restapi_data(data: object, values: tuple):
+    """Update Rest API data in place from values in slot order"""
+    for name, value in zip(type(data).__slots__, values):
+        setattr(data, name, value)
+
+
+def open_shared_buffer(name: str, size: int, create: bool) -> mmap.mmap:
+    """Open named shared memory buffer, create new if create is True"""
+    if PLATFORM.WINDOWS:
+        return mmap.mmap(-1, size, tagname=name)
+    with open(f"/dev/shm/{name}", "w+b" if create else "r+b") as file:
+        if create:
+            file.truncate(size)
+        return mmap.mmap(file.fileno(), size)
+
+
+def close_shared_buffer(name: str, data: mmap.mmap, owner: bool):
+    """Close named shared memory buffer, remove if owner"""
+    data.close()
+    if owner and not PLATFORM.WINDOWS:
+        try:
+            os.remove(f"/dev/shm/{name}")
+        except OSError:
+            pass
+
+
+class ModuleInfoPublisher:
+    """Module info publisher (worker process)
+
+    Args:
+        data: shared memory buffer.
+    """
+
+    __slots__ = (
+        "_data",
+        "_sequence",
+        "_last",
+        "_last_versions",
+        "_offsets",
+        "_versions",
+        "_overflow",
+        "_profiler_enabled",
+        "_profiler_timer",
+    )
+
+    def __init__(self, data: mmap.mmap):
+        self._data = data
+        self._sequence = 0
+        self._last = [b""] * TOTAL_SECTIONS
+        self._last_versions = [-1] * TOTAL_SECTIONS
+        self._offsets = [-1] * TOTAL_SECTIONS
+        self._versions = [0] * TOTAL_SECTIONS
+        self._overflow = False
+        self._profiler_enabled = cfg.application["enable_performance_profiler"]
+        self._profiler_timer = -PROFILER_REPORT_INTERVAL
+
+    def write(self):
+        """Write module info snapshot, sequence is odd while writing"""
+        sections = [self.__pickle(index, name) for index, name in enumerate(MINFO_SECTIONS)]
+        sections.append(self.__pickle_profiler())
+        if DATA_OFFSET + sum(map(len, sections)) > SHARED_SIZE:
+            if not self._overflow:
+                self._overflow = True
+                logger.error("WORKER: module info snapshot exceeds shared memory size")
+            return
+        data = self._data
+        self._sequence = (self._sequence + 1) & 0xFFFFFFFF
+        SEQUENCE.pack_into(data, 0, self._sequence)
+        offset = DATA_OFFSET
+        for index, section_bytes in enumerate(sections):
+            size = len(section_bytes)
+            if self._last[index] != section_bytes:
+                self._last[index] = section_bytes
+                self._versions[index] = (self._versions[index] + 1) & 0xFFFFFFFF
+            elif self._offsets[index] == offset:  # unchanged data at same position
+                offset += size
+                continue
+            self._offsets[index] = offset
+            SECTION.pack_into(
+                data, TABLE_OFFSET + SECTION.size * index, self._versions[index], offset, size)
+            data[offset:offset + size] = section_bytes
+            offset += size
+        self._sequence = (self._sequence + 1) & 0xFFFFFFFF
+        SEQUENCE.pack_into(data, 0, self._sequence)
+
+    def __pickle(self, index: int, name: str) -> bytes:
+        """Pickle section, reuse last pickled data if section version unchanged"""
+        section = getattr(minfo, name)
+        if name == "vehicles":
+            return pickle_section(truncate_vehicles(section))
+        if name not in CHANGE_VERSIONED_SECTIONS:
+            return pickle_section(section)
+        version = section.version
+        if self._last_versions[index] == version:
+            return self._last[index]
+        self._last_versions[index] = version
+        return pickle_section(section)
+
+    def __pickle_profiler(self) -> bytes:
+        """Pickle worker profiler report, reuse last pickled data within report interval"""
+        if not self._profiler_enabled:
+            return self._last[PROFILER_INDEX] or pickle.dumps(())
+        timer = monotonic()
+        if timer - self._profiler_timer < PROFILER_REPORT_INTERVAL:
+            return self._last[PROFILER_INDEX]
+        self._profiler_timer = timer
+        return pickle.dumps(profiler.report())
+
+    def reset_profiler(self):
+        """Reset profiler and publish empty report on next write"""
+        profiler.reset()
+        self._profiler_timer = -PROFILER_REPORT_INTERVAL
+
+
+class ModuleInfoReceiver:
+    """Module info receiver (GUI process)
+
+    Args:
+        data: shared memory buffer.
+    """
+
+    __slots__ = (
+        "_data",
+        "_versions",
+    )
+
+    def __init__(self, data: mmap.mmap):
+        self._data = data
+        self._versions = [0] * TOTAL_SECTIONS
+
+    def read(self) -> bool:
+        """Read changed sections and update module info, False if data was being written"""
+        data = self._data
+        sequence = SEQUENCE.unpack_from(data, 0)[0]
+        if sequence & 1:
+            return False
+        changed = []
+        for index in range(TOTAL_SECTIONS):
+            version, offset, size = SECTION.unpack_from(data, TABLE_OFFSET + SECTION.size * index)
+            if version != self._versions[index]:
+                changed.append((index, version, data[offset:offset + size]))
+        if SEQUENCE.unpack_from(data, 0)[0] != sequence:
+            return False
+        for index, version, section_bytes in changed:
+            self._versions[index] = version
+            if index == PROFILER_INDEX:
+                profiler.update_remote(pickle.loads(section_bytes))
+            else:
+                update_section(getattr(minfo, MINFO_SECTIONS[index]), pickle.loads(section_bytes))
+        return True
+
+
+def update_section(target: object, source: object):
+    """Update module info section in place, keep section object reference"""
+    if isinstance(target, VehiclesInfo):
+        for target_data, source_data in zip(target.dataSet, source.dataSet):
+            update_section(target_data, source_data)
+        skip_name = "dataSet"
+    else:
+        skip_name = ""
+    for name in type(target).__slots__:
+        if name != skip_name:
+            setattr(target, name, getattr(source, name))
+
+
+def truncate_vehicles(vehicles: VehiclesInfo) -> VehiclesInfo:
+    """Copy vehicles info with only active vehicles data set, which is much faster to pickle"""
+    output = VehiclesInfo.__new__(VehiclesInfo)
+    for name in VehiclesInfo.__slots__:
+        setattr(output, name, getattr(vehicles, name))
+    output.dataSet = vehicles.dataSet[:max(vehicles.totalVehicles, 0)]
+    return output
+
+
+class RemoteModule:
+    """Data module proxy running in worker process
+
+    Same start & stop interface as DataModule, for ModuleControl.
+
+    Args:
+        worker: module worker.
+        module_name: module name.
+    """
+
+    __slots__ = (
+        "module_name",
+        "closed",
+        "_worker",
+    )
+
+    def __init__(self, worker: ModuleWorker, module_name: str):
+        self.module_name = module_name
+        self.closed = True
+        self._worker = worker
+
+    def start(self):
+        """Start module in worker process, with current module setting"""
+        if self.closed:
+            self.closed = False
+            self._worker.send("start", self.module_name, dict(cfg.user.setting[self.module_name]))
+
+    def stop(self):
+        """Stop module in worker process"""
+        self._worker.send("close", self.module_name)
+        self.closed = True
+
+
+class ModuleWorker:
+    """Module worker control (GUI process)
+
+    Attributes:
+        running: whether worker process is running.
+    """
+
+    __slots__ = (
+        "_process",
+        "_commands",
+        "_stop_event",
+        "_event",
+        "_receiving",
+        "_shared_name",
+        "_shared_data",
+    )
+
+    def __init__(self):
+        self._process = None
+        self._commands = None
+        self._stop_event = None
+        self._event = threading.Event()
+        self._receiving = False
+        self._shared_name = ""
+        self._shared_data = None
+
+    @property
+    def running(self) -> bool:
+        """Whether worker process is running"""
+        return self._process is not None and self._process.is_alive()
+
+    def start(self):
+        """Start worker process if multi-process mode enabled"""
+        if self._process is not None or not cfg.application["enable_multiprocess_mode"]:
+            return
+        if api.name in LOCAL_SOURCE_API:
+            logger.warning("WORKER: %s API is not supported, fall back to single process", api.name)
+            return
+        self._shared_name = f"TinyPedal_Worker_{os.getpid()}"
+        try:
+            self._shared_data = open_shared_buffer(self._shared_name, SHARED_SIZE, True)
+        except (OSError, ValueError):
+            logger.error("WORKER: failed creating shared memory, fall back to single process")
+            return
+        preset = {key: getattr(cfg.user, key) for key in PRESET_KEYS}
+        context = multiprocessing.get_context("spawn")
+        self._commands = context.Queue()
+        self._stop_event = context.Event()
+        self._process = context.Process(
+            target=run_worker,
+            args=(preset, cfg.filename.setting, self._shared_name, self._commands, self._stop_event),
+            daemon=True,
+        )
+        self._process.start()
+        self._event.clear()
+        self._receiving = True
+        threading.Thread(target=self.__receiving, daemon=True).start()
+        logger.info("ENABLED: module worker (pid %s)", self._process.pid)
+
+    def close(self):
+        """Stop worker process"""
+        if self._process is None:
+            return
+        self._stop_event.set()
+        self._process.join(5)
+        if self._process.is_alive():
+            self._process.terminate()
+            self._process.join()
+        self._event.set()
+        while self._receiving:
+            sleep(0.01)
+        self._commands.close()
+        close_shared_buffer(self._shared_name, self._shared_data, True)
+        self._process = None
+        self._commands = None
+        self._stop_event = None
+        self._shared_data = None
+        profiler.update_remote(())  # module stats are re-registered locally if single process
+        logger.info("DISABLED: module worker")
+
+    def send(self, *command):
+        """Send command to worker process"""
+        if self._commands is not None:
+            self._commands.put(command)
+
+    def __receiving(self):
+        """Receive module info snapshot from worker process, send changed Rest API data"""
+        _event_wait = self._event.wait
+        receiver = ModuleInfoReceiver(self._shared_data)
+        restapi_data = api.restapi_data
+        last_restapi = None
+        update_interval = cfg.application["minimum_update_interval"] / 1000
+        while not _event_wait(update_interval):
+            receiver.read()
+            # Rest API is only updated by GUI process, forward changes to worker process
+            if restapi_data is not None:
+                restapi = restapi_values(restapi_data)
+                if last_restapi != restapi:
+                    last_restapi = restapi
+                    self.send("restapi_data", pickle_section(restapi))
+        self._receiving = False
+
+
+def run_worker(
+    preset: dict, preset_filename: str, shared_name: str,
+    commands: multiprocessing.Queue, stop_event: multiprocessing.Event):
+    """Worker process entry, run API & data modules and publish module info"""
+    from .log_handler import new_stream_handler
+    from .module_control import mctrl
+
+    root_logger = logging.getLogger(__package__)
+    root_logger.setLevel(logging.INFO)
+    if sys.stdout is not None:
+        new_stream_handler(root_logger, sys.stdout)
+
+    # Load same preset as GUI process
+    for key, value in preset.items():
+        setattr(cfg.user, key, value)
+    cfg.filename.setting = preset_filename
+    cfg.path.update(
+        user_path=cfg.user.config["user_path"],
+        default_path=cfg.default.config["user_path"],
+    )
+    shared_data = open_shared_buffer(shared_name, SHARED_SIZE, False)
+    publisher = ModuleInfoPublisher(shared_data)
+
+    api.connect()
+    # Capture & Rest API updating are done by GUI process only
+    api.start(capture=False, restapi=False)
+    logger.info("WORKER: started (pid %s)", os.getpid())
+
+    update_interval = cfg.application["minimum_update_interval"] / 1000
+    while not stop_event.wait(update_interval):
+        # Update state, same as overlay control
+        realtime_state.active = api.read.state.active()
+        realtime_state.paused = api.read.state.paused()
+        # Apply module commands
+        while True:
+            try:
+                command = commands.get_nowait()
+            except queue.Empty:
+                break
+            if command[0] == "start":
+                _, name, setting = command
+                cfg.user.setting[name] = setting
+                mctrl.start(name)
+            elif command[0] == "close":
+                mctrl.close(command[1])
+            elif command[0] == "setup_api":
+                _, key, setting = command
+                cfg.user.setting[key] = setting
+                api.setup()
+            elif command[0] == "restapi_data":
+                restapi_data = api.restapi_data
+                if restapi_data is not None:
+                    update_restapi_data(restapi_data, pickle.loads(command[1]))
+            elif command[0] == "reset_consumption":
+                minfo.history.reset_consumption()
+            elif command[0] == "reset_profiler":
+                publisher.reset_profiler()
+        publisher.write()
+
+    mctrl.close()
+    api.stop()
+    api.close()
+    close_shared_buffer(shared_name, shared_data, False)
+    logger.info("WORKER: closed")
+
+
+module_worker = ModuleWorker()
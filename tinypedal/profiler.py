@@ -0,0 +1,250 @@
+#  TinyPedal is an open-source overlay application for racing simulation.
+#  Copyright (C) 2022-2026 TinyPedal developers, see contributors.md file
+#
+#  This file is part of TinyPedal.
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Performance profiler
+"""
+
+from __future__ import annotations
+
+import csv
+import json
+import threading
+from collections import deque
+from itertools import chain
+from time import perf_counter
+from typing import Callable
+
+PROFILE_SAMPLES = 1000  # number of recent samples for statistics
+REPORT_COLUMNS = (
+    "name",
+    "category",
+    "calls",
+    "calls_per_second",
+    "min_ms",
+    "avg_ms",
+    "p99_ms",
+    "max_ms",
+    "budget_ms",
+    "overruns",
+)
+COUNTER_COLUMNS = (
+    "counter",
+    "key",
+    "value",
+)
+
+
+class ProfileStats:
+    """Profile stats
+
+    Record elapsed time of a repeating callback, such as data module
+    update loop iteration, or widget timer or paint event.
+
+    Args:
+        name: profile name.
+        category: profile category, such as "module", "widget timer", "widget paint".
+        budget: time budget (seconds) per call, usually update interval.
+            Call takes longer than budget is counted as overrun. 0 to disable.
+    """
+
+    __slots__ = (
+        "name",
+        "category",
+        "budget",
+        "calls",
+        "overruns",
+        "_samples",
+        "_timestamps",
+        "_start",
+    )
+
+    def __init__(self, name: str, category: str, budget: float = 0.0):
+        self.name = name
+        self.category = category
+        self.budget = budget
+        self.calls = 0
+        self.overruns = 0
+        self._samples: deque[float] = deque(maxlen=PROFILE_SAMPLES)
+        self._timestamps: deque[float] = deque(maxlen=PROFILE_SAMPLES)
+        self._start = 0.0
+
+    def reset(self) -> None:
+        """Reset recorded stats"""
+        self.calls = 0
+        self.overruns = 0
+        self._samples.clear()
+        self._timestamps.clear()
+
+    def begin(self) -> None:
+        """Begin timing"""
+        self._start = perf_counter()
+
+    def end(self) -> None:
+        """End timing and record elapsed time, ignored if not begun"""
+        if self._start:
+            self.record(perf_counter() - self._start, self._start)
+            self._start = 0.0
+
+    def record(self, elapsed: float, timestamp: float) -> None:
+        """Record elapsed time (seconds) at timestamp (perf_counter)"""
+        self._samples.append(elapsed)
+        self._timestamps.append(timestamp)
+        self.calls += 1
+        if 0 < self.budget < elapsed:
+            self.overruns += 1
+
+    def samples(self) -> tuple[float, ...]:
+        """Recent elapsed time samples (seconds), in recorded order"""
+        return tuple(self._samples)
+
+    def summary(self) -> dict:
+        """Summary of recorded stats from recent samples, time in milliseconds"""
+        samples = sorted(self._samples)
+        total = len(samples)
+        if total:
+            time_min = samples[0] * 1000
+            time_avg = sum(samples) / total * 1000
+            time_p99 = samples[min(int(total * 0.99), total - 1)] * 1000
+            time_max = samples[-1] * 1000
+        else:
+            time_min = time_avg = time_p99 = time_max = 0.0
+        timestamps = tuple(self._timestamps)
+        duration = timestamps[-1] - timestamps[0] if timestamps else 0.0
+        if duration > 0:
+            calls_per_second = (len(timestamps) - 1) / duration
+        else:
+            calls_per_second = 0.0
+        return {
+            "name": self.name,
+            "category": self.category,
+            "calls": self.calls,
+            "calls_per_second": round(calls_per_second, 2),
+            "min_ms": round(time_min, 4),
+            "avg_ms": round(time_avg, 4),
+            "p99_ms": round(time_p99, 4),
+            "max_ms": round(time_max, 4),
+            "budget_ms": round(self.budget * 1000, 4),
+            "overruns": self.overruns,
+        }
+
+
+class Profiler:
+    """Performance profiler
+
+    Collect profile stats from data modules and widgets.
+    Stats are kept after module or widget closed, until re-registered.
+    Report from other process (such as module worker) can be added as remote report.
+    Counter stats (such as cache hits) are collected from registered counter sources.
+    """
+
+    __slots__ = (
+        "_lock",
+        "_stats",
+        "_remote",
+        "_counters",
+    )
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._stats: dict[tuple[str, str], ProfileStats] = {}
+        self._remote: tuple[dict, ...] = ()
+        self._counters: dict[str, tuple[Callable[[], dict], Callable[[], None] | None]] = {}
+
+    def register(self, name: str, category: str, budget: float = 0.0) -> ProfileStats:
+        """Register new profile stats, replace existing stats with same name & category"""
+        stats = ProfileStats(name, category, budget)
+        with self._lock:
+            self._stats[name, category] = stats
+        return stats
+
+    def get(self, name: str, category: str) -> ProfileStats | None:
+        """Get registered profile stats, None if not registered"""
+        with self._lock:
+            return self._stats.get((name, category))
+
+    def reset(self) -> None:
+        """Reset all recorded profile stats"""
+        with self._lock:
+            for stats in self._stats.values():
+                stats.reset()
+            self._remote = ()
+            counter_resets = tuple(reset for _, reset in self._counters.values() if reset)
+        for reset in counter_resets:
+            reset()
+
+    def register_counter(
+        self, name: str, source: Callable[[], dict], reset: Callable[[], None] | None = None
+    ) -> None:
+        """Register counter stats source, replace existing source with same name
+
+        Args:
+            name: counter name.
+            source: function that returns counter stats dictionary.
+            reset: optional function that resets counter stats on profiler reset.
+        """
+        with self._lock:
+            self._counters[name] = source, reset
+
+    def counters(self) -> dict[str, dict]:
+        """Collect counter stats from registered counter sources"""
+        with self._lock:
+            counters = tuple(self._counters.items())
+        return {name: source() for name, (source, _) in counters}
+
+    def update_remote(self, report: list[dict] | tuple[dict, ...]) -> None:
+        """Update remote report from other process, replace existing remote report"""
+        with self._lock:
+            self._remote = tuple(report)
+
+    def report(self) -> list[dict]:
+        """Create profile report (include remote report), sorted by average time in descending order"""
+        with self._lock:
+            stats_list = tuple(self._stats.values())
+            remote = self._remote
+        return sorted(
+            chain((stats.summary() for stats in stats_list), remote),
+            key=lambda data: data["avg_ms"],
+            reverse=True,
+        )
+
+    def export_json(self, filename_full: str) -> None:
+        """Export profile report & counter stats to JSON file"""
+        output = {
+            "profiles": self.report(),
+            "counters": self.counters(),
+        }
+        with open(filename_full, "w", encoding="utf-8") as jsonfile:
+            json.dump(output, jsonfile, indent=4)
+
+    def export_csv(self, filename_full: str) -> None:
+        """Export profile report to CSV file, followed by counter stats table"""
+        with open(filename_full, "w", newline="", encoding="utf-8") as csvfile:
+            data_writer = csv.DictWriter(csvfile, fieldnames=REPORT_COLUMNS)
+            data_writer.writeheader()
+            data_writer.writerows(self.report())
+            counters = self.counters()
+            if counters:
+                counter_writer = csv.writer(csvfile)
+                counter_writer.writerow(())
+                counter_writer.writerow(COUNTER_COLUMNS)
+                for name, stats in counters.items():
+                    counter_writer.writerows((name, key, value) for key, value in stats.items())
+
+
+profiler = Profiler()
@@ -96,6 +96,7 @@ CFG_STRING = (
     # Partial match
     "file_name|"
     "prefix|"
+    "shared_memory_name|"
     "sound_format|"
     "suffix|"
     "symbol|"
@@ -135,6 +136,7 @@ CFG_INTEGER = (
     "bar_height|"
     "bar_length|"
     "bar_width|"
+    "cache_size|"
     "display_order|"
     "decimal_places|"
     "display_detail_level|"
@@ -110,6 +110,7 @@ class FilePath:
         "track_map",
         "track_notes",
         "car_setups",
+        "captures",
     )
 
     def __init__(self):
@@ -127,6 +128,7 @@ class FilePath:
         self.track_map = ""
         self.track_notes = ""
         self.car_setups = ""
+        self.captures = ""
 
     def update(self, user_path: dict, default_path: dict):
         """Update path variables from global user path dictionary"""
@@ -20,7 +20,12 @@
 Default API setting template
 """
 
-from ..const_api import API_LMU_CONFIG, API_RF2_CONFIG
+from ..const_api import (
+    API_LMU_CONFIG,
+    API_REPLAY_CONFIG,
+    API_RF2_CONFIG,
+    API_SYNTHETIC_CONFIG,
+)
 
 API_DEFAULT = {
     API_LMU_CONFIG: {
@@ -32,6 +37,7 @@ API_DEFAULT = {
         "player_index": -1,
         "enable_restapi_access": True,
         "restapi_update_interval": 200,
+        "restapi_max_requests_per_second": 10,
         "url_host": "localhost",
         "url_port": 6397,
         "connection_timeout": 1,
@@ -42,6 +48,7 @@ API_DEFAULT = {
         "enable_session_info": True,
         "enable_vehicle_info": True,
         "enable_weather_info": True,
+        "enable_telemetry_capture": False,
     },
     API_RF2_CONFIG: {
         "access_mode": 0,
@@ -53,6 +60,7 @@ API_DEFAULT = {
         "player_index": -1,
         "enable_restapi_access": True,
         "restapi_update_interval": 200,
+        "restapi_max_requests_per_second": 10,
         "url_host": "localhost",
         "url_port": 5397,
         "connection_timeout": 1,
@@ -61,5 +69,34 @@ API_DEFAULT = {
         "enable_garage_setup_info": True,
         "enable_session_info": True,
         "enable_weather_info": True,
+        "enable_telemetry_capture": False,
+    },
+    API_REPLAY_CONFIG: {
+        "character_encoding": "UTF-8",
+        "enable_active_state_override": False,
+        "active_state": True,
+        "enable_player_index_override": False,
+        "player_index": -1,
+        "replay_file_name": "",
+        "replay_speed": 1.0,
+        "enable_replay_loop": False,
+    },
+    API_SYNTHETIC_CONFIG: {
+        "character_encoding": "UTF-8",
+        "enable_active_state_override": False,
+        "active_state": True,
+        "enable_player_index_override": False,
+        "player_index": -1,
+        "track_map_file_name": "",
+        "track_length": 5000.0,
+        "number_of_vehicles": 128,
+        "number_of_classes": 3,
+        "class_lap_time_gap": 0.06,
+        "base_lap_time": 100.0,
+        "lap_time_variation": 0.02,
+        "pit_stop_lap_interval": 12,
+        "pit_stop_duration": 30.0,
+        "scoring_update_interval": 200,
+        "telemetry_update_interval": 10,
     },
 }
@@ -44,6 +44,14 @@ GLOBAL_DEFAULT = {
         "snap_gap": 0,
         "grid_move_size": 8,
         "minimum_update_interval": 10,
+        "enable_performance_profiler": False,
+        "enable_frame_cache": False,
+        "enable_multiprocess_mode": False,
+        "enable_overlay_clock": False,
+        "enable_overlay_clock_display_sync": False,
+        "overlay_clock_update_interval": 10,
+        "enable_text_pixmap_cache": False,
+        "text_pixmap_cache_size": 16,
         "maximum_saving_attempts": 10,
         "position_x": 0,
         "position_y": 0,
@@ -76,6 +84,7 @@ GLOBAL_DEFAULT = {
         "pace_notes_path": set_default_config_path("pacenotes/"),
         "track_notes_path": set_default_config_path("tracknotes/"),
         "car_setups_path": set_default_data_path("carsetups/"),
+        "captures_path": set_default_data_path("captures/"),
     },
     "notification": {
         "notify_locked_preset": True,
@@ -33,6 +33,12 @@ MODULE_DEFAULT = {
         "laptime_pace_samples": 6,
         "laptime_pace_margin": 5,
     },
+    "module_export": {
+        "enable": False,
+        "update_interval": 20,
+        "idle_update_interval": 400,
+        "shared_memory_name": "TinyPedal_ModuleInfo",
+    },
     "module_force": {
         "enable": True,
         "update_interval": 10,
@@ -91,6 +97,15 @@ MODULE_DEFAULT = {
         "minimum_pitstop_threshold_seconds": 3,
         "minimum_tyre_temperature_threshold": 55,
     },
+    "module_stream": {
+        "enable": False,
+        "update_interval": 20,
+        "idle_update_interval": 400,
+        "url_host": "localhost",
+        "url_port": 8765,
+        "minimum_client_update_interval": 50,
+        "maximum_number_of_clients": 8,
+    },
     "module_vehicles": {
         "enable": True,
         "update_interval": 10,
@@ -1482,6 +1482,33 @@ WIDGET_DEFAULT = {
         "display_order_clutch": 2,
         "display_order_ffb": 1,
     },
+    "performance_profiler": {
+        "enable": False,
+        "update_interval": 1000,
+        "position_x": 145,
+        "position_y": 740,
+        "font_name": "Consolas",
+        "font_size": 15,
+        "font_weight": "Bold",
+        "enable_auto_font_offset": True,
+        "font_offset_vertical": 0,
+        "opacity": 0.9,
+        "bar_padding": 0.2,
+        "bar_gap": 1,
+        "number_of_entries": 10,
+        "name_width": 20,
+        "show_module": True,
+        "show_widget_timer": True,
+        "show_widget_paint": True,
+        "show_text_pixmap_cache": True,
+        "show_caption": True,
+        "font_color_caption": "#CCCCCC",
+        "background_color_caption": "#777777",
+        "font_color_entry": "#FFFFFF",
+        "background_color_entry": "#222222",
+        "font_color_overrun": "#FFFFFF",
+        "background_color_overrun": "#CC2200",
+    },
     "pit_stop_estimate": {
         "enable": False,
         "update_interval": 50,
@@ -23,15 +23,17 @@ Menu
 import os
 
 from PySide2.QtGui import QDesktopServices
-from PySide2.QtWidgets import QMenu, QMessageBox
+from PySide2.QtWidgets import QFileDialog, QMenu, QMessageBox
 
 from .. import app_signal, loader
 from ..api_control import api
 from ..const_app import PLATFORM, URL_FAQ, URL_USER_GUIDE
-from ..const_file import ConfigType
+from ..const_file import ConfigType, FileFilter
 from ..formatter import format_option_name
 from ..module_info import minfo
+from ..module_worker import module_worker
 from ..overlay_control import octrl
+from ..profiler import profiler
 from ..setting import cfg
 from ..update import update_checker
 from .about import About
@@ -70,7 +72,7 @@ def menu_refresh_only():
 
 def menu_restart_api():
     """Command - restart api"""
-    api.restart()
+    loader.restart_api()
     app_signal.refresh.emit(True)
 
 
@@ -199,7 +201,8 @@ class ResetDataMenu(QMenu):
         """Reset deltabest data"""
         self.__confirmation(
             data_type="delta best",
-            extension="csv",
+            extension="tpdb",
+            legacy_extension="csv",
             filepath=cfg.path.delta_best,
             filename=api.read.session.combo_name(),
         )
@@ -208,7 +211,8 @@ class ResetDataMenu(QMenu):
         """Reset energy delta data"""
         self.__confirmation(
             data_type="energy delta",
-            extension="energy",
+            extension="tped",
+            legacy_extension="energy",
             filepath=cfg.path.energy_delta,
             filename=api.read.session.combo_name(),
         )
@@ -217,7 +221,8 @@ class ResetDataMenu(QMenu):
         """Reset fuel delta data"""
         self.__confirmation(
             data_type="fuel delta",
-            extension="fuel",
+            extension="tpfd",
+            legacy_extension="fuel",
             filepath=cfg.path.fuel_delta,
             filename=api.read.session.combo_name(),
         )
@@ -230,7 +235,11 @@ class ResetDataMenu(QMenu):
             filepath=cfg.path.fuel_delta,
             filename=api.read.session.combo_name(),
         ):
-            minfo.history.reset_consumption()
+            # Reset in worker process, as module info is synced from worker
+            if module_worker.running:
+                module_worker.send("reset_consumption")
+            else:
+                minfo.history.reset_consumption()
 
     def reset_sectorbest(self):
         """Reset sector best data"""
@@ -250,7 +259,9 @@ class ResetDataMenu(QMenu):
             filename=api.read.session.track_name(),
         )
 
-    def __confirmation(self, data_type: str, extension: str, filepath: str, filename: str) -> bool:
+    def __confirmation(
+        self, data_type: str, extension: str, filepath: str, filename: str,
+        legacy_extension: str = "") -> bool:
         """Message confirmation, returns true if file deleted"""
         # Check if on track
         if api.read.state.active():
@@ -261,8 +272,11 @@ class ResetDataMenu(QMenu):
             )
             return False
         # Check if file exist
-        filename_full = f"{filepath}{filename}.{extension}"
-        if not os.path.exists(filename_full):
+        filename_list = [f"{filepath}{filename}.{extension}"]
+        if legacy_extension:  # also remove legacy file, otherwise it will be migrated again
+            filename_list.append(f"{filepath}{filename}.{legacy_extension}")
+        filename_list = [_filename for _filename in filename_list if os.path.exists(_filename)]
+        if not filename_list:
             QMessageBox.warning(
                 self._parent,
                 "Error",
@@ -283,7 +297,8 @@ class ResetDataMenu(QMenu):
         if delete_msg != QMessageBox.Yes:
             return False
         # Delete file
-        os.remove(filename_full)
+        for filename_full in filename_list:
+            os.remove(filename_full)
         QMessageBox.information(
             self._parent,
             f"Reset {data_type.title()}",
@@ -584,6 +599,13 @@ class ToolsMenu(QMenu):
 
         editor_tracknotes = self.addAction("Track Notes Editor")
         editor_tracknotes.triggered.connect(self.open_editor_tracknotes)
+        self.addSeparator()
+
+        profiler_export = self.addAction("Export Profiler Report")
+        profiler_export.triggered.connect(self.export_profiler_report)
+
+        profiler_reset = self.addAction("Reset Profiler Data")
+        profiler_reset.triggered.connect(self.reset_profiler)
 
     def open_utility_fuelcalc(self):
         """Fuel calculator"""
@@ -640,6 +662,36 @@ class ToolsMenu(QMenu):
         _dialog = TrackNotesEditor(self._parent)
         _dialog.show()
 
+    def reset_profiler(self):
+        """Reset performance profiler data, include module worker"""
+        profiler.reset()
+        module_worker.send("reset_profiler")
+
+    def export_profiler_report(self):
+        """Export performance profiler report"""
+        if not cfg.application["enable_performance_profiler"]:
+            QMessageBox.warning(
+                self._parent,
+                "Error",
+                "Performance profiler is disabled.<br><br>"
+                "Enable <b>enable_performance_profiler</b> option in Application config, "
+                "then reload preset to collect profiler data.",
+            )
+            return
+        filename_full, file_filter = QFileDialog.getSaveFileName(
+            self._parent,
+            dir="profiler_report",
+            filter=";;".join((FileFilter.JSON, FileFilter.CSV)),
+        )
+        if not filename_full:  # save canceled
+            return
+        if file_filter == FileFilter.CSV:
+            profiler.export_csv(filename_full)
+        else:
+            profiler.export_json(filename_full)
+        QMessageBox.information(
+            self._parent, "Saved", f"Profiler report saved at:<br><b>{filename_full}</b>")
+
 
 class WindowMenu(QMenu):
     """Window menu"""
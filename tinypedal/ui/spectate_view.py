@@ -32,7 +32,7 @@ from PySide2.QtWidgets import (
     QWidget,
 )
 
-from .. import app_signal
+from .. import app_signal, loader
 from ..api_control import api
 from ..setting import cfg
 from ._common import UIScaler
@@ -114,7 +114,7 @@ class SpectateList(QWidget):
         """Toggle spectate mode"""
         cfg.api["enable_player_index_override"] = checked
         cfg.save()
-        api.setup()
+        loader.setup_api()
         app_signal.refresh.emit(True)
 
     def spectate_selected(self):
@@ -166,5 +166,5 @@ class SpectateList(QWidget):
         """Save selected driver index"""
         if cfg.api["player_index"] != index:
             cfg.api["player_index"] = index
-            api.setup()
+            loader.setup_api()
             cfg.save()
@@ -22,26 +22,39 @@ Delta best file function
 
 from __future__ import annotations
 
-import csv
 import logging
+from array import array
 
 from ..const_file import FileExt
 from ..validator import invalid_save_name, valid_delta_set
+from .delta_trace import load_legacy_csv_file, load_trace_file, save_trace_file
+
+DELTA_BEST_COLUMNS = 2  # distance, laptime
 
 logger = logging.getLogger(__name__)
 
 
 def load_delta_best_file(
-    filepath: str, filename: str, defaults: tuple, extension: str = FileExt.CSV
-) -> tuple[tuple, float]:
-    """Load delta best file (*.csv)"""
+    filepath: str, filename: str, defaults: tuple, extension: str = FileExt.TPDB
+) -> tuple[array, float]:
+    """Load delta best file (*.tpdb), migrate from legacy delta best file (*.csv)
+
+    Delta best data is flat float array (row by row): distance, laptime.
+    """
     try:
-        with open(f"{filepath}{filename}{extension}", newline="", encoding="utf-8") as csvfile:
-            data_reader = csv.reader(csvfile, quoting=csv.QUOTE_NONNUMERIC)
-            temp_list = tuple(tuple(data) for data in data_reader)
+        try:
+            temp_list, columns = load_trace_file(f"{filepath}{filename}{extension}")
+            migrating = False
+        except FileNotFoundError:
+            temp_list, columns = load_legacy_csv_file(f"{filepath}{filename}{FileExt.CSV}")
+            migrating = True
         # Validate data
-        bestlist = valid_delta_set(temp_list)
-        laptime_best = bestlist[-1][1]
+        if columns != DELTA_BEST_COLUMNS:
+            raise ValueError
+        bestlist = valid_delta_set(temp_list, columns)
+        laptime_best = bestlist[-1]
+        if migrating:
+            save_delta_best_file(filepath, filename, bestlist, extension)
         return bestlist, laptime_best
     except FileNotFoundError:
         logger.info("MISSING: delta best (%s) data", extension)
@@ -51,12 +64,10 @@ def load_delta_best_file(
 
 
 def save_delta_best_file(
-    filepath: str, filename: str, dataset: tuple, extension: str = FileExt.CSV
+    filepath: str, filename: str, dataset: array, extension: str = FileExt.TPDB
 ) -> None:
-    """Save delta best file (*.csv)"""
-    if len(dataset) < 10 or invalid_save_name(filename):
+    """Save delta best file (*.tpdb)"""
+    if len(dataset) < 10 * DELTA_BEST_COLUMNS or invalid_save_name(filename):
         return
-    with open(f"{filepath}{filename}{extension}", "w", newline="", encoding="utf-8") as csvfile:
-        data_writer = csv.writer(csvfile)
-        data_writer.writerows(dataset)
-        logger.info("USERDATA: %s%s saved", filename, extension)
+    save_trace_file(f"{filepath}{filename}{extension}", filename, dataset, DELTA_BEST_COLUMNS)
+    logger.info("USERDATA: %s%s saved", filename, extension)
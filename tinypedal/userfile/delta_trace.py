@@ -0,0 +1,132 @@
+#  TinyPedal is an open-source overlay application for racing simulation.
+#  Copyright (C) 2022-2026 TinyPedal developers, see contributors.md file
+#
+#  This file is part of TinyPedal.
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Delta trace binary file function
+
+File layout (little-endian):
+    header: magic, format version, columns, rows, crc32 checksum, name length.
+    name: UTF-8 encoded combo name, zero padded to 8 bytes alignment.
+    data: rows * columns float64 values, stored row by row.
+"""
+
+from __future__ import annotations
+
+import csv
+import mmap
+import struct
+import sys
+from array import array
+from itertools import chain
+from zlib import crc32
+
+TRACE_MAGIC = b"TPDT"
+TRACE_VERSION = 1
+TRACE_HEADER = struct.Struct("<4sHHIIH")
+DOUBLE_SIZE = 8
+NATIVE_LITTLE_ENDIAN = sys.byteorder == "little"
+
+
+def data_offset(name_length: int) -> int:
+    """Data offset after header and name, aligned to 8 bytes"""
+    return (TRACE_HEADER.size + name_length + 7) & ~7
+
+
+def load_trace_file(filename_full: str) -> tuple[array, int]:
+    """Load delta trace binary file via memory mapping
+
+    Args:
+        filename_full: full file path with extension.
+
+    Returns:
+        Flat float array (row by row), number of columns.
+
+    Raises:
+        FileNotFoundError: if file not found.
+        ValueError: if file is empty, truncated, or fails format or checksum check.
+    """
+    with open(filename_full, "rb") as file:
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            if len(data) < TRACE_HEADER.size:
+                raise ValueError("truncated header")
+            magic, version, columns, rows, checksum, name_length = TRACE_HEADER.unpack_from(data)
+            if magic != TRACE_MAGIC or version != TRACE_VERSION or columns < 1:
+                raise ValueError("unsupported format")
+            start = data_offset(name_length)
+            end = start + rows * columns * DOUBLE_SIZE
+            if end > len(data):
+                raise ValueError("truncated data")
+            values = array("d")
+            with memoryview(data) as view, view[start:end] as payload:
+                if crc32(payload) != checksum:
+                    raise ValueError("checksum mismatch")
+                values.frombytes(payload)
+    if not NATIVE_LITTLE_ENDIAN:
+        values.byteswap()
+    return values, columns
+
+
+def save_trace_file(filename_full: str, name: str, dataset: array, columns: int) -> None:
+    """Save delta trace binary file
+
+    Args:
+        filename_full: full file path with extension.
+        name: combo name stored in header.
+        dataset: flat float array (row by row).
+        columns: number of columns per row.
+
+    Raises:
+        ValueError: if dataset is empty or not multiple of number of columns.
+    """
+    if not dataset or columns < 1:
+        raise ValueError("empty dataset")
+    rows, remainder = divmod(len(dataset), columns)
+    if remainder:
+        raise ValueError("inconsistent columns")
+    values = array("d", dataset)
+    if not NATIVE_LITTLE_ENDIAN:
+        values.byteswap()
+    payload = values.tobytes()
+    name_bytes = name.encode("utf-8")
+    header = TRACE_HEADER.pack(
+        TRACE_MAGIC, TRACE_VERSION, columns, rows, crc32(payload), len(name_bytes))
+    padding = bytes(data_offset(len(name_bytes)) - TRACE_HEADER.size - len(name_bytes))
+    with open(filename_full, "wb") as file:
+        file.write(header + name_bytes + padding)
+        file.write(payload)
+
+
+def load_legacy_csv_file(filename_full: str) -> tuple[array, int]:
+    """Load legacy delta trace CSV file as flat float array (row by row), number of columns
+
+    Rows shorter than widest row (such as legacy fuel delta, which only has
+    laptime in last row) are zero padded.
+
+    Raises:
+        ValueError: if file is empty.
+    """
+    with open(filename_full, newline="", encoding="utf-8") as csvfile:
+        data_reader = csv.reader(csvfile, quoting=csv.QUOTE_NONNUMERIC)
+        dataset = tuple(data_reader)
+    columns = max(map(len, dataset), default=0)
+    if not columns:
+        raise ValueError("empty dataset")
+    padding = (0.0,) * columns
+    values = array("d", chain.from_iterable(
+        row if len(row) == columns else (*row, *padding[len(row):]) for row in dataset))
+    return values, columns
@@ -22,26 +22,47 @@ Fuel/Energy delta file function
 
 from __future__ import annotations
 
-import csv
 import logging
+from array import array
 
+from ..const_file import FileExt
 from ..validator import invalid_save_name, valid_delta_set
+from .delta_trace import load_legacy_csv_file, load_trace_file, save_trace_file
 
 logger = logging.getLogger(__name__)
 
+FUEL_DELTA_COLUMNS = 3  # distance, used, laptime
+LEGACY_EXTENSION = {
+    FileExt.TPFD: FileExt.FUEL,
+    FileExt.TPED: FileExt.ENERGY,
+}
+
 
 def load_fuel_delta_file(
     filepath: str, filename: str, extension: str, defaults: tuple
-) -> tuple[tuple, float, float]:
-    """Load fuel/energy delta file (*.fuel, *.energy)"""
+) -> tuple[array, float, float]:
+    """Load fuel/energy delta file (*.tpfd, *.tped), migrate from legacy file (*.fuel, *.energy)
+
+    Fuel/energy delta data is flat float array (row by row): distance, used, laptime.
+    """
     try:
-        with open(f"{filepath}{filename}{extension}", newline="", encoding="utf-8") as csvfile:
-            data_reader = csv.reader(csvfile, quoting=csv.QUOTE_NONNUMERIC)
-            temp_list = tuple(tuple(data) for data in data_reader)
+        try:
+            temp_list, columns = load_trace_file(f"{filepath}{filename}{extension}")
+            migrating = False
+        except FileNotFoundError:
+            legacy_extension = LEGACY_EXTENSION.get(extension)
+            if legacy_extension is None:
+                raise
+            temp_list, columns = load_legacy_csv_file(f"{filepath}{filename}{legacy_extension}")
+            migrating = True
         # Validate data
-        lastlist = valid_delta_set(temp_list)
-        used_last = lastlist[-1][1]
-        laptime_last = lastlist[-1][2]
+        if columns != FUEL_DELTA_COLUMNS:
+            raise ValueError
+        lastlist = valid_delta_set(temp_list, columns)
+        used_last = lastlist[-2]
+        laptime_last = lastlist[-1]
+        if migrating:
+            save_fuel_delta_file(filepath, filename, extension, lastlist)
         return lastlist, used_last, laptime_last
     except FileNotFoundError:
         logger.info("MISSING: consumption delta (%s) data", extension)
@@ -51,12 +72,10 @@ def load_fuel_delta_file(
 
 
 def save_fuel_delta_file(
-    filepath: str, filename: str, extension: str, dataset: tuple
+    filepath: str, filename: str, extension: str, dataset: array
 ) -> None:
-    """Save fuel/energy delta file (*.fuel, *.energy)"""
-    if len(dataset) < 10 or invalid_save_name(filename):
+    """Save fuel/energy delta file (*.tpfd, *.tped)"""
+    if len(dataset) < 10 * FUEL_DELTA_COLUMNS or invalid_save_name(filename):
         return
-    with open(f"{filepath}{filename}{extension}", "w", newline="", encoding="utf-8") as csvfile:
-        data_writer = csv.writer(csvfile)
-        data_writer.writerows(dataset)
-        logger.info("USERDATA: %s%s saved", filename, extension)
+    save_trace_file(f"{filepath}{filename}{extension}", filename, dataset, FUEL_DELTA_COLUMNS)
+    logger.info("USERDATA: %s%s saved", filename, extension)
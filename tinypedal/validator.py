@@ -29,7 +29,7 @@ import time
 from functools import wraps
 from math import isfinite
 from time import monotonic
-from typing import Any, Iterable
+from typing import Any, Iterable, Sequence
 
 from .const_common import MAX_SECONDS
 from .const_file import FileExt
@@ -129,18 +129,18 @@ def image_exists(filepath: str, extension: str = FileExt.PNG, max_size: int = 10
 
 
 # Delta list validate
-def valid_delta_set(data: tuple) -> tuple:
-    """Validate delta data set"""
+def valid_delta_set(data: Sequence[float], columns: int) -> Sequence[float]:
+    """Validate flat delta data set (row by row)"""
+    # Delta list must have at least 13 lines of samples (first 13 rows are checked below)
+    if len(data) < 13 * columns:
+        raise ValueError
     # Final row value(second column) must be higher than previous row
-    if data[-1][1] < data[-2][1]:
+    if data[1 - columns] < data[1 - columns * 2]:
         raise ValueError
     # Check distance greater than next row for first 10 rows
     for idx in range(11, 0, -1):
-        if data[idx][0] > data[idx + 1][0]:
+        if data[idx * columns] > data[(idx + 1) * columns]:
             raise ValueError
-    # Delta list must have at least 10 lines of samples
-    if len(data) < 10:
-        raise ValueError
     return data
 
 
@@ -26,19 +26,21 @@ import logging
 from typing import Any
 
 from PySide2.QtCore import QBasicTimer, Qt, Slot
-from PySide2.QtGui import QFont, QFontMetrics, QPalette, QPixmap
+from PySide2.QtGui import QFont, QFontMetrics, QGuiApplication, QPalette, QPixmap
 from PySide2.QtWidgets import QGridLayout, QLayout, QMenu, QWidget
 
 from .. import app_signal, overlay_signal, realtime_state
 from ..const_app import APP_NAME
 from ..formatter import format_module_name
+from ..profiler import profiler
 from ..regex_pattern import FONT_WEIGHT_MAP
 from ..setting import Setting
-from ._common import FontMetrics, MousePosition
-from ._painter import RawImage, RawText
+from ._common import FontMetrics, MousePosition, OverlayClock, WidgetProfiler
+from ._painter import RawImage, RawText, text_pixmap_cache
 
 logger = logging.getLogger(__name__)
 mousepos = MousePosition()  # single instance shared by all widgets
+overlay_clock = OverlayClock()  # single instance shared by all widgets
 
 
 class Base(QWidget):
@@ -64,17 +66,22 @@ class Base(QWidget):
             self.wcfg["update_interval"],
             self.cfg.application["minimum_update_interval"],
         )
+        self._use_clock = self.cfg.application["enable_overlay_clock"]
+        self._profiler: WidgetProfiler | None = None
+        self._data_versions: tuple[int, ...] = ()
 
     def start(self):
         """Set initial widget state in orders, and start update"""
         self.__connect_signal()
         self.__set_window_attributes()  # 1
         self.__set_window_flags()  # 2
+        self.__toggle_profiler(self.cfg.application["enable_performance_profiler"])
         self.__toggle_timer(not realtime_state.active)
 
     def stop(self):
         """Stop and close widget"""
         self.__toggle_timer(True)
+        self.__toggle_profiler(False)
         self.__break_signal()
         self.__unload_resource()
         if not self.close():
@@ -96,6 +103,21 @@ class Base(QWidget):
         for var in self.__dict__:
             setattr(self, var, None)
 
+    def __toggle_profiler(self, enabled: bool):
+        """Toggle widget timer event and paint pass profiling"""
+        if enabled:
+            profiler.register_counter(
+                "text_pixmap_cache", text_pixmap_cache.stats, text_pixmap_cache.reset_stats)
+            budget = self._update_interval / 1000
+            self._profiler = WidgetProfiler(
+                self,
+                profiler.register(self.widget_name, "widget timer", budget),
+                profiler.register(self.widget_name, "widget paint", budget),
+            )
+        elif self._profiler is not None:
+            self._profiler.close()
+            self._profiler = None
+
     def __set_window_attributes(self):
         """Set window attributes"""
         self.setWindowOpacity(self.wcfg["opacity"])
@@ -151,10 +173,21 @@ class Base(QWidget):
     def __toggle_timer(self, paused: bool):
         """Toggle widget timer state"""
         if paused:
-            self._update_timer.stop()
+            if self._use_clock:
+                overlay_clock.unregister(self)
+            else:
+                self._update_timer.stop()
             self.post_update()
-        else:
+        elif self._use_clock:
+            overlay_clock.setInterval(set_clock_interval(self.cfg.application))
+            if self._profiler is None:
+                overlay_clock.register(self, self._update_interval)
+            else:
+                overlay_clock.register(self, self._update_interval, self._profiler.timer_stats)
+        elif self._profiler is None:
             self._update_timer.start(self._update_interval, self)
+        else:  # profiler sends timer event to widget
+            self._update_timer.start(self._update_interval, self._profiler)
 
     def __connect_signal(self):
         """Connect overlay lock and hide signal"""
@@ -242,6 +275,24 @@ class Base(QWidget):
 class Overlay(Base):
     """Inherit base window, add common GUI methods"""
 
+    def is_data_unchanged(self, *outputs: Any) -> bool:
+        """Check whether module output data unchanged since last check
+
+        Used in timerEvent to skip update, only if widget reads data
+        from specified module outputs (minfo) only.
+
+        Args:
+            outputs: module output data objects with version attribute.
+
+        Returns:
+            True if all output versions unchanged since last check.
+        """
+        versions = tuple(output.version for output in outputs)
+        if self._data_versions == versions:
+            return True
+        self._data_versions = versions
+        return False
+
     def config_font(self, name: str = "", size: int | float = 1, weight: str = "") -> QFont:
         """Config font
 
@@ -575,6 +626,15 @@ class Overlay(Base):
             layout.addLayout(target, *order)
 
 
+def set_clock_interval(config: dict) -> int:
+    """Set overlay clock interval (milliseconds), optionally from display refresh rate"""
+    if config["enable_overlay_clock_display_sync"]:
+        screen = QGuiApplication.primaryScreen()
+        if screen is not None and screen.refreshRate() > 0:
+            return max(round(1000 / screen.refreshRate()), config["minimum_update_interval"])
+    return max(config["overlay_clock_update_interval"], config["minimum_update_interval"])
+
+
 def validate_option(config: dict) -> dict:
     """Post validation for options"""
     # Check column/row index order, correct any overlapping indexes
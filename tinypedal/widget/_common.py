@@ -22,14 +22,19 @@ Overlay base common class.
 
 from __future__ import annotations
 
+from collections import OrderedDict
 from time import monotonic
-from typing import NamedTuple
+from typing import Any, NamedTuple
 
-from PySide2.QtCore import QPoint
+from PySide2.QtCore import QBasicTimer, QCoreApplication, QEvent, QObject, QPoint, Qt, QTimerEvent
+from PySide2.QtGui import QPixmap
 from PySide2.QtWidgets import QApplication, QWidget
 
+from ..profiler import ProfileStats
 from ..validator import generator_init
 
+PAINT_PASS_END = QEvent.Type(QEvent.registerEventType())
+
 
 class FontMetrics(NamedTuple):
     """Font metrics info"""
@@ -42,6 +47,211 @@ class FontMetrics(NamedTuple):
     voffset: int = 0
 
 
+class OverlayClock(QObject):
+    """Overlay clock
+
+    Single precise timer shared by all overlay widgets. Each registered widget
+    receives timer event on every N-th tick, where N is integer divisor of
+    widget update interval and clock interval. Widgets with same divisor
+    update on same tick, so resulting repaints are processed in same pass.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._timer = QBasicTimer()
+        self._interval = 10
+        self._tick = 0
+        self._event: QTimerEvent | None = None
+        self._widgets: dict[QWidget, tuple[int, ProfileStats | None]] = {}
+
+    @property
+    def interval(self) -> int:
+        """Clock interval (milliseconds)"""
+        return self._interval
+
+    def setInterval(self, interval: int):
+        """Set clock interval (milliseconds), only applied while no widget registered"""
+        if not self._widgets:
+            self._interval = max(int(interval), 1)
+
+    def register(self, widget: QWidget, update_interval: int, stats: ProfileStats | None = None):
+        """Register widget to receive timer event at nearest divisor of update interval
+
+        Args:
+            widget: overlay widget.
+            update_interval: widget update interval (milliseconds).
+            stats: widget timer profile stats, None if profiling disabled.
+        """
+        self._widgets[widget] = (max(round(update_interval / self._interval), 1), stats)
+        if not self._timer.isActive():
+            self._tick = 0
+            self._timer.start(self._interval, Qt.PreciseTimer, self)
+            self._event = QTimerEvent(self._timer.timerId())
+
+    def unregister(self, widget: QWidget):
+        """Unregister widget, stop clock if no widget registered"""
+        self._widgets.pop(widget, None)
+        if not self._widgets:
+            self._timer.stop()
+            self._event = None
+
+    def timerEvent(self, event):
+        """Deliver timer event to widgets on divisor tick"""
+        self._tick += 1
+        tick = self._tick
+        timer_event = self._event
+        send_event = QCoreApplication.sendEvent
+        for widget, (divisor, stats) in tuple(self._widgets.items()):
+            if tick % divisor:
+                continue
+            if stats is None:
+                send_event(widget, timer_event)
+            else:
+                stats.begin()
+                send_event(widget, timer_event)
+                stats.end()
+
+
+class WidgetProfiler(QObject):
+    """Widget profiler
+
+    Only created while profiling enabled, so that widget events are
+    dispatched by Qt as usual without overhead while profiling disabled.
+
+    Timer event is timed while this object is set as widget update timer target,
+    which sends timer event to widget. Timer event from overlay clock is timed
+    by overlay clock instead.
+
+    Paint pass is timed from widget update request (which repaints widget and
+    all its child widgets in single pass) seen by event filter, to a paint pass
+    end event posted with high priority, which is processed right after
+    update request, before other pending events.
+
+    Args:
+        widget: overlay widget.
+        timer_stats: widget timer profile stats.
+        paint_stats: widget paint pass profile stats.
+    """
+
+    def __init__(self, widget: QWidget, timer_stats: ProfileStats, paint_stats: ProfileStats):
+        super().__init__()
+        self._widget = widget
+        self.timer_stats = timer_stats
+        self._paint_stats = paint_stats
+        widget.installEventFilter(self)
+
+    def close(self):
+        """Remove event filter from widget"""
+        self._widget.removeEventFilter(self)
+        self._widget = None
+
+    def timerEvent(self, event):
+        """Send timer event to widget, time event"""
+        stats = self.timer_stats
+        stats.begin()
+        QCoreApplication.sendEvent(self._widget, event)
+        stats.end()
+
+    def eventFilter(self, watched, event):
+        """Begin paint pass timing on update request, let Qt dispatch event as usual"""
+        if event.type() == QEvent.UpdateRequest:
+            self._paint_stats.begin()
+            QCoreApplication.postEvent(self, QEvent(PAINT_PASS_END), Qt.HighEventPriority)
+        return False
+
+    def customEvent(self, event):
+        """End paint pass timing"""
+        if event.type() == PAINT_PASS_END:
+            self._paint_stats.end()
+
+
+class TextPixmapCache:
+    """Text pixmap cache
+
+    Least recently used cache of pre-rendered text pixmap shared by all
+    overlay widgets, keyed by text, font, color, size, alignment & offset.
+    Least recently used pixmaps are removed while total pixmap memory
+    exceeds memory budget.
+    """
+
+    __slots__ = (
+        "enabled",
+        "hits",
+        "misses",
+        "_budget",
+        "_used",
+        "_pixmaps",
+    )
+
+    def __init__(self):
+        self.enabled = False
+        self.hits = 0
+        self.misses = 0
+        self._budget = 0
+        self._used = 0
+        self._pixmaps: OrderedDict[tuple[Any, ...], QPixmap] = OrderedDict()
+
+    def setup(self, enabled: bool, cache_size: int):
+        """Setup cache state & memory budget (megabytes), clear cache if disabled"""
+        self.enabled = enabled and cache_size > 0
+        self._budget = max(int(cache_size), 0) * 1048576
+        if self.enabled:
+            self.__evict()
+        else:
+            self.clear()
+
+    def get(self, key: tuple[Any, ...]) -> QPixmap | None:
+        """Get cached pixmap, None if not cached"""
+        pixmap = self._pixmaps.get(key)
+        if pixmap is None:
+            self.misses += 1
+            return None
+        self._pixmaps.move_to_end(key)
+        self.hits += 1
+        return pixmap
+
+    def add(self, key: tuple[Any, ...], pixmap: QPixmap):
+        """Add pixmap to cache, and remove least recently used pixmaps if over budget"""
+        old_pixmap = self._pixmaps.pop(key, None)
+        if old_pixmap is not None:
+            self._used -= pixmap_size(old_pixmap)
+        self._pixmaps[key] = pixmap
+        self._used += pixmap_size(pixmap)
+        self.__evict()
+
+    def clear(self):
+        """Clear cached pixmaps & counters"""
+        self._pixmaps.clear()
+        self._used = 0
+        self.hits = 0
+        self.misses = 0
+
+    def reset_stats(self):
+        """Reset cache hit & miss counts"""
+        self.hits = 0
+        self.misses = 0
+
+    def stats(self) -> dict:
+        """Cache stats"""
+        total = self.hits + self.misses
+        return {
+            "enabled": self.enabled,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / total, 4) if total else 0.0,
+            "pixmaps": len(self._pixmaps),
+            "used_bytes": self._used,
+            "budget_bytes": self._budget,
+        }
+
+    def __evict(self):
+        """Remove least recently used pixmaps until within budget"""
+        pixmaps = self._pixmaps
+        while self._used > self._budget and pixmaps:
+            _, pixmap = pixmaps.popitem(last=False)
+            self._used -= pixmap_size(pixmap)
+
+
 class MousePosition:
     """Mouse position & snapping"""
 
@@ -173,6 +383,11 @@ class MousePosition:
         return pos
 
 
+def pixmap_size(pixmap: QPixmap) -> int:
+    """Pixmap memory size (bytes)"""
+    return pixmap.width() * pixmap.height() * max(pixmap.depth(), 8) // 8
+
+
 @generator_init
 def warning_flash(duration: float, interval: float, max_count: int):
     """Warning flash state"""
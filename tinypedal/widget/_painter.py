@@ -22,13 +22,19 @@ Overlay base painter class.
 
 from __future__ import annotations
 
-from typing import Any
+from math import ceil
+from typing import Any, Callable, Hashable
 
-from PySide2.QtCore import QRectF, Qt
-from PySide2.QtGui import QFont, QPainter, QPen, QPixmap
+from PySide2.QtCore import QEvent, QPointF, QRectF, Qt
+from PySide2.QtGui import QFont, QPainter, QPen, QPixmap, QStaticText, QTransform
 from PySide2.QtWidgets import QWidget
 
 from ..const_common import GEAR_SEQUENCE
+from ._common import TextPixmapCache
+
+TABLE_TEXT_CACHE_SIZE = 1024  # max cached static text per table canvas
+
+text_pixmap_cache = TextPixmapCache()  # single instance shared by all widgets
 
 
 class WheelGaugeBar(QWidget):
@@ -410,6 +416,7 @@ class RawText(QWidget):
         self._pen_text = QPen()
         self._width = self.width()
         self._height = self.height()
+        self._font_key = self.font().key()
 
     def clear(self):
         """Clear display"""
@@ -417,6 +424,12 @@ class RawText(QWidget):
         self.fg = Qt.transparent
         self.bg = Qt.transparent
 
+    def changeEvent(self, event):
+        """Update font info"""
+        if event.type() == QEvent.FontChange:
+            self._font_key = self.font().key()
+        super().changeEvent(event)
+
     def resizeEvent(self, event):
         """Update size info"""
         self._width = self.width()
@@ -425,6 +438,13 @@ class RawText(QWidget):
     def paintEvent(self, event):
         """Draw"""
         painter = QPainter(self)
+        if text_pixmap_cache.enabled:
+            painter.drawPixmap(0, 0, cached_text_pixmap(
+                self.font(), self._font_key, self.text, self.fg, self.bg,
+                self._width, self._height, self._alignment, self._offset_y,
+                self.devicePixelRatioF(),
+            ))
+            return
         self._pen_text.setColor(self.fg)
         painter.setPen(self._pen_text)
         painter.fillRect(0, 0, self._width, self._height, self.bg)
@@ -569,6 +589,7 @@ class MultiCompounds(QWidget):
         self._height = self.height()
         self.compounds = ("",) * count
         self.colors = (fg,) * count
+        self._font_key = self.font().key()
 
     def clear(self):
         """Clear display"""
@@ -576,6 +597,12 @@ class MultiCompounds(QWidget):
         self.colors = (Qt.transparent,) * self._count
         self.bg = Qt.transparent
 
+    def changeEvent(self, event):
+        """Update font info"""
+        if event.type() == QEvent.FontChange:
+            self._font_key = self.font().key()
+        super().changeEvent(event)
+
     def resizeEvent(self, event):
         """Update size info"""
         self._width = self.width()
@@ -585,9 +612,23 @@ class MultiCompounds(QWidget):
         """Draw"""
         painter = QPainter(self)
         painter.fillRect(0, 0, self._width, self._height, self.bg)
+        use_cache = text_pixmap_cache.enabled
+        if use_cache:
+            font = self.font()
+            ratio = self.devicePixelRatioF()
         for index, compound in enumerate(self.compounds):
             if not compound:
                 continue
+            if use_cache:
+                painter.drawPixmap(
+                    self._padding + self._word_width * index,
+                    0,
+                    cached_text_pixmap(
+                        font, self._font_key, compound, self.colors[index], Qt.transparent,
+                        self._word_width, self._height, self._alignment, self._offset_y, ratio,
+                    ),
+                )
+                continue
             self._pen_text.setColor(self.colors[index])
             painter.setPen(self._pen_text)
             painter.drawText(
@@ -598,3 +639,515 @@ class MultiCompounds(QWidget):
                 self._alignment,
                 compound,
             )
+
+
+class TableCell:
+    """Table cell state, drawn by TableCanvas
+
+    Attributes:
+        last: cache last data for comparison.
+        text: cell text, for text column.
+        image: cell image, for image column.
+        compounds: cell texts, for multi text column.
+        colors: foreground (font) colors of cell texts, for multi text column.
+        fg: foreground (font) color.
+        bg: background color.
+    """
+
+    __slots__ = (
+        "last",
+        "text",
+        "image",
+        "compounds",
+        "colors",
+        "fg",
+        "bg",
+        "_row",
+        "_dirty_rows",
+    )
+
+    def __init__(
+        self,
+        row: int,
+        dirty_rows: set[int],
+        fg_color: str = "",
+        bg_color: str = "",
+        last: Any | None = None,
+    ):
+        self.last = last
+        self.text = ""
+        self.image = None
+        self.compounds = ()
+        self.colors = ()
+        self.fg = fg_color if fg_color else Qt.transparent
+        self.bg = bg_color if bg_color else Qt.transparent
+        self._row = row
+        self._dirty_rows = dirty_rows
+
+    def clear(self):
+        """Clear display"""
+        self.text = ""
+        self.image = None
+        self.compounds = ()
+        self.colors = ()
+        self.fg = Qt.transparent
+        self.bg = Qt.transparent
+
+    def update(self):
+        """Mark cell row as changed, repainted on next table flush"""
+        self._dirty_rows.add(self._row)
+
+
+class TableColumn:
+    """Table column geometry & cells"""
+
+    __slots__ = (
+        "style",
+        "order",
+        "width",
+        "alignment",
+        "align_x",
+        "padding",
+        "word_width",
+        "cells",
+        "x",
+    )
+
+    TEXT = 0
+    IMAGE = 1
+    MULTI_TEXT = 2
+
+    def __init__(
+        self,
+        style: int,
+        order: int,
+        width: int,
+        alignment: Qt.Alignment,
+        align_x: float,
+        padding: int,
+        word_width: int,
+        cells: tuple[TableCell, ...],
+    ):
+        self.style = style
+        self.order = order
+        self.width = width
+        self.alignment = alignment
+        self.align_x = align_x
+        self.padding = padding
+        self.word_width = word_width
+        self.cells = cells
+        self.x = 0
+
+
+class TableCanvas(QWidget):
+    """Table canvas widget for optimized drawing
+
+    Draw all table cells in a single widget, instead of one widget per cell.
+    Changed rows are collected while updating cells, and repainted together
+    in one paint event on flush. Cell text is drawn from cached static text.
+
+    Args:
+        parent: parent widget.
+        rows: number of table rows.
+        row_height: row height in pixel.
+        row_gap: vertical gap between visible rows in pixel.
+        offset_y: font vertical offset in pixel.
+        hide_start: hide rows from this row index.
+    """
+
+    def __init__(
+        self,
+        parent,
+        rows: int,
+        row_height: int,
+        row_gap: int = 0,
+        offset_y: int = 0,
+        hide_start: int = 99999,
+    ):
+        super().__init__(parent)
+        self._rows = rows
+        self._row_gap = max(row_gap, 0)
+        self._offset_y = offset_y
+        self._row_height = [row_height if row < hide_start else 0 for row in range(rows)]
+        self._row_top = [0] * rows
+        self._columns: list[TableColumn] = []
+        self._dirty_rows: set[int] = set()
+        self._resized = False
+        self._pen_text = QPen()
+        self._static_text: dict[str, tuple[QStaticText, float, float]] = {}
+        self._width = 0
+        self._height = 0
+        self._font_key = self.font().key()
+
+    def add_text_column(
+        self,
+        order: int,
+        width: int,
+        fg_color: str = "",
+        bg_color: str = "",
+        alignment: Qt.Alignment = Qt.AlignCenter,
+        last: Any | None = None,
+    ) -> tuple[TableCell, ...]:
+        """Add text column
+
+        Args:
+            order: column display order.
+            width: column width in pixel.
+            fg_color: foreground (font) color.
+            bg_color: background color.
+            alignment: Qt.Alignment.
+            last: cache last data for comparison.
+
+        Returns:
+            Column cells, one per row.
+        """
+        return self.__add_column(
+            TableColumn.TEXT, order, width, alignment, 0, width, fg_color, bg_color, last)
+
+    def add_image_column(
+        self,
+        order: int,
+        width: int,
+        bg_color: str = "",
+        last: Any | None = None,
+    ) -> tuple[TableCell, ...]:
+        """Add image column, image is drawn at cell center
+
+        Args:
+            order: column display order.
+            width: column width in pixel.
+            bg_color: background color.
+            last: cache last data for comparison.
+
+        Returns:
+            Column cells, one per row.
+        """
+        return self.__add_column(
+            TableColumn.IMAGE, order, width, Qt.AlignCenter, 0, width, "", bg_color, last)
+
+    def add_multi_text_column(
+        self,
+        order: int,
+        count: int,
+        width: int,
+        spacing: int = 0,
+        padding: int = 0,
+        fg_color: str = "",
+        bg_color: str = "",
+        alignment: Qt.Alignment = Qt.AlignCenter,
+        last: Any | None = None,
+    ) -> tuple[TableCell, ...]:
+        """Add multi color text column
+
+        Args:
+            order: column display order.
+            count: number of texts per cell.
+            width: width of each text in pixel.
+            spacing: spacing between texts in pixel.
+            padding: total horizontal padding of cell in pixel.
+            fg_color: foreground (font) color.
+            bg_color: background color.
+            alignment: Qt.Alignment.
+            last: cache last data for comparison.
+
+        Returns:
+            Column cells, one per row.
+        """
+        word_width = width + spacing
+        cells = self.__add_column(
+            TableColumn.MULTI_TEXT, order, count * word_width + padding, alignment,
+            padding // 2, word_width, fg_color, bg_color, last)
+        for cell in cells:
+            cell.compounds = ("",) * count
+            cell.colors = (cell.fg,) * count
+        return cells
+
+    def __add_column(
+        self, style: int, order: int, width: int, alignment: Qt.Alignment,
+        padding: int, word_width: int, fg_color: str, bg_color: str, last: Any | None,
+    ) -> tuple[TableCell, ...]:
+        """Add column"""
+        if int(alignment & Qt.AlignLeft):
+            align_x = 0.0
+        elif int(alignment & Qt.AlignRight):
+            align_x = 1.0
+        else:
+            align_x = 0.5
+        cells = tuple(
+            TableCell(row, self._dirty_rows, fg_color, bg_color, last)
+            for row in range(self._rows)
+        )
+        self._columns.append(TableColumn(
+            style, order, width, alignment, align_x, padding, word_width, cells))
+        self._columns.sort(key=lambda column: column.order)  # stable sort
+        self.__update_layout()
+        return cells
+
+    def changeEvent(self, event):
+        """Update font info, and clear static text cache"""
+        if event.type() == QEvent.FontChange:
+            self._font_key = self.font().key()
+            self._static_text.clear()
+        super().changeEvent(event)
+
+    def set_row_height(self, row: int, height: int):
+        """Set row height, 0 to hide row, applied on next flush"""
+        if self._row_height[row] != height:
+            self._row_height[row] = height
+            self._resized = True
+
+    def flush(self):
+        """Repaint changed rows, or whole table if row height changed"""
+        dirty_rows = self._dirty_rows
+        if self._resized:
+            self._resized = False
+            self.__update_layout()
+            self.update()
+        elif dirty_rows:
+            first_row = min(dirty_rows)
+            last_row = max(dirty_rows)
+            top = self._row_top[first_row]
+            bottom = self._row_top[last_row] + self._row_height[last_row]
+            if bottom > top:
+                self.update(0, top, self._width, bottom - top)
+        dirty_rows.clear()
+
+    def __update_layout(self):
+        """Update column & row position, and table size"""
+        pos_x = 0
+        for column in self._columns:
+            column.x = pos_x
+            pos_x += column.width
+        pos_y = 0
+        for row, height in enumerate(self._row_height):
+            self._row_top[row] = pos_y
+            if height > 0:
+                pos_y += height + self._row_gap
+        self._width = pos_x
+        self._height = max(pos_y - self._row_gap, 0)
+        self.setFixedSize(self._width, self._height)
+
+    def __static_text(self, text: str) -> tuple[QStaticText, float, float]:
+        """Get cached static text (prepared glyph layout) & size"""
+        cache = self._static_text
+        static_data = cache.get(text)
+        if static_data is None:
+            if len(cache) >= TABLE_TEXT_CACHE_SIZE:
+                cache.clear()
+            static_text = QStaticText(text)
+            static_text.setTextFormat(Qt.PlainText)
+            static_text.setPerformanceHint(QStaticText.AggressiveCaching)
+            static_text.prepare(QTransform(), self.font())
+            size = static_text.size()
+            static_data = cache[text] = (static_text, size.width(), size.height())
+        return static_data
+
+    def __draw_text(
+        self, painter: QPainter, text: str, color: str, column: TableColumn,
+        pos_x: int, pos_y: int, width: int, height: int):
+        """Draw text in cell area"""
+        if text_pixmap_cache.enabled:
+            painter.drawPixmap(pos_x, pos_y, cached_text_pixmap(
+                self.font(), self._font_key, text, color, Qt.transparent,
+                width, height, column.alignment, self._offset_y, self.devicePixelRatioF(),
+            ))
+            return
+        static_text, text_width, text_height = self.__static_text(text)
+        self._pen_text.setColor(color)
+        painter.setPen(self._pen_text)
+        painter.drawStaticText(
+            QPointF(
+                pos_x + (width - text_width) * column.align_x,
+                pos_y + self._offset_y + (height - text_height) * 0.5,
+            ),
+            static_text,
+        )
+
+    def paintEvent(self, event):
+        """Draw rows within update area"""
+        painter = QPainter(self)
+        painter.setFont(self.font())
+        area = event.rect()
+        area_top = area.top()
+        area_bottom = area.bottom()
+        draw_text = self.__draw_text
+        columns = self._columns
+        for row, (row_top, row_height) in enumerate(zip(self._row_top, self._row_height)):
+            if row_height <= 0 or row_top > area_bottom or row_top + row_height <= area_top:
+                continue
+            for column in columns:
+                cell = column.cells[row]
+                pos_x = column.x
+                painter.fillRect(pos_x, row_top, column.width, row_height, cell.bg)
+                if column.style == TableColumn.TEXT:
+                    if cell.text:
+                        draw_text(painter, cell.text, cell.fg, column,
+                                  pos_x, row_top, column.width, row_height)
+                elif column.style == TableColumn.IMAGE:
+                    image = cell.image
+                    if isinstance(image, QPixmap):
+                        painter.drawPixmap(
+                            pos_x + (column.width - image.width()) // 2,  # align center
+                            row_top + (row_height - image.height()) // 2,
+                            image,
+                        )
+                else:
+                    pos_x += column.padding
+                    for text, color in zip(cell.compounds, cell.colors):
+                        if text:
+                            draw_text(painter, text, color, column,
+                                      pos_x, row_top, column.word_width, row_height)
+                        pos_x += column.word_width
+
+
+class SpriteAtlas:
+    """Sprite atlas
+
+    Pre-render sprites (such as vehicle markers) of same cell size into
+    a single atlas pixmap, once per style key, and draw sprite by blitting
+    atlas fragment, instead of setting pen & brush and drawing shapes & text
+    for each marker on each repaint. Atlas pixmap grows as new sprite added.
+
+    Args:
+        cell_size: sprite cell width & height in pixel.
+        columns: number of sprite cells per atlas row.
+        max_sprites: max number of sprites, atlas is cleared once reached.
+    """
+
+    __slots__ = (
+        "_cell_size",
+        "_device_size",
+        "_half_size",
+        "_columns",
+        "_max_sprites",
+        "_ratio",
+        "_rows",
+        "_pixmap",
+        "_sprites",
+    )
+
+    def __init__(self, cell_size: float, columns: int = 16, max_sprites: int = 1024):
+        self._cell_size = max(ceil(cell_size), 1)
+        self._device_size = self._cell_size
+        self._half_size = self._cell_size * 0.5
+        self._columns = max(columns, 1)
+        self._max_sprites = max(max_sprites, 1)
+        self._ratio = 1.0
+        self._rows = 0
+        self._pixmap = QPixmap()
+        self._sprites: dict[Hashable, QRectF] = {}
+
+    @property
+    def ratio(self) -> float:
+        """Device pixel ratio"""
+        return self._ratio
+
+    def clear(self, ratio: float = 1.0):
+        """Clear sprites, and set device pixel ratio"""
+        self._ratio = ratio
+        self._device_size = ceil(self._cell_size * ratio)  # align cell to device pixel
+        self._half_size = self._device_size / ratio * 0.5
+        self._rows = 0
+        self._pixmap = QPixmap()
+        self._sprites.clear()
+
+    def sprite(self, key: Hashable) -> QRectF | None:
+        """Get sprite source rect (device pixel) in atlas, None if not exist"""
+        return self._sprites.get(key)
+
+    def add(self, key: Hashable, render: Callable[..., None], *args: Any) -> QRectF:
+        """Render & add new sprite to atlas
+
+        Args:
+            key: sprite style key.
+            render: sprite render function, called as render(painter, *args),
+                which draws sprite with origin translated to sprite cell center.
+            args: render function arguments.
+
+        Returns:
+            Sprite source rect (device pixel) in atlas pixmap.
+        """
+        if len(self._sprites) >= self._max_sprites:
+            self.clear(self._ratio)
+        index = len(self._sprites)
+        row, column = divmod(index, self._columns)
+        if row >= self._rows:
+            self.__grow(row + 1)
+        device_size = self._device_size
+        cell_size = device_size / self._ratio
+        painter = QPainter(self._pixmap)
+        painter.setRenderHint(QPainter.Antialiasing, True)
+        painter.translate(column * cell_size + self._half_size, row * cell_size + self._half_size)
+        render(painter, *args)
+        painter.end()
+        source = QRectF(column * device_size, row * device_size, device_size, device_size)
+        self._sprites[key] = source
+        return source
+
+    def draw(self, painter: QPainter, pos_x: float, pos_y: float, source: QRectF):
+        """Draw sprite centered at position"""
+        painter.drawPixmap(
+            QPointF(pos_x - self._half_size, pos_y - self._half_size),
+            self._pixmap,
+            source,
+        )
+
+    def __grow(self, min_rows: int):
+        """Grow atlas pixmap rows, and copy existing sprites"""
+        rows = max(min_rows, self._rows * 2)
+        pixmap = QPixmap(self._columns * self._device_size, rows * self._device_size)
+        pixmap.setDevicePixelRatio(self._ratio)
+        pixmap.fill(Qt.transparent)
+        if self._rows:
+            painter = QPainter(pixmap)
+            painter.drawPixmap(0, 0, self._pixmap)
+            painter.end()
+        self._pixmap = pixmap
+        self._rows = rows
+
+
+def cached_text_pixmap(
+    font: QFont,
+    font_key: str,
+    text: str,
+    fg_color: str,
+    bg_color: str,
+    width: int,
+    height: int,
+    alignment: Qt.Alignment,
+    offset_y: int,
+    ratio: float,
+) -> QPixmap:
+    """Get pre-rendered text pixmap from shared text pixmap cache, render if not cached
+
+    Args:
+        font: QFont.
+        font_key: QFont key, for cache key.
+        text: text.
+        fg_color: foreground (font) color.
+        bg_color: background color.
+        width: pixmap width in pixel.
+        height: pixmap height in pixel.
+        alignment: Qt.Alignment.
+        offset_y: font vertical offset in pixel.
+        ratio: device pixel ratio.
+
+    Returns:
+        Text pixmap.
+    """
+    key = (text, font_key, fg_color, bg_color, width, height, int(alignment), offset_y, ratio)
+    pixmap = text_pixmap_cache.get(key)
+    if pixmap is None:
+        pixmap = QPixmap(max(round(width * ratio), 1), max(round(height * ratio), 1))
+        pixmap.setDevicePixelRatio(ratio)
+        pixmap.fill(Qt.transparent)
+        painter = QPainter(pixmap)
+        painter.setFont(font)
+        painter.fillRect(0, 0, width, height, bg_color)
+        pen = QPen()
+        pen.setColor(fg_color)
+        painter.setPen(pen)
+        painter.drawText(0, offset_y, width, height, alignment, text)
+        painter.end()
+        text_pixmap_cache.add(key, pixmap)
+    return pixmap
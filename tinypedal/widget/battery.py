@@ -137,6 +137,18 @@ class Realtime(Overlay):
 
     def timerEvent(self, event):
         """Update when vehicle on track"""
+        # Skip if data unchanged, except while warning flash (state changes over time)
+        if self.is_data_unchanged(minfo.hybrid, minfo.delta) and not (
+            self.wcfg["show_battery_charge"]
+            and self.wcfg["show_battery_charge_warning_flash"]
+            and not (
+                self.wcfg["low_battery_threshold"]
+                < minfo.hybrid.batteryCharge
+                < self.wcfg["high_battery_threshold"]
+            )
+        ):
+            return
+
         # Battery charge & usage
         if self.wcfg["show_battery_charge"]:
             battery_charge = minfo.hybrid.batteryCharge
@@ -132,6 +132,9 @@ class Realtime(Overlay):
 
     def timerEvent(self, event):
         """Update when vehicle on track"""
+        if self.is_data_unchanged(minfo.force):
+            return
+
         # Longitudinal g-force
         if self.wcfg["show_longitudinal_g_force"]:
             gf_lgt = round(minfo.force.lgtGForceRaw, 2)
@@ -350,7 +350,13 @@ class Realtime(Overlay):
     def timerEvent(self, event):
         """Update when vehicle on track"""
         is_low_fuel = minfo.fuel.estimatedLaps <= self.wcfg["low_fuel_lap_threshold"]
-        if self.wcfg["show_low_fuel_warning_flash"] and minfo.fuel.estimatedValidConsumption:
+        is_flash_enabled = (
+            self.wcfg["show_low_fuel_warning_flash"] and minfo.fuel.estimatedValidConsumption)
+        # Skip if data unchanged, except while warning flash (state changes over time)
+        if self.is_data_unchanged(minfo.fuel) and not (is_flash_enabled and is_low_fuel):
+            return
+
+        if is_flash_enabled:
             is_low_fuel = self.warn_flash.send(is_low_fuel)
             if is_low_fuel:
                 padding = 0.00000001  # add padding for switching state
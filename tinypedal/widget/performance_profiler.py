@@ -0,0 +1,182 @@
+#  TinyPedal is an open-source overlay application for racing simulation.
+#  Copyright (C) 2022-2026 TinyPedal developers, see contributors.md file
+#
+#  This file is part of TinyPedal.
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Performance profiler Widget
+"""
+
+from ..profiler import profiler
+from ._base import Overlay
+from ._painter import text_pixmap_cache
+
+CATEGORY_PREFIX = {
+    "module": "M",
+    "widget timer": "T",
+    "widget paint": "P",
+}
+
+
+class Realtime(Overlay):
+    """Draw widget"""
+
+    def __init__(self, config, widget_name):
+        # Assign base setting
+        super().__init__(config, widget_name)
+        layout = self.set_grid_layout(gap_vert=self.wcfg["bar_gap"])
+        self.set_primary_layout(layout=layout)
+
+        # Config font
+        font = self.config_font(
+            self.wcfg["font_name"],
+            self.wcfg["font_size"],
+            self.wcfg["font_weight"],
+        )
+        self.setFont(font)
+        font_m = self.get_font_metrics(font)
+
+        # Config variable
+        bar_padx = self.set_padding(self.wcfg["font_size"], self.wcfg["bar_padding"])
+        self.entry_count = min(max(self.wcfg["number_of_entries"], 1), 50)
+        self.name_width = max(self.wcfg["name_width"], 4)
+        self.categories = tuple(
+            category for category, option in (
+                ("module", "show_module"),
+                ("widget timer", "show_widget_timer"),
+                ("widget paint", "show_widget_paint"),
+            ) if self.wcfg[option]
+        )
+        text_width = self.name_width + 28
+        text_align = self.set_text_alignment(1)
+
+        # Caption
+        if self.wcfg["show_caption"]:
+            text_caption = self.format_caption(self.name_width)
+            bar_caption = self.set_rawtext(
+                text=text_caption,
+                width=font_m.width * text_width + bar_padx,
+                fixed_height=font_m.height,
+                offset_y=font_m.voffset,
+                fg_color=self.wcfg["font_color_caption"],
+                bg_color=self.wcfg["background_color_caption"],
+                alignment=text_align,
+            )
+            layout.addWidget(bar_caption, 0, 0)
+
+        # Entries
+        self.bar_style_entry = (
+            (
+                self.wcfg["font_color_entry"],
+                self.wcfg["background_color_entry"],
+            ),
+            (
+                self.wcfg["font_color_overrun"],
+                self.wcfg["background_color_overrun"],
+            ),
+        )
+        self.bars_entry = tuple(
+            self.set_rawtext(
+                text="",
+                width=font_m.width * text_width + bar_padx,
+                fixed_height=font_m.height,
+                offset_y=font_m.voffset,
+                fg_color=self.bar_style_entry[0][0],
+                bg_color=self.bar_style_entry[0][1],
+                alignment=text_align,
+            )
+            for _ in range(self.entry_count)
+        )
+        self.set_grid_layout_table_column(
+            layout=layout,
+            targets=self.bars_entry,
+            row_start=1,
+        )
+
+        # Text pixmap cache
+        if self.wcfg["show_text_pixmap_cache"]:
+            self.bar_cache = self.set_rawtext(
+                width=font_m.width * text_width + bar_padx,
+                fixed_height=font_m.height,
+                offset_y=font_m.voffset,
+                fg_color=self.bar_style_entry[0][0],
+                bg_color=self.bar_style_entry[0][1],
+                alignment=text_align,
+            )
+            layout.addWidget(self.bar_cache, self.entry_count + 1, 0)
+
+    def timerEvent(self, event):
+        """Update when vehicle on track"""
+        categories = self.categories
+        report = [data for data in profiler.report() if data["category"] in categories]
+        for index, target in enumerate(self.bars_entry):
+            if index < len(report):
+                data = report[index]
+                entry = (
+                    data["category"], data["name"], data["avg_ms"], data["p99_ms"],
+                    data["calls_per_second"], data["overruns"],
+                )
+            else:
+                entry = None
+            self.update_entry(target, entry)
+
+        # Text pixmap cache
+        if self.wcfg["show_text_pixmap_cache"]:
+            stats = text_pixmap_cache.stats()
+            cache = (
+                stats["enabled"], stats["hit_rate"], stats["pixmaps"],
+                stats["used_bytes"], stats["budget_bytes"],
+            )
+            self.update_cache(self.bar_cache, cache)
+
+    # GUI update methods
+    def update_entry(self, target, data):
+        """Profile entry"""
+        if target.last != data:
+            target.last = data
+            if data is None:
+                target.text = ""
+                target.fg, target.bg = self.bar_style_entry[0]
+            else:
+                category, name, avg_ms, p99_ms, calls_per_second, overruns = data
+                prefix = CATEGORY_PREFIX.get(category, "-")
+                target.text = (
+                    f"{prefix} {name[:self.name_width]: <{self.name_width}}"
+                    f"{avg_ms: >7.2f}{p99_ms: >7.2f}{calls_per_second: >6.0f}{min(overruns, 99999): >6}"
+                )
+                target.fg, target.bg = self.bar_style_entry[overruns > 0]
+            target.update()
+
+    def update_cache(self, target, data):
+        """Text pixmap cache stats"""
+        if target.last != data:
+            target.last = data
+            enabled, hit_rate, pixmaps, used_bytes, budget_bytes = data
+            name = "text pixmap cache"
+            if enabled:
+                target.text = (
+                    f"C {name[:self.name_width]: <{self.name_width}}"
+                    f"{hit_rate * 100: >6.1f}%{pixmaps: >7}"
+                    f"{used_bytes / 1048576: >6.1f}{budget_bytes / 1048576: >6.0f}"
+                )
+            else:
+                target.text = f"C {name[:self.name_width]: <{self.name_width}}{'disabled': >26}"
+            target.update()
+
+    @staticmethod
+    def format_caption(name_width: int) -> str:
+        """Format caption text"""
+        return f"{'  Name': <{name_width + 2}}{'Avg': >7}{'P99': >7}{'Hz': >6}{'Over': >6}"
@@ -21,6 +21,7 @@ Radar Widget
 """
 
 from itertools import islice
+from math import hypot
 from typing import NamedTuple
 
 from PySide2.QtCore import QRectF, Qt
@@ -38,6 +39,7 @@ from .. import calculation as calc
 from ..api_control import api
 from ..module_info import minfo
 from ._base import Overlay
+from ._painter import SpriteAtlas
 
 
 class IndicatorDimension(NamedTuple):
@@ -142,6 +144,13 @@ class Realtime(Overlay):
             "yellow": self.set_brush_style(self.wcfg["vehicle_color_yellow"]),
         }
 
+        # Vehicle sprite atlas, cell size covers rotated vehicle shape & outline
+        self.veh_atlas = SpriteAtlas(
+            hypot(self.veh_shape.width(), self.veh_shape.height())
+            + max(self.wcfg["vehicle_outline_width"], 0) * 2 + 2,
+            columns=8,
+        )
+
         self.draw_radar_marks(self.area_center)
         self.draw_radar_mask()
 
@@ -167,6 +176,9 @@ class Realtime(Overlay):
         if self.show_radar:
             painter = QPainter(self)
             painter.setRenderHint(QPainter.Antialiasing, True)
+            pixel_ratio = self.devicePixelRatioF()
+            if self.veh_atlas.ratio != pixel_ratio:
+                self.veh_atlas.clear(pixel_ratio)
             # Draw circle background
             if self.wcfg["show_circle_background"]:
                 painter.fillRect(self.rect_radar, self.wcfg["background_color_circle"])
@@ -327,7 +339,9 @@ class Realtime(Overlay):
 
     def draw_vehicle(self, painter, visible_range: DistanceRect, indicator: IndicatorDimension):
         """Draw opponents vehicles"""
-        painter.setPen(self.pen_veh)
+        show_orientation = self.wcfg["show_vehicle_orientation"]
+        if show_orientation:
+            painter.setRenderHint(QPainter.SmoothPixmapTransform, True)
         # Real size in meters
         nearest_left = -indicator.max_range_x
         nearest_right = indicator.max_range_x
@@ -351,16 +365,21 @@ class Realtime(Overlay):
                     if indicator.min_range_x < raw_pos_x < nearest_right:
                         nearest_right = raw_pos_x
 
-                # Draw vehicle
-                painter.setBrush(self.color_lap_diff(veh_info))
-                painter.translate(  # scale vehicle position coordinate to global scale
-                    raw_pos_x * self.global_scale + self.area_center,
-                    raw_pos_y * self.global_scale + self.area_center,
-                )
-                if self.wcfg["show_vehicle_orientation"]:
+                # Draw vehicle sprite, render sprite once per brush (cached for widget lifetime)
+                brush = self.color_lap_diff(veh_info)
+                source = self.veh_atlas.sprite(id(brush))
+                if source is None:
+                    source = self.veh_atlas.add(id(brush), self.render_vehicle_sprite, brush)
+                # Scale vehicle position coordinate to global scale
+                pos_x = raw_pos_x * self.global_scale + self.area_center
+                pos_y = raw_pos_y * self.global_scale + self.area_center
+                if show_orientation:
+                    painter.translate(pos_x, pos_y)
                     painter.rotate(calc.rad2deg(-veh_info.relativeOrientationRadians))
-                painter.drawRoundedRect(self.veh_shape, self.veh_radius, self.veh_radius)
-                painter.resetTransform()
+                    self.veh_atlas.draw(painter, 0, 0, source)
+                    painter.resetTransform()
+                else:
+                    self.veh_atlas.draw(painter, pos_x, pos_y, source)
 
         # Draw overlap indicator below vehicle shape
         if self.wcfg["show_overlap_indicator"]:
@@ -370,6 +389,12 @@ class Realtime(Overlay):
             else:
                 self.draw_warning_rect(painter, nearest_left, nearest_right, indicator)
 
+    def render_vehicle_sprite(self, painter, brush):
+        """Render vehicle sprite"""
+        painter.setPen(self.pen_veh)
+        painter.setBrush(brush)
+        painter.drawRoundedRect(self.veh_shape, self.veh_radius, self.veh_radius)
+
     # Additional methods
     def color_lap_diff(self, veh_info):
         """Compare lap differences & set color"""
@@ -34,7 +34,7 @@ from ..module_info import minfo
 from ..userfile.custom_image import load_brand_logo_image
 from ..userfile.heatmap import select_compound_color, select_compound_symbol
 from ._base import Overlay
-from ._painter import MultiCompounds
+from ._painter import TableCanvas
 
 
 class Realtime(Overlay):
@@ -43,7 +43,7 @@ class Realtime(Overlay):
     def __init__(self, config, widget_name):
         # Assign base setting
         super().__init__(config, widget_name)
-        layout = self.set_grid_layout(gap_vert=self.wcfg["bar_gap"])
+        layout = self.set_grid_layout()
         self.set_primary_layout(layout=layout)
 
         # Config font
@@ -77,6 +77,16 @@ class Realtime(Overlay):
         self.pixmap_brandlogo = {}
         self.row_visible = [False] * self.veh_range
 
+        # Table canvas
+        self.table = TableCanvas(
+            self,
+            rows=self.veh_range,
+            row_height=font_m.height,
+            row_gap=self.wcfg["bar_gap"],
+            offset_y=font_m.voffset,
+        )
+        layout.addWidget(self.table, 0, 0)
+
         # Driver position
         if self.wcfg["show_position"]:
             self.bar_style_pos = self.set_lap_difference(
@@ -85,18 +95,11 @@ class Realtime(Overlay):
                 plr_fg_color=self.wcfg["font_color_player_position"],
                 plr_bg_color=self.wcfg["background_color_player_position"],
             )
-            self.bars_pos = self.set_rawtext(
+            self.bars_pos = self.table.add_text_column(
+                order=self.wcfg["display_order_position"],
                 width=2 * font_m.width + bar_padx,
-                fixed_height=font_m.height,
-                offset_y=font_m.voffset,
                 fg_color=self.bar_style_pos[0][0],
                 bg_color=self.bar_style_pos[0][1],
-                count=self.veh_range,
-            )
-            self.set_grid_layout_table_column(
-                layout=layout,
-                targets=self.bars_pos,
-                column=self.wcfg["display_order_position"],
             )
         # Driver position change
         if self.wcfg["show_position_change"]:
@@ -118,18 +121,11 @@ class Realtime(Overlay):
                     self.wcfg["background_color_player_position_change"],
                 ),
             )
-            self.bars_pgl = self.set_rawtext(
+            self.bars_pgl = self.table.add_text_column(
+                order=self.wcfg["display_order_position_change"],
                 width=3 * font_m.width + bar_padx,
-                fixed_height=font_m.height,
-                offset_y=font_m.voffset,
                 fg_color=self.bar_style_pgl[0][0],
                 bg_color=self.bar_style_pgl[0][1],
-                count=self.veh_range,
-            )
-            self.set_grid_layout_table_column(
-                layout=layout,
-                targets=self.bars_pgl,
-                column=self.wcfg["display_order_position_change"],
             )
         # Driver name
         if self.wcfg["show_driver_name"]:
@@ -139,18 +135,11 @@ class Realtime(Overlay):
                 plr_fg_color=self.wcfg["font_color_player_driver_name"],
                 plr_bg_color=self.wcfg["background_color_player_driver_name"],
             )
-            self.bars_drv = self.set_rawtext(
+            self.bars_drv = self.table.add_text_column(
+                order=self.wcfg["display_order_driver"],
                 width=self.drv_width * font_m.width + bar_padx,
-                fixed_height=font_m.height,
-                offset_y=font_m.voffset,
                 fg_color=self.bar_style_drv[0][0],
                 bg_color=self.bar_style_drv[0][1],
-                count=self.veh_range,
-            )
-            self.set_grid_layout_table_column(
-                layout=layout,
-                targets=self.bars_drv,
-                column=self.wcfg["display_order_driver"],
             )
         # Vehicle name
         if self.wcfg["show_vehicle_name"]:
@@ -160,18 +149,11 @@ class Realtime(Overlay):
                 plr_fg_color=self.wcfg["font_color_player_vehicle_name"],
                 plr_bg_color=self.wcfg["background_color_player_vehicle_name"],
             )
-            self.bars_veh = self.set_rawtext(
+            self.bars_veh = self.table.add_text_column(
+                order=self.wcfg["display_order_vehicle"],
                 width=self.veh_width * font_m.width + bar_padx,
-                fixed_height=font_m.height,
-                offset_y=font_m.voffset,
                 fg_color=self.bar_style_veh[0][0],
                 bg_color=self.bar_style_veh[0][1],
-                count=self.veh_range,
-            )
-            self.set_grid_layout_table_column(
-                layout=layout,
-                targets=self.bars_veh,
-                column=self.wcfg["display_order_vehicle"],
             )
         # Brand logo
         if self.wcfg["show_brand_logo"]:
@@ -179,16 +161,10 @@ class Realtime(Overlay):
                 self.wcfg["background_color_brand_logo"],
                 self.wcfg["background_color_player_brand_logo"],
             )
-            self.bars_brd = self.set_rawimage(
+            self.bars_brd = self.table.add_image_column(
+                order=self.wcfg["display_order_brand_logo"],
                 width=self.brd_width,
-                fixed_height=font_m.height,
                 bg_color=self.bar_style_brd[0],
-                count=self.veh_range,
-            )
-            self.set_grid_layout_table_column(
-                layout=layout,
-                targets=self.bars_brd,
-                column=self.wcfg["display_order_brand_logo"],
             )
         # Time gap
         if self.wcfg["show_time_gap"]:
@@ -210,18 +186,11 @@ class Realtime(Overlay):
                 -max(self.wcfg["nearest_time_gap_threshold_behind"], 0),
                 max(self.wcfg["nearest_time_gap_threshold_front"], 0),
             )
-            self.bars_gap = self.set_rawtext(
+            self.bars_gap = self.table.add_text_column(
+                order=self.wcfg["display_order_time_gap"],
                 width=self.gap_width * font_m.width + bar_padx,
-                fixed_height=font_m.height,
-                offset_y=font_m.voffset,
                 fg_color=self.bar_style_gap[0][0],
                 bg_color=self.bar_style_gap[0][1],
-                count=self.veh_range,
-            )
-            self.set_grid_layout_table_column(
-                layout=layout,
-                targets=self.bars_gap,
-                column=self.wcfg["display_order_time_gap"],
             )
         # Vehicle laptime
         if self.wcfg["show_laptime"]:
@@ -243,18 +212,11 @@ class Realtime(Overlay):
                     self.wcfg["background_color_player_fastest_last_laptime"],
                 ),
             )
-            self.bars_lpt = self.set_rawtext(
+            self.bars_lpt = self.table.add_text_column(
+                order=self.wcfg["display_order_laptime"],
                 width=8 * font_m.width + bar_padx,
-                fixed_height=font_m.height,
-                offset_y=font_m.voffset,
                 fg_color=self.bar_style_lpt[0][0],
                 bg_color=self.bar_style_lpt[0][1],
-                count=self.veh_range,
-            )
-            self.set_grid_layout_table_column(
-                layout=layout,
-                targets=self.bars_lpt,
-                column=self.wcfg["display_order_laptime"],
             )
         # Vehicle best laptime
         if self.wcfg["show_best_laptime"]:
@@ -268,18 +230,11 @@ class Realtime(Overlay):
                     self.wcfg["background_color_player_best_laptime"],
                 ),
             )
-            self.bars_blp = self.set_rawtext(
+            self.bars_blp = self.table.add_text_column(
+                order=self.wcfg["display_order_best_laptime"],
                 width=8 * font_m.width + bar_padx,
-                fixed_height=font_m.height,
-                offset_y=font_m.voffset,
                 fg_color=self.bar_style_blp[0][0],
                 bg_color=self.bar_style_blp[0][1],
-                count=self.veh_range,
-            )
-            self.set_grid_layout_table_column(
-                layout=layout,
-                targets=self.bars_blp,
-                column=self.wcfg["display_order_best_laptime"],
             )
         # Position in class
         if self.wcfg["show_position_in_class"]:
@@ -293,33 +248,19 @@ class Realtime(Overlay):
                     self.wcfg["background_color_player_position_in_class"],
                 ),
             )
-            self.bars_pic = self.set_rawtext(
+            self.bars_pic = self.table.add_text_column(
+                order=self.wcfg["display_order_position_in_class"],
                 width=2 * font_m.width + bar_padx,
-                fixed_height=font_m.height,
-                offset_y=font_m.voffset,
                 fg_color=self.bar_style_pic[0][0],
                 bg_color=self.bar_style_pic[0][1],
-                count=self.veh_range,
-            )
-            self.set_grid_layout_table_column(
-                layout=layout,
-                targets=self.bars_pic,
-                column=self.wcfg["display_order_position_in_class"],
             )
         # Vehicle class
         if self.wcfg["show_class"]:
-            self.bars_cls = self.set_rawtext(
+            self.bars_cls = self.table.add_text_column(
+                order=self.wcfg["display_order_class"],
                 width=self.cls_width * font_m.width + bar_padx,
-                fixed_height=font_m.height,
-                offset_y=font_m.voffset,
                 fg_color=self.wcfg["font_color_class"],
                 bg_color=self.wcfg["background_color_class"],
-                count=self.veh_range,
-            )
-            self.set_grid_layout_table_column(
-                layout=layout,
-                targets=self.bars_cls,
-                column=self.wcfg["display_order_class"],
             )
         # Vehicle in pit
         if self.wcfg["show_pit_status"]:
@@ -349,18 +290,11 @@ class Realtime(Overlay):
                     self.wcfg["background_color_finish"],
                 ),
             )
-            self.bars_pit = self.set_rawtext(
+            self.bars_pit = self.table.add_text_column(
+                order=self.wcfg["display_order_pit_status"],
                 width=max(map(len, self.pit_status_text)) * font_m.width + bar_padx,
-                fixed_height=font_m.height,
-                offset_y=font_m.voffset,
                 fg_color=self.bar_style_pit[0][0],
                 bg_color=self.bar_style_pit[0][1],
-                count=self.veh_range,
-            )
-            self.set_grid_layout_table_column(
-                layout=layout,
-                targets=self.bars_pit,
-                column=self.wcfg["display_order_pit_status"],
             )
         # Tyre compound
         if self.wcfg["show_tyre_compound"]:
@@ -375,24 +309,14 @@ class Realtime(Overlay):
                     self.wcfg["background_color_player_tyre_compound"],
                 ),
             )
-            self.bars_tcp = tuple(
-                MultiCompounds(
-                    parent=self,
-                    count=self.count_tcp,
-                    spacing=max(self.wcfg["tyre_compound_spacing"], 0),
-                    padding=bar_padx,
-                    width=font_m.width,
-                    height=font_m.height,
-                    offset_y=font_m.voffset,
-                    fg_color=self.bar_style_tcp[0][0],
-                    bg_color=self.bar_style_tcp[0][1],
-                )
-                for _ in range(self.veh_range)
-            )
-            self.set_grid_layout_table_column(
-                layout=layout,
-                targets=self.bars_tcp,
-                column=self.wcfg["display_order_tyre_compound"],
+            self.bars_tcp = self.table.add_multi_text_column(
+                order=self.wcfg["display_order_tyre_compound"],
+                count=self.count_tcp,
+                width=font_m.width,
+                spacing=max(self.wcfg["tyre_compound_spacing"], 0),
+                padding=bar_padx,
+                fg_color=self.bar_style_tcp[0][0],
+                bg_color=self.bar_style_tcp[0][1],
             )
         # Pitstop count
         if self.wcfg["show_pitstop_count"]:
@@ -414,18 +338,11 @@ class Realtime(Overlay):
                     self.wcfg["background_color_penalty_count"],
                 ),
             )
-            self.bars_psc = self.set_rawtext(
+            self.bars_psc = self.table.add_text_column(
+                order=self.wcfg["display_order_pitstop_count"],
                 width=2 * font_m.width + bar_padx,
-                fixed_height=font_m.height,
-                offset_y=font_m.voffset,
                 fg_color=self.bar_style_psc[0][0],
                 bg_color=self.bar_style_psc[0][1],
-                count=self.veh_range,
-            )
-            self.set_grid_layout_table_column(
-                layout=layout,
-                targets=self.bars_psc,
-                column=self.wcfg["display_order_pitstop_count"],
             )
         # Remaining energy
         if self.wcfg["show_energy_remaining"]:
@@ -451,18 +368,11 @@ class Realtime(Overlay):
                     self.wcfg["background_color_player_energy_remaining"],
                 ),
             )
-            self.bars_nrg = self.set_rawtext(
+            self.bars_nrg = self.table.add_text_column(
+                order=self.wcfg["display_order_energy_remaining"],
                 width=self.nrg_width * font_m.width + bar_padx,
-                fixed_height=font_m.height,
-                offset_y=font_m.voffset,
                 fg_color=self.bar_style_nrg[0][0],
                 bg_color=self.bar_style_nrg[0][1],
-                count=self.veh_range,
-            )
-            self.set_grid_layout_table_column(
-                layout=layout,
-                targets=self.bars_nrg,
-                column=self.wcfg["display_order_energy_remaining"],
             )
         # Vehicle integrity
         if self.wcfg["show_vehicle_integrity"]:
@@ -484,18 +394,11 @@ class Realtime(Overlay):
                     self.wcfg["background_color_player_vehicle_integrity"],
                 ),
             )
-            self.bars_dmg = self.set_rawtext(
+            self.bars_dmg = self.table.add_text_column(
+                order=self.wcfg["display_order_vehicle_integrity"],
                 width=1 * font_m.width + bar_padx,
-                fixed_height=font_m.height,
-                offset_y=font_m.voffset,
                 fg_color=self.bar_style_dmg[0][0],
                 bg_color=self.bar_style_dmg[0][1],
-                count=self.veh_range,
-            )
-            self.set_grid_layout_table_column(
-                layout=layout,
-                targets=self.bars_dmg,
-                column=self.wcfg["display_order_vehicle_integrity"],
             )
         # Stint laps
         if self.wcfg["show_stint_laps"]:
@@ -509,18 +412,11 @@ class Realtime(Overlay):
                     self.wcfg["background_color_player_stint_laps"],
                 ),
             )
-            self.bars_stl = self.set_rawtext(
+            self.bars_stl = self.table.add_text_column(
+                order=self.wcfg["display_order_stint_laps"],
                 width=5 * font_m.width + bar_padx,
-                fixed_height=font_m.height,
-                offset_y=font_m.voffset,
                 fg_color=self.bar_style_stl[0][0],
                 bg_color=self.bar_style_stl[0][1],
-                count=self.veh_range,
-            )
-            self.set_grid_layout_table_column(
-                layout=layout,
-                targets=self.bars_stl,
-                column=self.wcfg["display_order_stint_laps"],
             )
         # Speed trap
         if self.wcfg["show_speed_trap"]:
@@ -535,22 +431,18 @@ class Realtime(Overlay):
                     self.wcfg["background_color_player_speed_trap"],
                 ),
             )
-            self.bars_spd = self.set_rawtext(
+            self.bars_spd = self.table.add_text_column(
+                order=self.wcfg["display_order_speed_trap"],
                 width=5 * font_m.width + bar_padx,
-                fixed_height=font_m.height,
-                offset_y=font_m.voffset,
                 fg_color=self.bar_style_spd[0][0],
                 bg_color=self.bar_style_spd[0][1],
-                count=self.veh_range,
-            )
-            self.set_grid_layout_table_column(
-                layout=layout,
-                targets=self.bars_spd,
-                column=self.wcfg["display_order_speed_trap"],
             )
 
     def timerEvent(self, event):
         """Update when vehicle on track"""
+        if self.is_data_unchanged(minfo.relative, minfo.vehicles):
+            return
+
         player_idx = minfo.vehicles.playerIndex
         relative_list = relative_data(
             minfo.relative.relativeAhead,
@@ -653,6 +545,8 @@ class Realtime(Overlay):
             if self.wcfg["show_speed_trap"]:
                 self.update_spd(self.bars_spd[idx], veh_info.speedTrap.speed, hi_player, state)
 
+        self.table.flush()
+
     # GUI update methods
     def update_pos(self, target, *data):
         """Driver position"""
@@ -29,7 +29,7 @@ from ..module_info import minfo
 from ..userfile.custom_image import load_brand_logo_image
 from ..userfile.heatmap import select_compound_color, select_compound_symbol
 from ._base import Overlay
-from ._painter import MultiCompounds, RawFrame
+from ._painter import TableCanvas
 
 
 class Realtime(Overlay):
@@ -38,7 +38,7 @@ class Realtime(Overlay):
     def __init__(self, config, widget_name):
         # Assign base setting
         super().__init__(config, widget_name)
-        layout = self.set_grid_layout(gap_vert=self.wcfg["bar_gap"])
+        layout = self.set_grid_layout()
         self.set_primary_layout(layout=layout)
 
         # Config font
@@ -70,8 +70,12 @@ class Realtime(Overlay):
         self.nrg_decimals = max(int(self.wcfg["decimal_places_energy_remaining"]), 0)
         self.nrg_width = 3 + self.nrg_decimals + (self.nrg_decimals > 0)
 
-        self.height_def = font_m.height
-        self.height_gap = self.wcfg["split_gap"]
+        # Row height by row state: 0 - show, 1 - draw gap, 2 - hide
+        self.row_height = (
+            font_m.height,
+            self.wcfg["split_gap"] if self.show_class_separator else 0,
+            0,
+        )
 
         # Max display players
         if self.wcfg["enable_single_class_exclusive_mode"]:
@@ -84,6 +88,17 @@ class Realtime(Overlay):
         self.pixmap_brandlogo = {}
         self.row_visible = [False] * self.veh_range
 
+        # Table canvas
+        self.table = TableCanvas(
+            self,
+            rows=self.veh_range,
+            row_height=font_m.height,
+            row_gap=self.wcfg["bar_gap"],
+            offset_y=font_m.voffset,
+            hide_start=1,
+        )
+        layout.addWidget(self.table, 0, 0)
+
         # Driver position
         if self.wcfg["show_position"]:
             self.bar_style_pos = (
@@ -96,19 +111,11 @@ class Realtime(Overlay):
                     self.wcfg["background_color_player_position"],
                 ),
             )
-            self.bars_pos = self.set_rawtext(
+            self.bars_pos = self.table.add_text_column(
+                order=self.wcfg["display_order_position"],
                 width=2 * font_m.width + bar_padx,
-                fixed_height=font_m.height,
-                offset_y=font_m.voffset,
                 fg_color=self.bar_style_pos[0][0],
                 bg_color=self.bar_style_pos[0][1],
-                count=self.veh_range,
-            )
-            self.set_grid_layout_table_column(
-                layout=layout,
-                targets=self.bars_pos,
-                column=self.wcfg["display_order_position"],
-                hide_start=1,
             )
         # Driver position change
         if self.wcfg["show_position_change"]:
@@ -130,19 +137,11 @@ class Realtime(Overlay):
                     self.wcfg["background_color_player_position_change"],
                 ),
             )
-            self.bars_pgl = self.set_rawtext(
+            self.bars_pgl = self.table.add_text_column(
+                order=self.wcfg["display_order_position_change"],
                 width=3 * font_m.width + bar_padx,
-                fixed_height=font_m.height,
-                offset_y=font_m.voffset,
                 fg_color=self.bar_style_pgl[0][0],
                 bg_color=self.bar_style_pgl[0][1],
-                count=self.veh_range,
-            )
-            self.set_grid_layout_table_column(
-                layout=layout,
-                targets=self.bars_pgl,
-                column=self.wcfg["display_order_position_change"],
-                hide_start=1,
             )
         # Driver name
         if self.wcfg["show_driver_name"]:
@@ -156,19 +155,11 @@ class Realtime(Overlay):
                     self.wcfg["background_color_player_driver_name"],
                 ),
             )
-            self.bars_drv = self.set_rawtext(
+            self.bars_drv = self.table.add_text_column(
+                order=self.wcfg["display_order_driver"],
                 width=self.drv_width * font_m.width + bar_padx,
-                fixed_height=font_m.height,
-                offset_y=font_m.voffset,
                 fg_color=self.bar_style_drv[0][0],
                 bg_color=self.bar_style_drv[0][1],
-                count=self.veh_range,
-            )
-            self.set_grid_layout_table_column(
-                layout=layout,
-                targets=self.bars_drv,
-                column=self.wcfg["display_order_driver"],
-                hide_start=1,
             )
         # Vehicle name
         if self.wcfg["show_vehicle_name"]:
@@ -182,19 +173,11 @@ class Realtime(Overlay):
                     self.wcfg["background_color_player_vehicle_name"],
                 ),
             )
-            self.bars_veh = self.set_rawtext(
+            self.bars_veh = self.table.add_text_column(
+                order=self.wcfg["display_order_vehicle"],
                 width=self.veh_width * font_m.width + bar_padx,
-                fixed_height=font_m.height,
-                offset_y=font_m.voffset,
                 fg_color=self.bar_style_veh[0][0],
                 bg_color=self.bar_style_veh[0][1],
-                count=self.veh_range,
-            )
-            self.set_grid_layout_table_column(
-                layout=layout,
-                targets=self.bars_veh,
-                column=self.wcfg["display_order_vehicle"],
-                hide_start=1,
             )
         # Brand logo
         if self.wcfg["show_brand_logo"]:
@@ -202,17 +185,10 @@ class Realtime(Overlay):
                 self.wcfg["background_color_brand_logo"],
                 self.wcfg["background_color_player_brand_logo"],
             )
-            self.bars_brd = self.set_rawimage(
+            self.bars_brd = self.table.add_image_column(
+                order=self.wcfg["display_order_brand_logo"],
                 width=self.brd_width,
-                fixed_height=font_m.height,
                 bg_color=self.bar_style_brd[0],
-                count=self.veh_range,
-            )
-            self.set_grid_layout_table_column(
-                layout=layout,
-                targets=self.bars_brd,
-                column=self.wcfg["display_order_brand_logo"],
-                hide_start=1,
             )
         # Time gap
         if self.wcfg["show_time_gap"]:
@@ -226,19 +202,11 @@ class Realtime(Overlay):
                     self.wcfg["background_color_player_time_gap"],
                 ),
             )
-            self.bars_gap = self.set_rawtext(
+            self.bars_gap = self.table.add_text_column(
+                order=self.wcfg["display_order_time_gap"],
                 width=self.gap_width * font_m.width + bar_padx,
-                fixed_height=font_m.height,
-                offset_y=font_m.voffset,
                 fg_color=self.bar_style_gap[0][0],
                 bg_color=self.bar_style_gap[0][1],
-                count=self.veh_range,
-            )
-            self.set_grid_layout_table_column(
-                layout=layout,
-                targets=self.bars_gap,
-                column=self.wcfg["display_order_time_gap"],
-                hide_start=1,
             )
         # Time interval
         if self.wcfg["show_time_interval"]:
@@ -252,19 +220,11 @@ class Realtime(Overlay):
                     self.wcfg["background_color_player_time_interval"],
                 ),
             )
-            self.bars_int = self.set_rawtext(
+            self.bars_int = self.table.add_text_column(
+                order=self.wcfg["display_order_time_interval"],
                 width=self.int_width * font_m.width + bar_padx,
-                fixed_height=font_m.height,
-                offset_y=font_m.voffset,
                 fg_color=self.bar_style_int[0][0],
                 bg_color=self.bar_style_int[0][1],
-                count=self.veh_range,
-            )
-            self.set_grid_layout_table_column(
-                layout=layout,
-                targets=self.bars_int,
-                column=self.wcfg["display_order_time_interval"],
-                hide_start=1,
             )
         # Vehicle laptime
         if self.wcfg["show_laptime"]:
@@ -286,19 +246,11 @@ class Realtime(Overlay):
                     self.wcfg["background_color_player_fastest_last_laptime"],
                 ),
             )
-            self.bars_lpt = self.set_rawtext(
+            self.bars_lpt = self.table.add_text_column(
+                order=self.wcfg["display_order_laptime"],
                 width=8 * font_m.width + bar_padx,
-                fixed_height=font_m.height,
-                offset_y=font_m.voffset,
                 fg_color=self.bar_style_lpt[0][0],
                 bg_color=self.bar_style_lpt[0][1],
-                count=self.veh_range,
-            )
-            self.set_grid_layout_table_column(
-                layout=layout,
-                targets=self.bars_lpt,
-                column=self.wcfg["display_order_laptime"],
-                hide_start=1,
             )
         # Vehicle best laptime
         if self.wcfg["show_best_laptime"]:
@@ -312,19 +264,11 @@ class Realtime(Overlay):
                     self.wcfg["background_color_player_best_laptime"],
                 ),
             )
-            self.bars_blp = self.set_rawtext(
+            self.bars_blp = self.table.add_text_column(
+                order=self.wcfg["display_order_best_laptime"],
                 width=8 * font_m.width + bar_padx,
-                fixed_height=font_m.height,
-                offset_y=font_m.voffset,
                 fg_color=self.bar_style_blp[0][0],
                 bg_color=self.bar_style_blp[0][1],
-                count=self.veh_range,
-            )
-            self.set_grid_layout_table_column(
-                layout=layout,
-                targets=self.bars_blp,
-                column=self.wcfg["display_order_best_laptime"],
-                hide_start=1,
             )
         # Delta laptime
         if self.wcfg["show_delta_laptime"]:
@@ -338,19 +282,12 @@ class Realtime(Overlay):
                 self.wcfg["background_color_delta_laptime"],
                 self.wcfg["background_color_player_delta_laptime"],
             )
-            self.bars_dlt = tuple(
-                self.set_delta_table(
-                    font_m=font_m,
-                    width=4 * font_m.width,
-                    columns=self.max_delta,
-                    bar_padx=bar_padx // 2,
-                ) for _ in range(self.veh_range)
-            )
-            self.set_grid_layout_table_column(
-                layout=layout,
-                targets=self.bars_dlt,
-                column=self.wcfg["display_order_delta_laptime"],
-                hide_start=1,
+            self.bars_dlt = self.table.add_multi_text_column(
+                order=self.wcfg["display_order_delta_laptime"],
+                count=self.max_delta,
+                width=4 * font_m.width,
+                padding=bar_padx // 2 * 2,
+                bg_color=self.bar_style_dlt[0],
             )
         # Position in class
         if self.wcfg["show_position_in_class"]:
@@ -364,35 +301,19 @@ class Realtime(Overlay):
                     self.wcfg["background_color_player_position_in_class"],
                 ),
             )
-            self.bars_pic = self.set_rawtext(
+            self.bars_pic = self.table.add_text_column(
+                order=self.wcfg["display_order_position_in_class"],
                 width=2 * font_m.width + bar_padx,
-                fixed_height=font_m.height,
-                offset_y=font_m.voffset,
                 fg_color=self.bar_style_pic[0][0],
                 bg_color=self.bar_style_pic[0][1],
-                count=self.veh_range,
-            )
-            self.set_grid_layout_table_column(
-                layout=layout,
-                targets=self.bars_pic,
-                column=self.wcfg["display_order_position_in_class"],
-                hide_start=1,
             )
         # Vehicle class
         if self.wcfg["show_class"]:
-            self.bars_cls = self.set_rawtext(
+            self.bars_cls = self.table.add_text_column(
+                order=self.wcfg["display_order_class"],
                 width=self.cls_width * font_m.width + bar_padx,
-                fixed_height=font_m.height,
-                offset_y=font_m.voffset,
                 fg_color=self.wcfg["font_color_class"],
                 bg_color=self.wcfg["background_color_class"],
-                count=self.veh_range,
-            )
-            self.set_grid_layout_table_column(
-                layout=layout,
-                targets=self.bars_cls,
-                column=self.wcfg["display_order_class"],
-                hide_start=1,
             )
         # Vehicle in pit
         if self.wcfg["show_pit_status"]:
@@ -422,19 +343,11 @@ class Realtime(Overlay):
                     self.wcfg["background_color_finish"],
                 ),
             )
-            self.bars_pit = self.set_rawtext(
+            self.bars_pit = self.table.add_text_column(
+                order=self.wcfg["display_order_pit_status"],
                 width=max(map(len, self.pit_status_text)) * font_m.width + bar_padx,
-                fixed_height=font_m.height,
-                offset_y=font_m.voffset,
                 fg_color=self.bar_style_pit[0][0],
                 bg_color=self.bar_style_pit[0][1],
-                count=self.veh_range,
-            )
-            self.set_grid_layout_table_column(
-                layout=layout,
-                targets=self.bars_pit,
-                column=self.wcfg["display_order_pit_status"],
-                hide_start=1,
             )
         # Tyre compound
         if self.wcfg["show_tyre_compound"]:
@@ -449,25 +362,14 @@ class Realtime(Overlay):
                     self.wcfg["background_color_player_tyre_compound"],
                 ),
             )
-            self.bars_tcp = tuple(
-                MultiCompounds(
-                    parent=self,
-                    count=self.count_tcp,
-                    spacing=max(self.wcfg["tyre_compound_spacing"], 0),
-                    padding=bar_padx,
-                    width=font_m.width,
-                    height=font_m.height,
-                    offset_y=font_m.voffset,
-                    fg_color=self.bar_style_tcp[0][0],
-                    bg_color=self.bar_style_tcp[0][1],
-                )
-                for _ in range(self.veh_range)
-            )
-            self.set_grid_layout_table_column(
-                layout=layout,
-                targets=self.bars_tcp,
-                column=self.wcfg["display_order_tyre_compound"],
-                hide_start=1,
+            self.bars_tcp = self.table.add_multi_text_column(
+                order=self.wcfg["display_order_tyre_compound"],
+                count=self.count_tcp,
+                width=font_m.width,
+                spacing=max(self.wcfg["tyre_compound_spacing"], 0),
+                padding=bar_padx,
+                fg_color=self.bar_style_tcp[0][0],
+                bg_color=self.bar_style_tcp[0][1],
             )
         # Pitstop count
         if self.wcfg["show_pitstop_count"]:
@@ -489,19 +391,11 @@ class Realtime(Overlay):
                     self.wcfg["background_color_penalty_count"],
                 ),
             )
-            self.bars_psc = self.set_rawtext(
+            self.bars_psc = self.table.add_text_column(
+                order=self.wcfg["display_order_pitstop_count"],
                 width=2 * font_m.width + bar_padx,
-                fixed_height=font_m.height,
-                offset_y=font_m.voffset,
                 fg_color=self.bar_style_psc[0][0],
                 bg_color=self.bar_style_psc[0][1],
-                count=self.veh_range,
-            )
-            self.set_grid_layout_table_column(
-                layout=layout,
-                targets=self.bars_psc,
-                column=self.wcfg["display_order_pitstop_count"],
-                hide_start=1,
             )
         # Remaining energy
         if self.wcfg["show_energy_remaining"]:
@@ -527,19 +421,11 @@ class Realtime(Overlay):
                     self.wcfg["background_color_player_energy_remaining"],
                 ),
             )
-            self.bars_nrg = self.set_rawtext(
+            self.bars_nrg = self.table.add_text_column(
+                order=self.wcfg["display_order_energy_remaining"],
                 width=self.nrg_width * font_m.width + bar_padx,
-                fixed_height=font_m.height,
-                offset_y=font_m.voffset,
                 fg_color=self.bar_style_nrg[0][0],
                 bg_color=self.bar_style_nrg[0][1],
-                count=self.veh_range,
-            )
-            self.set_grid_layout_table_column(
-                layout=layout,
-                targets=self.bars_nrg,
-                column=self.wcfg["display_order_energy_remaining"],
-                hide_start=1,
             )
         # Vehicle integrity
         if self.wcfg["show_vehicle_integrity"]:
@@ -561,19 +447,11 @@ class Realtime(Overlay):
                     self.wcfg["background_color_player_vehicle_integrity"],
                 ),
             )
-            self.bars_dmg = self.set_rawtext(
+            self.bars_dmg = self.table.add_text_column(
+                order=self.wcfg["display_order_vehicle_integrity"],
                 width=1 * font_m.width + bar_padx,
-                fixed_height=font_m.height,
-                offset_y=font_m.voffset,
                 fg_color=self.bar_style_dmg[0][0],
                 bg_color=self.bar_style_dmg[0][1],
-                count=self.veh_range,
-            )
-            self.set_grid_layout_table_column(
-                layout=layout,
-                targets=self.bars_dmg,
-                column=self.wcfg["display_order_vehicle_integrity"],
-                hide_start=1,
             )
         # Stint laps
         if self.wcfg["show_stint_laps"]:
@@ -587,19 +465,11 @@ class Realtime(Overlay):
                     self.wcfg["background_color_player_stint_laps"],
                 ),
             )
-            self.bars_stl = self.set_rawtext(
+            self.bars_stl = self.table.add_text_column(
+                order=self.wcfg["display_order_stint_laps"],
                 width=5 * font_m.width + bar_padx,
-                fixed_height=font_m.height,
-                offset_y=font_m.voffset,
                 fg_color=self.bar_style_stl[0][0],
                 bg_color=self.bar_style_stl[0][1],
-                count=self.veh_range,
-            )
-            self.set_grid_layout_table_column(
-                layout=layout,
-                targets=self.bars_stl,
-                column=self.wcfg["display_order_stint_laps"],
-                hide_start=1,
             )
         # Speed trap
         if self.wcfg["show_speed_trap"]:
@@ -614,23 +484,18 @@ class Realtime(Overlay):
                     self.wcfg["background_color_player_speed_trap"],
                 ),
             )
-            self.bars_spd = self.set_rawtext(
+            self.bars_spd = self.table.add_text_column(
+                order=self.wcfg["display_order_speed_trap"],
                 width=5 * font_m.width + bar_padx,
-                fixed_height=font_m.height,
-                offset_y=font_m.voffset,
                 fg_color=self.bar_style_spd[0][0],
                 bg_color=self.bar_style_spd[0][1],
-                count=self.veh_range,
-            )
-            self.set_grid_layout_table_column(
-                layout=layout,
-                targets=self.bars_spd,
-                column=self.wcfg["display_order_speed_trap"],
-                hide_start=1,
             )
 
     def timerEvent(self, event):
         """Update when vehicle on track"""
+        if self.is_data_unchanged(minfo.relative, minfo.vehicles):
+            return
+
         standings_list = minfo.relative.standings
         total_std_idx = len(standings_list) - 1  # skip final -1 index
         player_idx = minfo.vehicles.playerIndex
@@ -654,6 +519,7 @@ class Realtime(Overlay):
             else:
                 self.row_visible[idx] = False
                 state = 2
+            self.table.set_row_height(idx, self.row_height[state])
 
             # Get vehicle dataset
             veh_info = minfo.vehicles.dataSet[std_idx]
@@ -757,6 +623,8 @@ class Realtime(Overlay):
             if self.wcfg["show_speed_trap"]:
                 self.update_spd(self.bars_spd[idx], veh_info.speedTrap.speed, hi_player, state)
 
+        self.table.flush()
+
     # GUI update methods
     def update_pos(self, target, *data):
         """Driver position"""
@@ -868,27 +736,34 @@ class Realtime(Overlay):
         if target.last != data:
             target.last = data
             is_player = data[1]
-            draw_gap = (data[-1] == 1 and self.show_class_separator)
-            for bar_delta, delta in zip(target.bar_set, data[0]):
-                if draw_gap:
-                    bar_delta.clear()
-                    continue
-                if -999 < delta < 0:  # player time gain
-                    text = f"{-delta:.1f}"[:3].strip(".")
-                    color_index = 1
-                elif 0 < delta < 999:  # player time loss
-                    text = f"{delta:.1f}"[:3].strip(".")
-                    color_index = 2
-                elif delta == 0:
-                    text = "0.0"
-                    color_index = 0
-                else:
-                    text = "-.-"
-                    color_index = 0
-                if is_player:
-                    color_index = -1
-                bar_delta.text = text
-                bar_delta.fg = self.bar_style_dlt_delta[color_index]
+            if data[-1] == 1 and self.show_class_separator:  # draw gap
+                texts = ("",) * self.max_delta
+                colors = (self.bar_style_dlt_delta[0],) * self.max_delta
+            else:
+                texts = []
+                colors = []
+                for delta in data[0]:
+                    if -999 < delta < 0:  # player time gain
+                        text = f"{-delta:.1f}"[:3].strip(".")
+                        color_index = 1
+                    elif 0 < delta < 999:  # player time loss
+                        text = f"{delta:.1f}"[:3].strip(".")
+                        color_index = 2
+                    elif delta == 0:
+                        text = "0.0"
+                        color_index = 0
+                    else:
+                        text = "-.-"
+                        color_index = 0
+                    if is_player:
+                        color_index = -1
+                    texts.append(text)
+                    colors.append(self.bar_style_dlt_delta[color_index])
+                if self.wcfg["show_inverted_delta_laptime_layout"]:
+                    texts.reverse()
+                    colors.reverse()
+            target.compounds = tuple(texts)
+            target.colors = tuple(colors)
             target.bg = self.bar_style_dlt[is_player]
             self.toggle_visibility(target, data[-1])
 
@@ -1054,18 +929,10 @@ class Realtime(Overlay):
 
     # Additional methods
     def toggle_visibility(self, target, state):
-        """Hide bar if unavailable"""
-        target.update()
-        if target.state == state:
-            return
-        target.state = state
-        if state == 1 and self.show_class_separator:  # draw gap
+        """Clear bar if drawing class separator gap, row height is set by table"""
+        if state == 1:
             target.clear()
-            target.setFixedHeight(self.height_gap)
-            target.show()
-        else:
-            target.setHidden(state)
-            target.setFixedHeight(self.height_def)
+        target.update()
 
     def set_brand_logo(self, brand_name: str):
         """Set brand logo"""
@@ -1125,22 +992,3 @@ class Realtime(Overlay):
         if isinstance(gap_behind, int):
             return f"{gap_behind:.0f}L"
         return f"{gap_behind:.{self.int_decimals}f}"
-
-    def set_delta_table(self, font_m, width: int, columns: int, bar_padx: int) -> RawFrame:
-        """Set delta laptime table"""
-        layout = self.set_grid_layout()
-        layout.setContentsMargins(bar_padx, 0, bar_padx, 0)
-        bar_temp = RawFrame(self, bg_color=self.bar_style_dlt[0])
-        bar_temp.setLayout(layout)
-        bar_temp.bar_set = self.set_rawtext(
-            fixed_width=width,
-            fixed_height=font_m.height,
-            offset_y=font_m.voffset,
-            count=columns,
-        )
-        self.set_grid_layout_table_row(
-            layout=layout,
-            targets=bar_temp.bar_set,
-            right_to_left=self.wcfg["show_inverted_delta_laptime_layout"],
-        )
-        return bar_temp
@@ -317,6 +317,9 @@ class Realtime(Overlay):
 
     def timerEvent(self, event):
         """Update when vehicle on track"""
+        if self.is_data_unchanged(minfo.history, minfo.energy):
+            return
+
         energy_type = self.wcfg["show_virtual_energy_if_available"] and minfo.energy.available
         stint_data = minfo.history.stintData
 
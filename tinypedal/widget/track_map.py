@@ -20,6 +20,8 @@
 Track map Widget
 """
 
+from typing import Sequence
+
 from PySide2.QtCore import QRectF, Qt
 from PySide2.QtGui import QBrush, QPainter, QPainterPath, QPen, QPixmap
 
@@ -29,6 +31,7 @@ from ..formatter import random_color_class
 from ..module_info import minfo
 from ..validator import vehicle_position_interp
 from ._base import Overlay
+from ._painter import SpriteAtlas
 
 
 class Realtime(Overlay):
@@ -97,6 +100,18 @@ class Realtime(Overlay):
         self.veh_shape_safetycar = QRectF(-veh_size_sc * 0.5, -veh_size_sc * 0.5, veh_size_sc, veh_size_sc)
         self.veh_text_shape = QRectF(-veh_size_base * 0.5, -veh_size_base * 0.5 + font_m.voffset, veh_size_base, veh_size_base)
 
+        # Vehicle sprite atlas, cell size covers largest vehicle shape & outline
+        veh_outline_max = max(
+            self.wcfg["vehicle_outline_width"],
+            self.wcfg["vehicle_outline_width_player"],
+            self.wcfg["vehicle_outline_width_laps_ahead"],
+            self.wcfg["vehicle_outline_width_laps_behind"],
+            0,
+        )
+        self.veh_atlas = SpriteAtlas(
+            max(veh_size_opt, veh_size_plr, veh_size_base) + veh_outline_max * 2 + 2
+        )
+
         if self.wcfg["show_pitout_prediction"]:
             self.show_while_requested = self.wcfg["show_pitout_prediction_while_requested_pitstop"]
             self.prediction_count = min(max(self.wcfg["number_of_prediction"], 1), 20)
@@ -104,6 +119,14 @@ class Realtime(Overlay):
             self.min_pit_time = self.wcfg["pitout_duration_minimum"] + self.pitout_time_offset
             self.pit_time_increment = max(self.wcfg["pitout_duration_increment"], 1)
             self.auto_pit_time = -1
+            # Trace cursors for pit in, current, pit out position, and each prediction
+            self.pitin_cursor = calc.TraceCursor()
+            self.position_cursor = calc.TraceCursor()
+            self.pitout_cursor = calc.TraceCursor()
+            self.prediction_cursors = tuple(
+                (calc.TraceCursor(), calc.TraceCursor())
+                for _ in range(self.prediction_count + 1)  # plus auto prediction
+            )
             if self.wcfg["enable_fixed_pitout_prediction"]:
                 self.fixed_pit_times = tuple(sorted(set(self.set_fixed_pit_time())))
             self.pit_text_shape = QRectF(
@@ -159,6 +182,9 @@ class Realtime(Overlay):
         painter = QPainter(self)
         painter.drawPixmap(0, 0, self.pixmap_map)
         painter.setRenderHint(QPainter.Antialiasing, True)
+        pixel_ratio = self.devicePixelRatioF()
+        if self.veh_atlas.ratio != pixel_ratio:
+            self.veh_atlas.clear(pixel_ratio)
 
         if self.map_scaled:
             self.draw_vehicle_on_map(
@@ -312,28 +338,7 @@ class Realtime(Overlay):
                 self.temp_map_size / -2 + inpit_offset,  # x pos
                 0,  # y pos
             )
-            painter.translate(offset + pos_x, offset + pos_y)
-
-            painter.setPen(self.outline_vehicle(data))
-            painter.setBrush(self.color_vehicle(data))
-
-            if data.isPlayer:
-                painter.drawEllipse(self.veh_shape_player)
-            else:
-                painter.drawEllipse(self.veh_shape)
-
-            # Draw text standings
-            if self.wcfg["show_vehicle_class_standings"]:
-                if self.show_position_in_class:
-                    place_veh = data.positionInClass
-                else:
-                    place_veh = data.positionOverall
-                if data.isPlayer:
-                    painter.setPen(self.pen_text["player"])
-                else:
-                    painter.setPen(self.pen_text["opponent"])
-                painter.drawText(self.veh_text_shape, Qt.AlignCenter, f"{place_veh}")
-            painter.resetTransform()
+            self.draw_vehicle(painter, data, offset + pos_x, offset + pos_y)
 
     def draw_vehicle_on_map(self, painter, veh_info, veh_draw_order):
         """Draw vehicles on track map"""
@@ -351,32 +356,50 @@ class Realtime(Overlay):
             else:
                 pos_x = data.worldPositionX * self.map_scale - x_offset
                 pos_y = data.worldPositionY * self.map_scale - y_offset
-            painter.translate(pos_x, pos_y)
-
-            painter.setPen(self.outline_vehicle(data))
-            painter.setBrush(self.color_vehicle(data))
-
-            if data.isPlayer:
-                painter.drawEllipse(self.veh_shape_player)
-                if self.wcfg["show_proximity_circle"]:
-                    painter.setPen(self.pen_outline["proximity"])
-                    painter.setBrush(Qt.NoBrush)
-                    painter.drawEllipse(self.rect_proximity)
+            self.draw_vehicle(painter, data, pos_x, pos_y)
+
+            if data.isPlayer and self.wcfg["show_proximity_circle"]:
+                painter.translate(pos_x, pos_y)
+                painter.setPen(self.pen_outline["proximity"])
+                painter.setBrush(Qt.NoBrush)
+                painter.drawEllipse(self.rect_proximity)
+                painter.resetTransform()
+
+    def draw_vehicle(self, painter, data, pos_x, pos_y):
+        """Draw vehicle sprite from atlas, render sprite once per style & standings"""
+        pen = self.outline_vehicle(data)
+        brush = self.color_vehicle(data)
+        # Draw text standings
+        if self.wcfg["show_vehicle_class_standings"]:
+            if self.show_position_in_class:
+                text_place = f"{data.positionInClass}"
             else:
-                painter.drawEllipse(self.veh_shape)
-
-            # Draw text standings
-            if self.wcfg["show_vehicle_class_standings"]:
-                if self.show_position_in_class:
-                    place_veh = data.positionInClass
-                else:
-                    place_veh = data.positionOverall
-                if data.isPlayer:
-                    painter.setPen(self.pen_text["player"])
-                else:
-                    painter.setPen(self.pen_text["opponent"])
-                painter.drawText(self.veh_text_shape, Qt.AlignCenter, f"{place_veh}")
-            painter.resetTransform()
+                text_place = f"{data.positionOverall}"
+        else:
+            text_place = ""
+        # Pen & brush are cached for widget lifetime, so object id is stable
+        sprite_key = (id(pen), id(brush), data.isPlayer, text_place)
+        source = self.veh_atlas.sprite(sprite_key)
+        if source is None:
+            source = self.veh_atlas.add(
+                sprite_key, self.render_vehicle_sprite, pen, brush, data.isPlayer, text_place)
+        self.veh_atlas.draw(painter, pos_x, pos_y, source)
+
+    def render_vehicle_sprite(self, painter, pen, brush, is_player, text_place):
+        """Render vehicle sprite"""
+        painter.setPen(pen)
+        painter.setBrush(brush)
+        if is_player:
+            painter.drawEllipse(self.veh_shape_player)
+        else:
+            painter.drawEllipse(self.veh_shape)
+        if text_place:
+            painter.setFont(self.font())
+            if is_player:
+                painter.setPen(self.pen_text["player"])
+            else:
+                painter.setPen(self.pen_text["opponent"])
+            painter.drawText(self.veh_text_shape, Qt.AlignCenter, text_place)
 
     def draw_safetycar_on_map(self, painter, map_data):
         """Draw safety car on map"""
@@ -429,11 +452,11 @@ class Realtime(Overlay):
         dist_data = minfo.mapping.elevations
         if not dist_data:  # distance, z coords
             return
-        deltabest_data = minfo.delta.deltaBestData  # distance, seconds
-        deltabest_max_index = len(deltabest_data) - 1
+        deltabest_data = minfo.delta.deltaBestData  # flat trace, distance, seconds
+        deltabest_max_index = len(deltabest_data) // 2 - 1
         if deltabest_max_index < 2:
             return
-        laptime_best = deltabest_data[-1][1]
+        laptime_best = deltabest_data[-1]
         laptime_pace = minfo.delta.lapTimePace
         if laptime_best < 1 or laptime_pace < 1:
             return
@@ -443,8 +466,8 @@ class Realtime(Overlay):
 
         # Calculate pit timer & target time
         if plr_veh_info.pitRequested and not plr_veh_info.inPit:  # out pit lane
-            pitin_time = target_node_time(minfo.mapping.pitEntryPosition, deltabest_data, deltabest_max_index, laptime_scale)
-            pos_curr_time = target_node_time(api.read.lap.distance(), deltabest_data, deltabest_max_index, laptime_scale)
+            pitin_time = target_node_time(minfo.mapping.pitEntryPosition, deltabest_data, deltabest_max_index, laptime_scale, self.pitin_cursor)
+            pos_curr_time = target_node_time(api.read.lap.distance(), deltabest_data, deltabest_max_index, laptime_scale, self.position_cursor)
             pit_timer = pos_curr_time - pitin_time
             target_pit_time = self.min_pit_time
         else:  # in pit lane
@@ -452,31 +475,35 @@ class Realtime(Overlay):
             target_pit_time = target_pitstop_duration(pit_timer, self.min_pit_time, self.pit_time_increment)
 
         # Find time_into from deltabest_data, scale to match laptime_pace
-        pitout_time = target_node_time(minfo.mapping.pitExitPosition, deltabest_data, deltabest_max_index, laptime_scale)
+        pitout_time = target_node_time(minfo.mapping.pitExitPosition, deltabest_data, deltabest_max_index, laptime_scale, self.pitout_cursor)
         pitout_time_extend = pit_timer + pitout_time
 
         painter.setBrush(Qt.NoBrush)
 
-        for target_pit_time, auto_prediction in self.get_target_pit_time(target_pit_time, pit_timer, plr_veh_info.inPit):
+        for (time_cursor, node_cursor), (target_pit_time, auto_prediction) in zip(
+            self.prediction_cursors,
+            self.get_target_pit_time(target_pit_time, pit_timer, plr_veh_info.inPit),
+        ):
             # Calc estimated pitout_time_into based on laptime_pace
             offset_time_into = pitout_time_extend - target_pit_time
             pitout_time_into = (offset_time_into - offset_time_into // laptime_pace * laptime_pace) * laptime_scale
             # Find estimated distance from deltabest_data
-            index_higher = calc.binary_search_higher_column(
-                deltabest_data, pitout_time_into, 0, deltabest_max_index, 1)
+            index_higher = time_cursor.search_higher_flat(
+                deltabest_data, pitout_time_into, deltabest_max_index, 1, 2)
             if index_higher > 0:
-                index_lower = index_higher - 1
+                offset_higher = index_higher * 2
+                offset_lower = offset_higher - 2
                 estimate_dist = calc.linear_interp(
                     pitout_time_into,
-                    deltabest_data[index_lower][1],
-                    deltabest_data[index_lower][0],
-                    deltabest_data[index_higher][1],
-                    deltabest_data[index_higher][0],
+                    deltabest_data[offset_lower + 1],
+                    deltabest_data[offset_lower],
+                    deltabest_data[offset_higher + 1],
+                    deltabest_data[offset_higher],
                 )
             else:
                 estimate_dist = 0
 
-            dist_node_index = calc.binary_search_higher_column(dist_data, estimate_dist, 0, dist_end_index)
+            dist_node_index = node_cursor.search_higher(dist_data, estimate_dist, dist_end_index)
             painter.translate(*map_data[dist_node_index])
             painter.setPen(self.pen_outline["auto_prediction" if auto_prediction else "prediction"])
             painter.drawEllipse(self.veh_shape)
@@ -603,7 +630,9 @@ def target_pitstop_duration(pit_timer: float, min_pit_time: float, pit_time_incr
     return min_pit_time + pit_time_increment * overflow_increments
 
 
-def target_node_time(position: float, delta_data: tuple, max_index: int, laptime_scale: float) -> float:
-    """Calculate target node time from target position and deltabest dataset"""
-    pitin_node_index = calc.binary_search_higher_column(delta_data, position, 0, max_index, 0)
-    return delta_data[pitin_node_index][1] / laptime_scale
+def target_node_time(
+    position: float, delta_data: Sequence[float], max_index: int, laptime_scale: float,
+    cursor: calc.TraceCursor) -> float:
+    """Calculate target node time from target position and flat deltabest dataset"""
+    pitin_node_index = cursor.search_higher_flat(delta_data, position, max_index, 0, 2)
+    return delta_data[pitin_node_index * 2 + 1] / laptime_scale
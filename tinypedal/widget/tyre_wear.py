@@ -275,6 +275,9 @@ class Realtime(Overlay):
 
     def timerEvent(self, event):
         """Update when vehicle on track"""
+        if self.is_data_unchanged(minfo.wheels, minfo.delta, minfo.fuel, minfo.energy):
+            return
+
         laptime_pace = minfo.delta.lapTimePace
         if minfo.energy.available:
             est_runlaps = min(minfo.fuel.estimatedLaps, minfo.energy.estimatedLaps)
@@ -394,7 +394,13 @@ class Realtime(Overlay):
     def timerEvent(self, event):
         """Update when vehicle on track"""
         is_low_energy = minfo.energy.estimatedLaps <= self.wcfg["low_energy_lap_threshold"]
-        if self.wcfg["show_low_energy_warning_flash"] and minfo.energy.estimatedValidConsumption:
+        is_flash_enabled = (
+            self.wcfg["show_low_energy_warning_flash"] and minfo.energy.estimatedValidConsumption)
+        # Skip if data unchanged, except while warning flash (state changes over time)
+        if self.is_data_unchanged(minfo.energy, minfo.hybrid) and not (is_flash_enabled and is_low_energy):
+            return
+
+        if is_flash_enabled:
             is_low_energy = self.warn_flash.send(is_low_energy)
             if is_low_energy:
                 padding = 0.00000001  # add padding for switching state